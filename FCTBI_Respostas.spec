@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('fctbi.ico', '.'), ('BLMelody-Regular.otf', '.'), ('special_effects.py', '.')],
-    hiddenimports=['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'PyQt5.sip', 'typing_extensions', 'json', 'pathlib', 'datetime', 'shutil', 'sys', 'os', 'dataclasses', 'typing'],
+    hiddenimports=['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'PyQt5.QtNetwork', 'ipc_client', 'PyQt5.sip', 'typing_extensions', 'json', 'pathlib', 'datetime', 'shutil', 'sys', 'os', 'dataclasses', 'typing'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,75 @@
+"""
+Utilitários compartilhados pelos benchmarks do FCTBI
+
+Os benchmarks rodam com a plataforma Qt "offscreen" e usam um diretório de
+dados temporário, sem tocar nos dados reais em Documents/FCTBI_data.
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def use_temp_data_dir() -> Path:
+    """Aponta a configuração global do app para um diretório temporário"""
+    from main import CONFIG
+
+    data_dir = Path(tempfile.mkdtemp(prefix="fctbi_bench_"))
+    CONFIG.APP_DATA_DIR = data_dir
+    CONFIG.__post_init__()
+    return data_dir
+
+
+def create_window(sections: Dict[str, int], text: str = "{name} resposta {i}"):
+    """
+    Cria a janela principal com seções sintéticas
+
+    Args:
+        sections: {nome da seção: número de respostas}
+        text: Modelo do texto de cada resposta (campos {name} e {i})
+
+    Returns:
+        Tupla (QApplication, RespostaRapidaApp)
+    """
+    import json
+    from PyQt5.QtWidgets import QApplication
+    from main import CONFIG, RespostaRapidaApp
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    use_temp_data_dir()
+    data = {
+        name: [{"texto": text.format(name=name, i=i), "data": "2024-01-01T00:00:00"}
+               for i in range(count)]
+        for name, count in sections.items()
+    }
+    with open(CONFIG.DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    with open(CONFIG.CONFIG_FILE, "w", encoding="utf-8") as f:
+        json.dump({"show_copy_confirmation": False, "prebuild_sections": False}, f)
+    window = RespostaRapidaApp()
+    return app, window
+
+
+def measure(func: Callable[[], None], repeat: int) -> List[float]:
+    """Executa `func` `repeat` vezes e retorna as durações em ms"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    """Imprime média, mediana e p95 das amostras (ms)"""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<40} média {statistics.mean(samples):8.3f} ms | "
+          f"mediana {statistics.median(samples):8.3f} ms | p95 {p95:8.3f} ms")
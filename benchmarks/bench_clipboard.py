@@ -0,0 +1,65 @@
+"""
+Benchmark da cópia de respostas ricas para a área de transferência
+
+Compara, por cópia: texto simples (setText), resposta Markdown com
+LazyMimeData (conversões sob demanda) e a mesma resposta convertida para
+texto, HTML e Markdown antes de copiar. Também mede a primeira colagem em
+HTML, que é quando a LazyMimeData faz a conversão.
+
+Uso:
+    python benchmarks/bench_clipboard.py [--paragraphs 20] [--repeat 200]
+"""
+
+import argparse
+
+from _support import measure, report
+
+from PyQt5.QtCore import QMimeData
+from PyQt5.QtGui import QTextDocument
+from PyQt5.QtWidgets import QApplication
+
+from fctbi_core import FORMAT_MARKDOWN, FORMAT_TEXT
+from main import set_clipboard_content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paragraphs", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    clipboard = QApplication.clipboard()
+    paragraph = ("Olá **cliente**, seu pedido foi *enviado*. Acompanhe em "
+                 "[rastreio](https://example.com) ou responda esta mensagem.\n\n")
+    source = "# Atualização do pedido\n\n" + paragraph * args.paragraphs
+    print(f"Resposta Markdown com {len(source)} caracteres")
+
+    def copy_plain():
+        set_clipboard_content(source, FORMAT_TEXT)
+
+    def copy_lazy():
+        set_clipboard_content(source, FORMAT_MARKDOWN)
+
+    def copy_eager():
+        document = QTextDocument()
+        document.setMarkdown(source)
+        mime = QMimeData()
+        mime.setText(document.toPlainText())
+        mime.setHtml(document.toHtml())
+        mime.setData("text/markdown", source.encode("utf-8"))
+        clipboard.setMimeData(mime)
+
+    def copy_lazy_and_paste_html():
+        copy_lazy()
+        clipboard.mimeData().html()
+
+    report("texto simples (setText)", measure(copy_plain, args.repeat))
+    report("rica, LazyMimeData", measure(copy_lazy, args.repeat))
+    report("rica, convertida ao copiar", measure(copy_eager, args.repeat))
+    report("rica, LazyMimeData + colar HTML", measure(copy_lazy_and_paste_html, args.repeat))
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Micro-benchmark do cálculo da posição de drop durante o drag
+
+Compara a busca binária sobre a geometria cacheada (atual) com a varredura
+linear que lia geometry() de cada linha a cada dragMoveEvent, além do custo
+de gerar a imagem do drag (primeira vez e reaproveitada).
+
+Uso:
+    python benchmarks/bench_drag.py [--rows 2000] [--repeat 500]
+"""
+
+import argparse
+import itertools
+
+from PyQt5.QtCore import QPoint
+
+from _support import create_window, measure, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    app, window = create_window({"Geral": args.rows})
+    window.show()
+    app.processEvents()
+    rows = window.response_widgets
+    height = window.responses_widget.height()
+    positions = itertools.cycle(
+        QPoint(10, y) for y in range(0, height, max(1, height // args.repeat)))
+
+    def linear_scan():
+        # Reproduz o caminho antigo: geometry() de cada linha a cada movimento
+        pos = next(positions)
+        for i, widget in enumerate(window.response_widgets):
+            rect = widget.geometry()
+            if pos.y() < rect.y() + rect.height() // 2:
+                return i
+        return len(rows)
+
+    def cached_bisect():
+        window.calculate_drop_position(next(positions))
+
+    window.start_drag_operation()
+    print(f"Seção com {len(rows)} respostas, {args.repeat} movimentos")
+    report("bisect + geometria cacheada (atual)", measure(cached_bisect, args.repeat))
+    report("varredura linear (anterior)", measure(linear_scan, args.repeat))
+    window.end_drag_operation()
+
+    from main import drag_pixmap
+    row = rows[0]
+    report("imagem do drag (primeira)", measure(
+        lambda: (setattr(row, "_drag_pixmap_cache", None),
+                 drag_pixmap(row, row.response_data["texto"])), 50))
+    report("imagem do drag (reaproveitada)", measure(
+        lambda: drag_pixmap(row, row.response_data["texto"]), 50))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do tempo de importação do núcleo e do app
+
+Cada amostra é um interpretador novo, medindo só o `import` (sem o custo de
+iniciar o Python). O núcleo (fctbi_core) deve ficar abaixo de 50 ms.
+
+Uso:
+    python benchmarks/bench_import.py [--repeat 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from _support import report
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_MS = 50.0
+
+CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000, 'PyQt5' in sys.modules)
+"""
+
+
+def import_time(module: str):
+    """Importa `module` em um processo novo; retorna (ms, PyQt5 carregado)"""
+    output = subprocess.check_output([sys.executable, "-c", CODE.format(module=module)],
+                                     cwd=ROOT, env=dict(os.environ), text=True)
+    elapsed, qt_loaded = output.split()
+    return float(elapsed), qt_loaded == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    medians = {}
+    for module in ("fctbi_core", "ipc_client", "main"):
+        samples = []
+        for _ in range(args.repeat):
+            elapsed, qt_loaded = import_time(module)
+            samples.append(elapsed)
+        report(f"import {module}{' (carrega PyQt5)' if qt_loaded else ''}", samples)
+        medians[module] = statistics.median(samples)
+
+    median = medians["fctbi_core"]
+    print(f"fctbi_core: mediana {median:.1f} ms "
+          f"({'dentro' if median < BUDGET_MS else 'ACIMA'} do limite de {BUDGET_MS:.0f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark do redimensionamento de listas com respostas longas
+
+Compara a prévia pintada com altura limitada (ResponseButton atual) com o
+QPushButton comum que recebia o texto completo, em áreas de rolagem idênticas
+com a folha de estilos do app. Também mostra a altura das linhas e a largura
+mínima que cada variante impõe à janela.
+
+Uso:
+    python benchmarks/bench_long_text.py [--rows 300] [--repeat 60]
+"""
+
+import argparse
+
+from _support import measure, report
+
+LONG_TEXT = "\n".join(
+    f"Parágrafo {p}: " + "texto de exemplo bastante comprido " * 12 for p in range(8))
+
+
+def build_list(button_class, rows: int):
+    """Cria uma área de rolagem com `rows` botões de resposta longa"""
+    from PyQt5.QtWidgets import QScrollArea, QSizePolicy, QVBoxLayout, QWidget
+    from main import get_theme_stylesheet
+
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    area.setStyleSheet(get_theme_stylesheet("light"))
+    content = QWidget()
+    layout = QVBoxLayout(content)
+    for i in range(rows):
+        button = button_class(f"{i} {LONG_TEXT}")
+        button.setObjectName("responseButton")
+        button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        layout.addWidget(button)
+    area.setWidget(content)
+    area.resize(480, 720)
+    area.show()
+    return area, button
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=60)
+    args = parser.parse_args()
+
+    from PyQt5.QtWidgets import QApplication, QPushButton
+    from main import ResponseButton
+
+    app = QApplication.instance() or QApplication([])
+    print(f"{args.rows} respostas de {len(LONG_TEXT)} caracteres, {args.repeat} redimensionamentos")
+    for label, button_class in (("prévia com altura limitada (atual)", ResponseButton),
+                                ("QPushButton com texto completo (anterior)", QPushButton)):
+        area, button = build_list(button_class, args.rows)
+        app.processEvents()
+        widths = iter([480 + (i % 2) * 80 for i in range(args.repeat)])
+
+        def step():
+            area.resize(next(widths), area.height())
+            app.processEvents()
+
+        report(label, measure(step, args.repeat))
+        print(f"{'':<40} linha {button.height()} px | largura mínima "
+              f"{area.widget().minimumSizeHint().width()} px")
+        area.close()
+
+
+if __name__ == "__main__":
+    main()
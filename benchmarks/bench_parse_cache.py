@@ -0,0 +1,81 @@
+"""
+Benchmark da leitura a frio de uma biblioteca grande, com e sem cache
+
+Gera uma biblioteca de ~20 MB (respostas.json) e mede, em um interpretador
+novo a cada amostra, o tempo de DataManager(...): interpretando o JSON (cache
+apagado antes) e lendo o cache binário válido.
+
+Uso:
+    python benchmarks/bench_parse_cache.py [--size-mb 20] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _support import report
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CODE = """
+import time
+start = time.perf_counter()
+from fctbi_core import DataManager, wait_for_cache_writes
+import_done = time.perf_counter()
+DataManager({data_file!r})
+print((time.perf_counter() - import_done) * 1000)
+wait_for_cache_writes()
+"""
+
+
+def build_library(path: Path, size_mb: float) -> None:
+    """Grava seções sintéticas até atingir `size_mb`"""
+    rng = random.Random(0)
+    words = "cliente pedido prazo entrega nota fiscal boleto suporte acesso senha".split()
+    data, size, section = {}, 0, 0
+    while size < size_mb * 1_000_000:
+        responses = []
+        for i in range(1000):
+            text = f"Resposta {section}-{i}: " + " ".join(rng.choices(words, k=rng.randint(5, 60)))
+            responses.append({"texto": text, "data": "2024-01-01T00:00:00"})
+            size += len(text) + 80  # Aproximação do JSON indentado
+        data[f"Seção {section}"] = responses
+        section += 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def load_time(data_file: Path) -> float:
+    output = subprocess.check_output(
+        [sys.executable, "-c", CODE.format(data_file=str(data_file))], cwd=ROOT, text=True)
+    return float(output.split()[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data_file = Path(tempfile.mkdtemp(prefix="fctbi_bench_")) / "respostas.json"
+    build_library(data_file, args.size_mb)
+    cache_file = Path(str(data_file) + ".cache")
+    print(f"Biblioteca de {data_file.stat().st_size / 1e6:.1f} MB, {args.repeat} leituras cada")
+
+    samples = []
+    for _ in range(args.repeat):
+        cache_file.unlink(missing_ok=True)
+        samples.append(load_time(data_file))
+    report("sem cache (interpreta o JSON)", samples)
+
+    load_time(data_file)  # Garante o cache válido
+    print(f"Cache binário: {cache_file.stat().st_size / 1e6:.1f} MB")
+    report("com cache válido", [load_time(data_file) for _ in range(args.repeat)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark do tempo de quadro do efeito de partículas
+
+Compara o motor atual (passo único + sprites em cache), com NumPy e com o
+fallback em Python puro, ao caminho anterior: um objeto por partícula e um
+QPainterPath com quatro curvas montado e preenchido a cada quadro.
+
+Uso:
+    python benchmarks/bench_particles.py [--particles 50] [--frames 300]
+"""
+
+import argparse
+import random
+
+from _support import measure, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--particles", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QColor, QImage, QPainter, QPainterPath
+    from PyQt5.QtWidgets import QApplication
+    import special_effects
+
+    app = QApplication.instance() or QApplication([])
+    width, height = 800, 600
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    background = QColor(22, 12, 41, 220)
+
+    def frame(draw):
+        def run():
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            painter.fillRect(image.rect(), background)
+            draw(painter)
+            painter.end()
+        return run
+
+    def engine(use_numpy):
+        particles = special_effects.ParticleSystem(args.particles, width, height, use_numpy)
+
+        def draw(painter):
+            particles.step()
+            particles.draw(painter)
+        return draw
+
+    # Caminho anterior: uma lista de partículas com QPainterPath por quadro
+    old = [[random.randint(0, width), random.randint(-height, 0), random.randint(10, 30),
+            random.uniform(1.0, 3.0), random.uniform(-0.5, 0.5),
+            QColor(random.randint(200, 255), 105, 180, random.randint(100, 200))]
+           for _ in range(args.particles)]
+
+    def draw_old(painter):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        for p in old:
+            p[1] += p[3]
+            p[0] += p[4]
+            if p[1] > height:
+                p[1] = random.randint(-height, 0)
+            x, y, s = p[0], p[1], p[2]
+            path = QPainterPath()
+            path.moveTo(x, y + s * 0.25)
+            path.cubicTo(x, y, x - s * 0.5, y, x - s * 0.5, y + s * 0.25)
+            path.cubicTo(x - s * 0.5, y + s * 0.60, x, y + s * 0.80, x, y + s)
+            path.cubicTo(x, y + s * 0.80, x + s * 0.5, y + s * 0.60, x + s * 0.5, y + s * 0.25)
+            path.cubicTo(x + s * 0.5, y, x, y, x, y + s * 0.25)
+            painter.setBrush(p[5])
+            painter.drawPath(path)
+
+    print(f"{args.particles} partículas em {width}x{height}, {args.frames} quadros")
+    if special_effects.np is not None:
+        report("sprites + NumPy (atual)", measure(frame(engine(True)), args.frames))
+    else:
+        print("NumPy não instalado: pip install .[effects]")
+    report("sprites + Python puro (fallback)", measure(frame(engine(False)), args.frames))
+    report("QPainterPath por partícula (anterior)", measure(frame(draw_old), args.frames))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark da paleta de busca rápida
+
+Mede a abertura da paleta já montada (popup + pintura) contra a abertura
+da janela principal (show_window), e o tempo de cada tecla digitada em uma
+biblioteca grande, com o índice pronto.
+
+Uso:
+    python benchmarks/bench_quick_launcher.py [--sections 20] [--rows 1000] [--repeat 50]
+"""
+
+import argparse
+
+from _support import create_window, measure, report
+
+QUERY = "resposta 12"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app, window = create_window({f"Seção {n}": args.rows for n in range(args.sections)})
+    window.animations_enabled = False
+    launcher = window.ensure_quick_launcher()
+    app.processEvents()
+
+    def open_launcher():
+        launcher.popup()
+        app.processEvents()
+        launcher.hide()
+
+    def open_window():
+        window.show_window()
+        app.processEvents()
+        window.hide()
+        app.processEvents()
+
+    def type_query():
+        launcher.search_input.clear()
+        for length in range(1, len(QUERY) + 1):
+            launcher.search_input.setText(QUERY[:length])
+
+    total = args.sections * args.rows
+    print(f"{total} respostas em {args.sections} seções")
+    report("paleta: abrir e pintar", measure(open_launcher, args.repeat))
+    report("janela principal: abrir e pintar", measure(open_window, args.repeat))
+    samples = measure(type_query, args.repeat)
+    report(f"busca por tecla ({len(QUERY)} teclas)", [s / len(QUERY) for s in samples])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Micro-benchmark do custo de repintura da janela principal por modo de renderização
+
+Compara o modo translúcido (WA_TranslucentBackground, superfície ARGB) com o
+modo opaco com máscara arredondada, repintando a janela inteira de forma
+síncrona. Em desktops Linux com composição por software a diferença real é
+maior, pois o compositor também mescla a janela translúcida a cada quadro.
+
+Uso:
+    python benchmarks/bench_rendering.py [--rows 200] [--repeat 200]
+    QT_QPA_PLATFORM=xcb python benchmarks/bench_rendering.py  # desktop real
+"""
+
+import argparse
+
+from _support import create_window, measure, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    app, window = create_window({"Geral": args.rows})
+    window.show()
+    app.processEvents()
+
+    def repaint():
+        window.repaint()
+
+    print(f"Janela {window.width()}x{window.height()}, {args.repeat} repinturas")
+    for mode in ("translucent", "opaque"):
+        window.apply_rendering_mode(mode)
+        app.processEvents()
+        report(f"modo {mode}", measure(repaint, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Micro-benchmark da latência de seleção de respostas
+
+Compara o destaque pintado (set_selected atual) com o antigo destaque via
+propriedade dinâmica + unpolish()/polish(), em uma seção grande.
+
+Uso:
+    python benchmarks/bench_selection.py [--rows 2000] [--repeat 300]
+"""
+
+import argparse
+import itertools
+
+from _support import create_window, measure, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    app, window = create_window({"Geral": args.rows})
+    window.show()
+    app.processEvents()
+    rows = window.response_widgets
+    # Percorre linhas espalhadas pela seção inteira
+    targets = itertools.cycle(rows[::max(1, len(rows) // args.repeat)])
+
+    def select_painted():
+        window.set_selected_response(next(targets))
+        app.processEvents()
+
+    def select_polished():
+        # Reproduz o caminho antigo: propriedade dinâmica + repolish
+        widget = next(targets)
+        previous = window.selected_response_widget
+        if previous:
+            previous.setProperty("selected", False)
+            previous.style().unpolish(previous)
+            previous.style().polish(previous)
+        widget.setProperty("selected", True)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        window.selected_response_widget = widget
+        app.processEvents()
+
+    print(f"Seção com {len(rows)} respostas, {args.repeat} seleções")
+    report("destaque pintado (atual)", measure(select_painted, args.repeat))
+    report("unpolish/polish (anterior)", measure(select_polished, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
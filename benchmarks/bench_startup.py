@@ -0,0 +1,199 @@
+"""
+Benchmark de inicialização do código-fonte e dos executáveis PyInstaller
+
+Mede o tempo até a primeira pintura e até a janela ficar interativa (fase
+"interactive" do --startup-trace: janela pintada, linhas, bandeja e atalhos
+prontos), contado a partir do início do processo. Cada execução usa um HOME
+temporário (dados e instância única isolados), a plataforma Qt "offscreen" e
+--quit-after-startup. As fases são gravadas em um arquivo
+(--startup-trace=ARQUIVO), pois executáveis sem console não têm stderr.
+
+Variantes:
+    source                python main.py
+    <modo>-<upx>-<perfil> executável gerado por build_executable.spec_content,
+                          modo onedir/onefile, upx/noupx e perfil
+                          "spec" (SPEC_EXCLUDES, optimize=2) ou
+                          "plain" (sem excludes, optimize=0)
+
+Os resultados vão para um JSON, para comparar execuções e achar regressões.
+
+Uso:
+    python benchmarks/bench_startup.py [--repeat 5] [--only source,onefile]
+                                       [--output startup.json] [--skip-build]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from _support import report
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import build_executable
+
+BUILD_DIR = ROOT / "build" / "bench_startup"
+TRACE_LINE = re.compile(r"^\[startup\] (\S+)\s.*@(\d+\.\d+)$")
+PROFILES = {
+    "spec": {"excludes": None, "optimize": 2},
+    "plain": {"excludes": [], "optimize": 0},
+}
+
+
+def bundle_variants() -> List[str]:
+    return ["-".join(parts) for parts in
+            itertools.product(("onedir", "onefile"), ("upx", "noupx"), PROFILES)]
+
+
+def build_bundle(variant: str) -> Path:
+    """Gera o spec da variante, roda o PyInstaller e retorna o executável"""
+    mode, upx, profile = variant.split("-")
+    work_dir = BUILD_DIR / variant
+    spec_file = work_dir / f"{variant}.spec"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    spec_file.write_text(build_executable.spec_content(
+        onefile=mode == "onefile", upx=upx == "upx", name="fctbi_bench",
+        root=str(ROOT), **PROFILES[profile]), encoding="utf-8")
+    subprocess.run([sys.executable, "-m", "PyInstaller", "--noconfirm", "--log-level=WARN",
+                    "--distpath", str(work_dir / "dist"), "--workpath", str(work_dir / "build"),
+                    str(spec_file)], check=True)
+    exe_name = "fctbi_bench.exe" if sys.platform == "win32" else "fctbi_bench"
+    if mode == "onefile":
+        return work_dir / "dist" / exe_name
+    return work_dir / "dist" / "fctbi_bench" / exe_name
+
+
+def existing_bundle(variant: str) -> Optional[Path]:
+    mode = variant.split("-")[0]
+    exe_name = "fctbi_bench.exe" if sys.platform == "win32" else "fctbi_bench"
+    dist = BUILD_DIR / variant / "dist"
+    path = dist / exe_name if mode == "onefile" else dist / "fctbi_bench" / exe_name
+    return path if path.exists() else None
+
+
+def bundle_size_mb(executable: Path) -> float:
+    target = executable if executable.parent.name == "dist" else executable.parent
+    if target.is_file():
+        return target.stat().st_size / 1e6
+    return sum(f.stat().st_size for f in target.rglob("*") if f.is_file()) / 1e6
+
+
+def run_once(command: List[str], timeout: float) -> Dict[str, float]:
+    """Executa uma inicialização; retorna ms desde o início do processo por fase"""
+    home = tempfile.mkdtemp(prefix="fctbi_bench_home_")
+    env = dict(os.environ, HOME=home, USERPROFILE=home, QT_QPA_PLATFORM="offscreen")
+    trace_file = Path(home) / "startup_trace.txt"
+    try:
+        spawn = time.time()
+        start = time.perf_counter()
+        result = subprocess.run(command + [f"--startup-trace={trace_file}",
+                                           "--quit-after-startup"],
+                                cwd=ROOT, env=env, capture_output=True, text=True,
+                                timeout=timeout)
+        exited = (time.perf_counter() - start) * 1000
+        trace = trace_file.read_text(encoding="utf-8") if trace_file.exists() else ""
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    phases = {}
+    for line in trace.splitlines():
+        match = TRACE_LINE.match(line.strip())
+        if match:
+            phases[match.group(1)] = (float(match.group(2)) - spawn) * 1000
+    if "interactive" not in phases:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"sem fase 'interactive' (código {result.returncode}):\n{tail}")
+    phases["exit"] = exited
+    return phases
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for phase in ("imports", "first_paint", "interactive", "exit"):
+        values = [sample[phase] for sample in samples if phase in sample]
+        if values:
+            summary[phase] = {"median": round(statistics.median(values), 1),
+                              "min": round(min(values), 1), "max": round(max(values), 1)}
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="",
+                        help="filtros separados por vírgula (ex.: source,onefile-noupx)")
+    parser.add_argument("--output", type=Path, default=Path("startup_results.json"))
+    parser.add_argument("--skip-build", action="store_true",
+                        help="usa executáveis já gerados em build/bench_startup")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    filters = [f for f in args.only.split(",") if f]
+    variants = [v for v in ["source"] + bundle_variants()
+                if not filters or any(f in v for f in filters)]
+
+    try:
+        import PyInstaller  # noqa: F401
+        has_pyinstaller = True
+    except ImportError:
+        has_pyinstaller = False
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "variants": {},
+    }
+
+    for variant in variants:
+        entry: Dict[str, object] = {}
+        if variant == "source":
+            command = [sys.executable, str(ROOT / "main.py")]
+        else:
+            executable = existing_bundle(variant) if args.skip_build else None
+            if executable is None:
+                if not has_pyinstaller:
+                    print(f"{variant:<24} ignorada: PyInstaller não instalado")
+                    results["variants"][variant] = {"skipped": "PyInstaller não instalado"}
+                    continue
+                if "-upx-" in variant and shutil.which("upx") is None:
+                    entry["warning"] = "upx não encontrado no PATH; build sem compressão"
+                build_start = time.perf_counter()
+                executable = build_bundle(variant)
+                entry["build_s"] = round(time.perf_counter() - build_start, 1)
+            entry["size_mb"] = round(bundle_size_mb(executable), 1)
+            command = [str(executable)]
+
+        try:
+            samples = [run_once(command, args.timeout) for _ in range(args.repeat)]
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"{variant:<24} FALHOU: {e}")
+            entry["error"] = str(e)
+            results["variants"][variant] = entry
+            continue
+
+        entry["samples"] = [{k: round(v, 1) for k, v in s.items()} for s in samples]
+        entry["summary"] = summarize(samples)
+        results["variants"][variant] = entry
+        report(f"{variant} primeira pintura", [s["first_paint"] for s in samples])
+        report(f"{variant} interativa", [s["interactive"] for s in samples])
+
+    args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Resultados em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark da expansão de modelos em uma biblioteca grande
+
+Gera uma biblioteca com respostas simples, com variáveis e com inclusões e
+mede: a compilação de todas as respostas (cache vazio), a expansão de cada
+resposta com o cache pronto, a mesma expansão compilando toda vez e o custo
+de uma resposta sem marcadores (o caminho de toda cópia comum).
+
+Uso:
+    python benchmarks/bench_templates.py [--responses 20000] [--repeat 5]
+"""
+
+import argparse
+import random
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from _support import measure, report
+
+from fctbi_core import DataManager, compile_template, response_id
+from fctbi_core.templates import TemplateEngine
+
+VALUES = {"nome": "Ana", "atendente": "Rui", "pedido": "12345", "clipboard": "colado"}
+
+
+def build_library(data_manager: DataManager, count: int) -> None:
+    """~70% simples, ~20% com variáveis e ~10% com inclusões"""
+    rng = random.Random(0)
+    words = "cliente pedido prazo entrega nota fiscal boleto suporte acesso senha".split()
+    signatures = [f"Atenciosamente, {{atendente}} — equipe {i}" for i in range(20)]
+    responses = list(signatures)
+    for i in range(count - len(signatures)):
+        body = " ".join(rng.choices(words, k=30)) + f" #{i}"
+        kind = rng.random()
+        if kind < 0.7:
+            responses.append(body)
+        elif kind < 0.9:
+            responses.append(f"Olá {{nome}}, sobre o pedido {{pedido}} ({{data}} {{hora}}): {body}")
+        else:
+            signature = "{incluir:%s}" % response_id(rng.choice(signatures))
+            responses.append(f"Olá {{nome}}! {body}\n{signature}")
+    items = [{"texto": text, "data": ""} for text in responses]
+    for item in items:
+        if "{" in item["texto"]:
+            item["modelo"] = True  # Ver DataManager.set_template
+    data_manager.data = {"Geral": items}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data_dir = Path(tempfile.mkdtemp(prefix="fctbi_bench_"))
+    data_manager = DataManager(str(data_dir / "respostas.json"))
+    build_library(data_manager, args.responses)
+    texts = [response["texto"] for response in data_manager.data["Geral"]]
+    now = datetime.now()
+    print(f"{len(texts)} respostas")
+
+    def compile_all():
+        engine = TemplateEngine(data_manager)
+        for text in texts:
+            engine.get(text)
+        data_manager.remove_listener(engine._on_data_changed)
+
+    report("compilar a biblioteca (cache vazio)", measure(compile_all, args.repeat))
+
+    engine = data_manager.templates
+    for text in texts:
+        engine.get(text)
+
+    def render_all():
+        for text in texts:
+            engine.render(text, VALUES, now)
+
+    def render_uncached():
+        for text in texts:
+            engine._templates.pop(text, None)
+            engine.render(text, VALUES, now)
+
+    # Uma cópia expande uma resposta: tempos normalizados para 1000 cópias
+    def per_thousand(samples, count):
+        return [s * 1000 / count for s in samples]
+
+    print("Por 1000 cópias:")
+    report("  expandir com cache", per_thousand(measure(render_all, args.repeat), len(texts)))
+    report("  expandir compilando toda vez",
+           per_thousand(measure(render_uncached, args.repeat), len(texts)))
+    plain = [text for text in texts if compile_template(text).is_static]
+    report("  resposta simples (sem marcadores)", per_thousand(measure(
+        lambda: [engine.render(text, VALUES, now) for text in plain], args.repeat), len(plain)))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ import sys
 import shutil
 import subprocess
 from pathlib import Path
+from typing import List, Optional
 
 def check_dependencies():
     """Verifica se as dependências necessárias estão instaladas"""
@@ -30,11 +31,62 @@ def check_dependencies():
         print("❌ PyQt5 não encontrado. Instalando...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "PyQt5>=5.15.0,<6.0.0"])
 
-def create_spec_file():
-    """Cria arquivo de especificação otimizado para PyInstaller"""
-    print("📝 Criando arquivo de especificação...")
+# Módulos excluídos do bundle pelo spec gerado (ver benchmarks/bench_startup.py)
+# Só entram aqui módulos fora do grafo de importação do app: excluir algo que
+# ele importa (re, inspect, threading, socket...) impede o executável de abrir.
+# numpy é opcional (extra "effects") e fica de fora do executável.
+SPEC_EXCLUDES = [
+    'matplotlib', 'numpy', 'pandas', 'scipy', 'tkinter', 'PIL', 'cv2', 'requests',
+    'urllib3', 'certifi', 'charset_normalizer', 'idna', 'ssl', 'http', 'email', 'xml',
+    'html', 'xmlrpc', 'ftplib', 'smtplib', 'poplib', 'imaplib', 'nntplib', 'telnetlib',
+    'socketserver', 'multiprocessing', 'concurrent', 'asyncio', 'queue', 'tempfile',
+    'zipfile', 'tarfile', 'gzip', 'hmac', 'secrets', 'base64', 'binascii', 'shelve',
+    'dbm', 'sqlite3', 'pydoc', 'doctest', 'unittest', 'test', 'distutils',
+    'setuptools', 'pkg_resources', 'runpy', 'compileall', 'py_compile', 'symtable',
+    'code', 'codeop', 'pickletools', 'tabnanny', 'pyclbr', 'filecmp', 'difflib',
+    'stringprep', 'readline', 'rlcompleter',
+]
+
+SPEC_NAME = 'FCTBI_Respostas_Rapidas'
+
+def spec_content(onefile: bool = False, upx: bool = True, optimize: int = 2,
+                 excludes: Optional[List[str]] = None, name: str = SPEC_NAME,
+                 root: str = '.') -> str:
+    """
+    Monta o arquivo de especificação do PyInstaller
+    
+    Args:
+        onefile: Um único executável (extraído a cada execução) em vez de pasta
+        upx: Comprimir binários com UPX
+        optimize: Nível de otimização do bytecode (0 a 2)
+        excludes: Módulos excluídos (padrão: SPEC_EXCLUDES)
+        name: Nome do executável
+        root: Diretório do código-fonte (main.py e recursos)
+    """
+    excludes = SPEC_EXCLUDES if excludes is None else excludes
+    excludes_lines = "".join(f"        {module!r},\n" for module in excludes)
+    
+    if onefile:
+        # Tudo dentro do executável, sem COLLECT
+        exe_inputs = "pyz,\n    a.scripts,\n    a.binaries,\n    a.zipfiles,\n    a.datas,\n    [],"
+        collect = ""
+    else:
+        exe_inputs = "pyz,\n    a.scripts,\n    [],\n    exclude_binaries=True,"
+        collect = f'''
+# Configurações da coleção (para distribuição)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx={upx},
+    upx_exclude=[],
+    name={name!r},
+)
+'''
     
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
+    return f'''# -*- mode: python ; coding: utf-8 -*-
 """
 Especificação PyInstaller para FCTBI Respostas Rápidas
 Versão: 2.0 - Otimizada com todas as aplicações
@@ -43,20 +95,23 @@ Versão: 2.0 - Otimizada com todas as aplicações
 import sys
 from pathlib import Path
 
+ROOT = Path({root!r})
+
 # Configurações de análise
 a = Analysis(
-    ['main.py'],
-    pathex=[],
+    [str(ROOT / 'main.py')],
+    pathex=[str(ROOT)],
     binaries=[],
     datas=[
-        ('fctbi.ico', '.'),
-        ('BLMelody-Regular.otf', '.'),
-        ('special_effects.py', '.'),
+        (str(ROOT / 'fctbi.ico'), '.'),
+        (str(ROOT / 'BLMelody-Regular.otf'), '.'),
+        (str(ROOT / 'special_effects.py'), '.'),
     ],
     hiddenimports=[
         'PyQt5.QtCore',
         'PyQt5.QtGui', 
         'PyQt5.QtWidgets',
+        'PyQt5.QtNetwork',
         'PyQt5.sip',
         'typing_extensions',
         'json',
@@ -69,145 +124,12 @@ a = Analysis(
         'typing',
     ],
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
     excludes=[
-        'matplotlib',
-        'numpy',
-        'pandas',
-        'scipy',
-        'tkinter',
-        'PIL',
-        'cv2',
-        'requests',
-        'urllib3',
-        'certifi',
-        'charset_normalizer',
-        'idna',
-        'ssl',
-        'http',
-        'email',
-        'xml',
-        'html',
-        'xmlrpc',
-        'ftplib',
-        'smtplib',
-        'poplib',
-        'imaplib',
-        'nntplib',
-        'telnetlib',
-        'socketserver',
-        'multiprocessing',
-        'concurrent',
-        'asyncio',
-        'threading',
-        'queue',
-        'subprocess',
-        'signal',
-        'select',
-        'socket',
-        'tempfile',
-        'zipfile',
-        'tarfile',
-        'gzip',
-        'bz2',
-        'lzma',
-        'zlib',
-        'hashlib',
-        'hmac',
-        'secrets',
-        'base64',
-        'binascii',
-        'struct',
-        'array',
-        'weakref',
-        'copyreg',
-        'pickle',
-        'shelve',
-        'dbm',
-        'sqlite3',
-        'pydoc',
-        'doctest',
-        'unittest',
-        'test',
-        'distutils',
-        'setuptools',
-        'pkg_resources',
-        'pkgutil',
-        'importlib',
-        'importlib.metadata',
-        'importlib.util',
-        'importlib.abc',
-        'importlib.machinery',
-        'importlib.resources',
-        'runpy',
-        'compileall',
-        'py_compile',
-        'tokenize',
-        'ast',
-        'symtable',
-        'code',
-        'codeop',
-        'dis',
-        'pickletools',
-        'tabnanny',
-        'py_compile',
-        'compileall',
-        'pyclbr',
-        'filecmp',
-        'difflib',
-        'inspect',
-        'ast',
-        'symtable',
-        'code',
-        'codeop',
-        'dis',
-        'pickletools',
-        'tabnanny',
-        'py_compile',
-        'compileall',
-        'pyclbr',
-        'filecmp',
-        'difflib',
-        'inspect',
-        'traceback',
-        'linecache',
-        'locale',
-        'gettext',
-        'string',
-        're',
-        'difflib',
-        'textwrap',
-        'unicodedata',
-        'stringprep',
-        'readline',
-        'rlcompleter',
-        'code',
-        'codeop',
-        'dis',
-        'pickletools',
-        'tabnanny',
-        'py_compile',
-        'compileall',
-        'pyclbr',
-        'filecmp',
-        'difflib',
-        'inspect',
-        'traceback',
-        'linecache',
-        'locale',
-        'gettext',
-        'string',
-        're',
-        'difflib',
-        'textwrap',
-        'unicodedata',
-        'stringprep',
-        'readline',
-        'rlcompleter',
-    ],
+{excludes_lines}    ],
     noarchive=False,
-    optimize=2,  # Otimização máxima
+    optimize={optimize},
 )
 
 # Configurações do PYZ
@@ -220,15 +142,12 @@ pyz = PYZ(
 
 # Configurações do executável
 exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='FCTBI_Respostas_Rapidas',
+    {exe_inputs}
+    name={name!r},
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx={upx},
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,  # Sem console para aplicação GUI
@@ -237,29 +156,21 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='fctbi.ico',
+    icon=str(ROOT / 'fctbi.ico'),
     version_file=None,
     uac_admin=False,
     uac_uiaccess=False,
 )
+{collect}'''
 
-# Configurações da coleção (para distribuição)
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='FCTBI_Respostas_Rapidas',
-)
-'''
+def create_spec_file():
+    """Cria arquivo de especificação otimizado para PyInstaller"""
+    print("📝 Criando arquivo de especificação...")
     
-    with open('FCTBI_Respostas_Rapidas.spec', 'w', encoding='utf-8') as f:
-        f.write(spec_content)
+    with open(f'{SPEC_NAME}.spec', 'w', encoding='utf-8') as f:
+        f.write(spec_content())
     
-    print("✅ Arquivo de especificação criado: FCTBI_Respostas_Rapidas.spec")
+    print(f"✅ Arquivo de especificação criado: {SPEC_NAME}.spec")
 
 def clean_build_dirs():
     """Limpa diretórios de build anteriores"""
@@ -0,0 +1,38 @@
+"""
+Núcleo do FCTBI sem dependência de Qt
+
+Dados, estatísticas e configurações podem ser usados por scripts, testes e
+pelo cliente de comandos sem pagar a importação do PyQt5; main.py monta a
+interface sobre estes módulos.
+"""
+
+from .cache import load_json_cached, wait_for_cache_writes
+from .config import AppConfig, CONFIG, ConfigManager, DEFAULT_APP_DATA_DIR
+from .data import (
+    DataChange, DataManager, response_id,
+    FORMAT_TEXT, FORMAT_MARKDOWN, FORMAT_HTML, RESPONSE_FORMATS,
+    RESPONSE_INSERTED, RESPONSE_REMOVED, RESPONSE_MOVED, RESPONSE_CHANGED,
+    RESPONSES_RESET, SECTION_INSERTED, SECTION_REMOVED, SECTION_RENAMED,
+    SECTION_MOVED, SECTIONS_RESET,
+)
+from .search import SearchIndex, fold
+from .stats import StatsManager
+from .storage import clean_corrupted_file, safe_json_load, safe_json_save
+from .templates import (
+    BUILTIN_VARIABLES, Template, TemplateEngine, TemplateError, compile_template, escape_html,
+)
+
+__all__ = [
+    "AppConfig", "CONFIG", "ConfigManager", "DEFAULT_APP_DATA_DIR",
+    "DataChange", "DataManager", "response_id",
+    "FORMAT_TEXT", "FORMAT_MARKDOWN", "FORMAT_HTML", "RESPONSE_FORMATS",
+    "RESPONSE_INSERTED", "RESPONSE_REMOVED", "RESPONSE_MOVED", "RESPONSE_CHANGED",
+    "RESPONSES_RESET", "SECTION_INSERTED", "SECTION_REMOVED", "SECTION_RENAMED",
+    "SECTION_MOVED", "SECTIONS_RESET",
+    "SearchIndex", "fold",
+    "StatsManager",
+    "clean_corrupted_file", "safe_json_load", "safe_json_save",
+    "load_json_cached", "wait_for_cache_writes",
+    "BUILTIN_VARIABLES", "Template", "TemplateEngine", "TemplateError", "compile_template",
+    "escape_html",
+]
@@ -0,0 +1,7 @@
+"""Permite `python -m fctbi_core ...` (ver fctbi_core.cli)"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
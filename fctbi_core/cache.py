@@ -0,0 +1,125 @@
+"""
+Cache binário (marshal) dos arquivos JSON já interpretados
+
+Ler o cache leva cerca de metade do tempo de interpretar o JSON em bibliotecas
+grandes (ver benchmarks/bench_parse_cache.py). O cache guarda a chave do
+arquivo de origem, (tamanho, mtime, CRC-32 do conteúdo), e só é usado se ela
+conferir; caso contrário o JSON é interpretado e o cache é regravado em uma
+thread, fora do caminho da inicialização.
+
+O CRC-32 só detecta regravações que mantêm tamanho e mtime; o cache fica no
+diretório de dados do próprio usuário e não precisa de hash criptográfico
+(que aqui custa o dobro).
+"""
+
+import gc
+import json
+import marshal
+import os
+import sys
+import threading
+import zlib
+from typing import Any, List, Optional, Tuple
+
+CACHE_SUFFIX = ".cache"
+# Muda se o formato do arquivo de cache mudar
+CACHE_FORMAT = 1
+
+# Gravações em andamento (ver wait_for_cache_writes)
+_PENDING_WRITES: List[threading.Thread] = []
+
+SourceKey = Tuple[int, int, int]
+
+
+def cache_path(source: str) -> str:
+    """Arquivo de cache de `source` (ao lado dele)"""
+    return source + CACHE_SUFFIX
+
+
+def _header(key: SourceKey) -> tuple:
+    # O formato do marshal muda entre versões do Python
+    return (CACHE_FORMAT, marshal.version, sys.version_info[:2], key)
+
+
+def read_cache(cache_file: str, key: SourceKey) -> Tuple[bool, Any]:
+    """Retorna (True, dados) se o cache existir e for da mesma origem"""
+    # Milhares de dicts pequenos disparariam coletas inúteis do gc
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(cache_file, "rb") as f:
+            content = memoryview(f.read())
+        # Cabeçalho primeiro (prefixado pelo tamanho): cache vencido não é desserializado
+        header_size = int.from_bytes(content[:4], "little")
+        if marshal.loads(content[4:4 + header_size]) != _header(key):
+            return False, None
+        return True, marshal.loads(content[4 + header_size:])
+    except (OSError, EOFError, ValueError, TypeError):
+        return False, None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def write_cache(cache_file: str, key: SourceKey, data: Any,
+                background: bool = True) -> Optional[threading.Thread]:
+    """
+    Grava o cache de forma atômica
+
+    A serialização acontece aqui, antes de retornar, para que alterações
+    posteriores em `data` não cheguem ao cache; só a escrita em disco vai
+    para a thread.
+    """
+    try:
+        header = marshal.dumps(_header(key))
+        payload = len(header).to_bytes(4, "little") + header + marshal.dumps(data)
+    except ValueError:
+        return None  # Tipos que o marshal não suporta: sem cache
+
+    def write() -> None:
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    if not background:
+        write()
+        return None
+    thread = threading.Thread(target=write, name="fctbi-cache-write", daemon=True)
+    _PENDING_WRITES[:] = [t for t in _PENDING_WRITES if t.is_alive()]
+    _PENDING_WRITES.append(thread)
+    thread.start()
+    return thread
+
+
+def wait_for_cache_writes(timeout: Optional[float] = None) -> None:
+    """Espera as gravações de cache em andamento (testes, encerramento)"""
+    for thread in list(_PENDING_WRITES):
+        thread.join(timeout)
+    _PENDING_WRITES[:] = [t for t in _PENDING_WRITES if t.is_alive()]
+
+
+def load_json_cached(source: str, background: bool = True) -> Any:
+    """
+    Lê um JSON UTF-8 usando o cache quando ele for válido
+
+    Raises:
+        OSError, ValueError: Como json.load (arquivo ausente ou inválido)
+    """
+    with open(source, "rb") as f:
+        raw = f.read()
+        stat = os.fstat(f.fileno())
+    key = (stat.st_size, stat.st_mtime_ns, zlib.crc32(raw))
+
+    cache_file = cache_path(source)
+    valid, data = read_cache(cache_file, key)
+    if valid:
+        return data
+
+    data = json.loads(raw.decode("utf-8"))
+    write_cache(cache_file, key, data, background)
+    return data
@@ -0,0 +1,224 @@
+"""
+Linha de comando do FCTBI, sem interface gráfica
+
+Opera diretamente sobre os arquivos da biblioteca (DataManager e
+StatsManager) e não importa o PyQt5, então roda em servidores e no cron.
+Com o app aberto, prefira ipc_client.py: a janela regrava os arquivos a
+partir da própria memória.
+
+Uso:
+    fctbi-cli search "texto" [--limit 20] [--json]
+    fctbi-cli add "Seção" "Texto" [--create-section]
+    fctbi-cli import respostas.json
+    fctbi-cli export saida.json [--section "Seção"]
+    fctbi-cli dedupe [--dry-run]
+    fctbi-cli stats [--limit 10] [--json]
+    fctbi-cli backup [destino] | backup --list
+    fctbi-cli restore [arquivo]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .config import CONFIG, AppConfig
+from .data import DataManager, response_id
+from .stats import StatsManager
+
+
+def _print_json(data: Any) -> None:
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+def _fail(message: str) -> int:
+    print(message, file=sys.stderr)
+    return 1
+
+
+def cmd_search(args: argparse.Namespace, config: AppConfig) -> int:
+    matches = DataManager(config.DATA_FILE).search(args.query, args.limit)
+    if args.json:
+        _print_json([{"id": response_id(r["texto"]), "section": section, "texto": r["texto"]}
+                     for section, r in matches])
+    else:
+        for section, response in matches:
+            print(f"{response_id(response['texto'])}  [{section}]  {response['texto']}")
+    return 0
+
+
+def cmd_add(args: argparse.Namespace, config: AppConfig) -> int:
+    data_manager = DataManager(config.DATA_FILE)
+    if args.section not in data_manager.data:
+        if not args.create_section:
+            return _fail(f"Seção '{args.section}' não existe (use --create-section)")
+        data_manager.add_section(args.section)
+    if not data_manager.add_response(args.section, args.text):
+        return _fail("Não foi possível adicionar a resposta")
+    StatsManager(config.STATS_FILE).record_response_created()
+    print(response_id(args.text))
+    return 0
+
+
+def _check_import_file(file_path: str) -> Optional[str]:
+    """
+    Lê um .json de importação sem alterá-lo; retorna o erro ou None
+
+    DataManager.import_data usa safe_json_load, que troca um arquivo
+    corrompido por {}; aqui o arquivo do usuário nunca é regravado.
+    """
+    if not file_path.endswith(".json"):
+        return None
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        return f"{file_path}: não é um JSON válido ({e})"
+    if not isinstance(data, dict):
+        return f"{file_path}: esperado um objeto {{seção: [respostas]}}"
+    for section, responses in data.items():
+        if not isinstance(responses, list) or not all(
+                isinstance(r, str) or (isinstance(r, dict) and isinstance(r.get("texto"), str))
+                for r in responses):
+            return f"{file_path}: seção '{section}' deve ser uma lista de respostas"
+    return None
+
+
+def cmd_import(args: argparse.Namespace, config: AppConfig) -> int:
+    # Todos os arquivos são conferidos antes de importar qualquer um
+    for file_path in args.files:
+        error = _check_import_file(file_path)
+        if error:
+            return _fail(error)
+    data_manager = DataManager(config.DATA_FILE)
+    before = sum(len(responses) for responses in data_manager.data.values())
+    for file_path in args.files:
+        if not data_manager.import_data(file_path):
+            return _fail(f"Erro ao importar {file_path}")
+    after = sum(len(responses) for responses in data_manager.data.values())
+    print(f"{after - before} resposta(s) importada(s)")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace, config: AppConfig) -> int:
+    data_manager = DataManager(config.DATA_FILE)
+    if args.section and args.section not in data_manager.data:
+        return _fail(f"Seção '{args.section}' não existe")
+    if not data_manager.export_data(args.file, args.section):
+        return _fail(f"Erro ao exportar para {args.file}")
+    return 0
+
+
+def cmd_dedupe(args: argparse.Namespace, config: AppConfig) -> int:
+    data_manager = DataManager(config.DATA_FILE)
+    if args.dry_run:
+        duplicates = data_manager.find_duplicates()
+        for section, text in duplicates:
+            print(f"[{section}]  {text}")
+        print(f"{len(duplicates)} repetição(ões) encontrada(s)")
+    else:
+        print(f"{data_manager.remove_duplicates()} repetição(ões) removida(s)")
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace, config: AppConfig) -> int:
+    stats_manager = StatsManager(config.STATS_FILE)
+    stats = stats_manager.stats
+    most_used = stats_manager.get_most_used_responses(args.limit)
+    if args.json:
+        _print_json({**stats, "most_used": [{"texto": t, "count": c} for t, c in most_used]})
+        return 0
+    print(f"Cópias: {stats['total_copies']}")
+    print(f"Respostas criadas: {stats['created_responses']}")
+    print(f"Respostas removidas: {stats['deleted_responses']}")
+    for text, count in most_used:
+        print(f"{count:6d}  {text}")
+    return 0
+
+
+def cmd_backup(args: argparse.Namespace, config: AppConfig) -> int:
+    data_manager = DataManager(config.DATA_FILE)
+    if args.list:
+        for backup in data_manager.list_backups():
+            print(backup)
+        return 0
+    try:
+        print(data_manager.backup(args.destination))
+    except OSError as e:
+        return _fail(f"Erro ao criar backup: {e}")
+    return 0
+
+
+def cmd_restore(args: argparse.Namespace, config: AppConfig) -> int:
+    data_manager = DataManager(config.DATA_FILE)
+    source = args.source
+    if source is None:
+        backups = data_manager.list_backups()
+        if not backups:
+            return _fail("Nenhum backup encontrado")
+        source = str(backups[-1])
+    if not data_manager.restore(source):
+        return _fail(f"Backup inválido: {source}")
+    print(f"Restaurado de {source}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="fctbi-cli",
+                                     description="Operações em lote na biblioteca do FCTBI")
+    parser.add_argument("--data-dir", type=Path, default=CONFIG.APP_DATA_DIR,
+                        help="diretório de dados (padrão: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="busca respostas")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int)
+    search.add_argument("--json", action="store_true")
+    search.set_defaults(handler=cmd_search)
+
+    add = commands.add_parser("add", help="adiciona uma resposta")
+    add.add_argument("section")
+    add.add_argument("text")
+    add.add_argument("--create-section", action="store_true")
+    add.set_defaults(handler=cmd_add)
+
+    import_ = commands.add_parser("import", help="importa arquivos .json ou .txt")
+    import_.add_argument("files", nargs="+")
+    import_.set_defaults(handler=cmd_import)
+
+    export = commands.add_parser("export", help="exporta para .json ou .txt")
+    export.add_argument("file")
+    export.add_argument("--section")
+    export.set_defaults(handler=cmd_export)
+
+    dedupe = commands.add_parser("dedupe", help="remove respostas repetidas em cada seção")
+    dedupe.add_argument("--dry-run", action="store_true", help="só lista as repetições")
+    dedupe.set_defaults(handler=cmd_dedupe)
+
+    stats = commands.add_parser("stats", help="estatísticas de uso")
+    stats.add_argument("--limit", type=int, default=10)
+    stats.add_argument("--json", action="store_true")
+    stats.set_defaults(handler=cmd_stats)
+
+    backup = commands.add_parser("backup", help="copia o arquivo de respostas")
+    backup.add_argument("destination", nargs="?")
+    backup.add_argument("--list", action="store_true", help="lista os backups automáticos")
+    backup.set_defaults(handler=cmd_backup)
+
+    restore = commands.add_parser("restore", help="restaura um backup (padrão: o mais recente)")
+    restore.add_argument("source", nargs="?")
+    restore.set_defaults(handler=cmd_restore)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    config = AppConfig(APP_DATA_DIR=args.data_dir)
+    config.APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return args.handler(args, config)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
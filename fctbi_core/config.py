@@ -0,0 +1,99 @@
+"""
+Configurações do FCTBI: caminhos e constantes globais e o ConfigManager
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .storage import safe_json_load, safe_json_save
+
+# Diretório de dados padrão (repetido em ipc_client.py, que não importa o núcleo)
+DEFAULT_APP_DATA_DIR = Path.home() / "Documents" / "FCTBI_data"
+
+@dataclass
+class AppConfig:
+    """Configurações da aplicação"""
+    APP_DATA_DIR: Path = field(default_factory=lambda: DEFAULT_APP_DATA_DIR)
+    DATA_FILE: str = field(init=False)
+    BACKUP_FILE: str = field(init=False)
+    CONFIG_FILE: str = field(init=False)
+    STATS_FILE: str = field(init=False)
+    THEMES_DIR: str = field(init=False)
+    FONT_FILE: str = "BLMelody-Regular.otf"
+    APP_FONT_NAME: str = "BL Melody Regular"
+    WINDOW_WIDTH: int = 480
+    WINDOW_HEIGHT: int = 720
+    MIN_WINDOW_WIDTH: int = 420
+    MIN_WINDOW_HEIGHT: int = 580
+    # Limites do cache de páginas de seção (ver RespostaRapidaApp._trim_page_cache)
+    PAGE_CACHE_MAX_ROWS: int = 1500
+    PAGE_CACHE_MAX_PAGES: int = 8
+    # Linhas exibidas por resposta antes de "Expandir texto" (ver ResponseButton)
+    RESPONSE_PREVIEW_LINES: int = 3
+    RESPONSE_PREVIEW_CACHE_SIZE: int = 4096
+    
+    def __post_init__(self):
+        self.DATA_FILE = str(self.APP_DATA_DIR / "respostas.json")
+        self.BACKUP_FILE = str(self.APP_DATA_DIR / "respostas_backup.json")
+        self.CONFIG_FILE = str(self.APP_DATA_DIR / "config.json")
+        self.STATS_FILE = str(self.APP_DATA_DIR / "stats.json")
+        self.THEMES_DIR = str(self.APP_DATA_DIR / "themes")
+
+# Instância global de configuração
+CONFIG = AppConfig()
+
+class ConfigManager:
+    """Gerenciador de configurações da aplicação"""
+    
+    def __init__(self, config_file: str):
+        self.config_file = config_file
+        self.config = self._load_config()
+
+    def _load_config(self) -> Dict[str, Any]:
+        """Carrega configurações do arquivo"""
+        default_config = {
+            "theme": "light",
+            "auto_backup": True,
+            "backup_interval": 60,  # minutos
+            "show_copy_confirmation": True,  # Aviso (toast) ao copiar
+            "minimize_after_copy": False,  # Voltar para a bola flutuante após copiar
+            "pinned_responses": [],  # Textos fixados no menu de cópia rápida
+            "play_copy_sound": False,
+            "sort_responses_by": "creation",  # creation, alphabetical, usage
+            "window_position": None,
+            "window_size": [CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT],
+            "minimize_on_focus_loss": True,  # Minimizar quando clicar fora
+            "prebuild_sections": True,  # Pré-montar a próxima seção em tempo ocioso
+            "rendering_mode": "translucent",  # translucent, opaque (janela opaca com máscara)
+            "animations": True,  # Fades de janela e bola flutuante
+            "launch_mode": "window",  # window, floating (só a bola flutuante ao iniciar)
+            "prewarm_main_window": False  # No modo floating, montar a janela em tempo ocioso
+        }
+        
+        config = safe_json_load(self.config_file, default_config)
+        
+        # Merge com default para garantir todas as chaves
+        for key, value in default_config.items():
+            if key not in config:
+                config[key] = value
+                
+        return config
+
+    def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Salva configurações no arquivo"""
+        config_to_save = config or self.config
+        if safe_json_save(self.config_file, config_to_save):
+            if config:
+                self.config = config
+            return True
+        return False
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Obtém valor de configuração"""
+        return self.config.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Define valor de configuração"""
+        self.config[key] = value
+        self.save_config()
@@ -0,0 +1,514 @@
+"""
+Respostas e seções: leitura, gravação, busca e notificação de alterações
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import load_json_cached
+from .storage import safe_json_load, safe_json_save
+
+@dataclass
+class DataChange:
+    """
+    Alteração pontual emitida pelo DataManager
+
+    Para "response_moved" e "section_moved", `index` é a posição original e
+    `to_index` a posição final do item após o movimento.
+    """
+    kind: str
+    section: Optional[str] = None
+    index: int = -1
+    to_index: int = -1
+    old_name: Optional[str] = None
+
+# Tipos de alteração emitidos pelo DataManager
+RESPONSE_INSERTED = "response_inserted"
+RESPONSE_REMOVED = "response_removed"
+RESPONSE_MOVED = "response_moved"
+RESPONSE_CHANGED = "response_changed"
+RESPONSES_RESET = "responses_reset"
+SECTION_INSERTED = "section_inserted"
+SECTION_REMOVED = "section_removed"
+SECTION_RENAMED = "section_renamed"
+SECTION_MOVED = "section_moved"
+SECTIONS_RESET = "sections_reset"
+
+# Formatos de resposta (chave opcional "formato"; ausente = texto simples)
+FORMAT_TEXT = "texto"
+FORMAT_MARKDOWN = "markdown"
+FORMAT_HTML = "html"
+RESPONSE_FORMATS = (FORMAT_TEXT, FORMAT_MARKDOWN, FORMAT_HTML)
+
+def response_id(text: str) -> str:
+    """Identificador estável de uma resposta, derivado do texto"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+
+class DataManager:
+    """Gerenciador de dados das respostas"""
+    
+    def __init__(self, data_file: str):
+        self.data_file = data_file
+        # Backups ao lado do arquivo de dados (respostas.json -> respostas_backup.json)
+        data_path = Path(data_file)
+        self.backup_file = str(data_path.with_name(f"{data_path.stem}_backup.json"))
+        self.data = self._load_data()
+        self._listeners: List[Callable[[DataChange], None]] = []
+        self._templates = None
+
+    @property
+    def templates(self):
+        """Modelos compilados das respostas (TemplateEngine, criado no primeiro uso)"""
+        if self._templates is None:
+            from .templates import TemplateEngine
+            self._templates = TemplateEngine(self)
+        return self._templates
+
+    def add_listener(self, callback: Callable[[DataChange], None]) -> None:
+        """Registra função chamada a cada alteração dos dados"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[DataChange], None]) -> None:
+        """Remove função registrada com add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, kind: str, section: Optional[str] = None, index: int = -1,
+                to_index: int = -1, old_name: Optional[str] = None) -> None:
+        """Notifica os ouvintes sobre uma alteração"""
+        change = DataChange(kind, section, index, to_index, old_name)
+        for callback in list(self._listeners):
+            callback(change)
+
+    def _load_data(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Carrega dados das respostas"""
+        default_data = {"Geral": []}
+        
+        if not os.path.exists(self.data_file):
+            safe_json_save(self.data_file, default_data)
+            return default_data
+            
+        try:
+            # Cache binário se o arquivo não mudou desde a última leitura
+            data = load_json_cached(self.data_file)
+                
+            if not data:
+                return default_data
+                
+            # Migração de formato antigo (lista) para novo (dicionário)
+            if isinstance(data, list):
+                migrated = {
+                    "Geral": [
+                        {"texto": item, "data": datetime.now().isoformat()} 
+                        for item in data
+                    ]
+                }
+                safe_json_save(self.data_file, migrated)
+                return migrated
+                
+            return data
+            
+        except (ValueError, IOError) as e:
+            print(f"Erro ao carregar dados: {e}")
+            # Tentar usar backup se existir
+            if os.path.exists(self.backup_file):
+                backup_data = safe_json_load(self.backup_file, default_data)
+                if backup_data != default_data:
+                    return backup_data
+            return default_data
+
+    def save(self) -> bool:
+        """Salva dados no arquivo com backup automático"""
+        try:
+            if os.path.exists(self.data_file): 
+                self.backup()
+            return safe_json_save(self.data_file, self.data)
+        except IOError as e:
+            print(f"Erro ao salvar dados: {e}")
+            return False
+
+    def list_backups(self) -> List[Path]:
+        """Backups com timestamp do arquivo de dados, do mais antigo ao mais recente"""
+        backup_path = Path(self.backup_file)
+        return sorted(backup_path.parent.glob(f"{backup_path.name}_*"))
+
+    def backup(self, destination: Optional[str] = None) -> str:
+        """
+        Copia o arquivo de dados
+        
+        Args:
+            destination: Caminho da cópia; se omitido, cria um backup com
+                timestamp ao lado dos dados e mantém só os 5 mais recentes
+                
+        Returns:
+            Caminho da cópia criada
+        """
+        import shutil  # Adiado: só é usado ao salvar
+        
+        if destination is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            destination = f"{self.backup_file}_{timestamp}"
+            shutil.copy2(self.data_file, destination)
+            
+            # Manter apenas os 5 backups mais recentes
+            for old_backup in self.list_backups()[:-5]:
+                old_backup.unlink()
+        else:
+            shutil.copy2(self.data_file, destination)
+        return destination
+
+    def restore(self, source: str) -> bool:
+        """Substitui as respostas pelo conteúdo de um backup (o atual vira backup)"""
+        try:
+            with open(source, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError, UnicodeDecodeError):
+            return False
+        if not isinstance(data, dict) or not all(isinstance(v, list) for v in data.values()):
+            return False
+            
+        self.data = data
+        self._notify(SECTIONS_RESET)
+        return self.save()
+
+    def add_section(self, section_name: str) -> bool:
+        """Adiciona nova seção"""
+        if section_name and section_name not in self.data:
+            self.data[section_name] = []
+            self._notify(SECTION_INSERTED, section_name, len(self.data) - 1)
+            return self.save()
+        return False
+
+    def rename_section(self, old_name: str, new_name: str) -> bool:
+        """Renomeia uma seção mantendo sua posição"""
+        if (old_name not in self.data or 
+            new_name in self.data or 
+            not new_name):
+            return False
+            
+        index = list(self.data.keys()).index(old_name)
+        self.data = {
+            (new_name if section == old_name else section): responses
+            for section, responses in self.data.items()
+        }
+        self._notify(SECTION_RENAMED, new_name, index, old_name=old_name)
+        return self.save()
+
+    def remove_section(self, section_name: str) -> bool:
+        """Remove uma seção"""
+        if len(self.data) <= 1 or section_name not in self.data:
+            return False
+            
+        index = list(self.data.keys()).index(section_name)
+        del self.data[section_name]
+        self._notify(SECTION_REMOVED, section_name, index)
+        return self.save()
+
+    def move_section(self, from_index: int, to_index: int) -> bool:
+        """Move a seção de `from_index` para a posição final `to_index`"""
+        sections = list(self.data.keys())
+        if not (0 <= from_index < len(sections) and 0 <= to_index < len(sections)):
+            return False
+        if from_index == to_index:
+            return True
+            
+        section_name = sections.pop(from_index)
+        sections.insert(to_index, section_name)
+        self.data = {section: self.data[section] for section in sections}
+        self._notify(SECTION_MOVED, section_name, from_index, to_index)
+        return self.save()
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Retorna (seção, resposta) cujo texto contém `query`, sem diferenciar maiúsculas"""
+        query = query.casefold()
+        matches = []
+        for section, responses in self.data.items():
+            for response in responses:
+                if query in response["texto"].casefold():
+                    matches.append((section, response))
+                    if limit is not None and len(matches) >= limit:
+                        return matches
+        return matches
+
+    def find_by_id(self, item_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Retorna (seção, resposta) com o `response_id` dado"""
+        for section, responses in self.data.items():
+            for response in responses:
+                if response_id(response["texto"]) == item_id:
+                    return section, response
+        return None
+
+    def find_duplicates(self) -> List[Tuple[str, str]]:
+        """Retorna (seção, texto) de cada repetição de uma resposta na mesma seção"""
+        duplicates = []
+        for section, responses in self.data.items():
+            seen = set()
+            for response in responses:
+                if response["texto"] in seen:
+                    duplicates.append((section, response["texto"]))
+                seen.add(response["texto"])
+        return duplicates
+
+    def remove_duplicates(self) -> int:
+        """Remove respostas repetidas em cada seção, mantendo a primeira; retorna quantas"""
+        removed = 0
+        for section, responses in self.data.items():
+            seen = set()
+            unique = []
+            for response in responses:
+                if response["texto"] not in seen:
+                    seen.add(response["texto"])
+                    unique.append(response)
+            if len(unique) != len(responses):
+                removed += len(responses) - len(unique)
+                self.data[section] = unique
+                self._notify(RESPONSES_RESET, section)
+        if removed:
+            self.save()
+        return removed
+
+    def add_response(self, section_name: str, text: str) -> bool:
+        """Adiciona nova resposta"""
+        if section_name not in self.data or not text:
+            return False
+            
+        self.data[section_name].append({
+            "texto": text, 
+            "data": datetime.now().isoformat()
+        })
+        self._notify(RESPONSE_INSERTED, section_name, len(self.data[section_name]) - 1)
+        return self.save()
+
+    def edit_response(self, section_name: str, old_text: str, new_text: str) -> bool:
+        """Edita uma resposta existente"""
+        if section_name not in self.data or not new_text:
+            return False
+            
+        for index, item in enumerate(self.data[section_name]):
+            if item["texto"] == old_text:
+                item["texto"] = new_text
+                item["data"] = datetime.now().isoformat()
+                self._notify(RESPONSE_CHANGED, section_name, index)
+                return self.save()
+        return False
+
+    def response_format(self, section_name: str, text: str) -> str:
+        """Formato da resposta (FORMAT_TEXT se não tiver ou não existir)"""
+        for item in self.data.get(section_name, ()):
+            if item["texto"] == text:
+                return item.get("formato", FORMAT_TEXT)
+        return FORMAT_TEXT
+
+    def set_response_format(self, section_name: str, text: str, fmt: str) -> bool:
+        """Define o formato (texto, markdown ou html) de uma resposta"""
+        if section_name not in self.data or fmt not in RESPONSE_FORMATS:
+            return False
+        for index, item in enumerate(self.data[section_name]):
+            if item["texto"] == text:
+                if fmt == FORMAT_TEXT:
+                    # Texto simples é o padrão: o arquivo fica como antes
+                    item.pop("formato", None)
+                else:
+                    item["formato"] = fmt
+                self._notify(RESPONSE_CHANGED, section_name, index)
+                return self.save()
+        return False
+
+    def is_template(self, section_name: str, text: str) -> bool:
+        """True se a resposta foi marcada como modelo (ver fctbi_core.templates)"""
+        for item in self.data.get(section_name, ()):
+            if item["texto"] == text:
+                return bool(item.get("modelo"))
+        return False
+
+    def set_template(self, section_name: str, text: str, enabled: bool) -> bool:
+        """Marca ou desmarca a resposta como modelo (variáveis e inclusões expandidas ao copiar)"""
+        if section_name not in self.data:
+            return False
+        for index, item in enumerate(self.data[section_name]):
+            if item["texto"] == text:
+                if enabled:
+                    item["modelo"] = True
+                else:
+                    # Sem a chave a resposta é copiada como está, como antes dos modelos
+                    item.pop("modelo", None)
+                self._notify(RESPONSE_CHANGED, section_name, index)
+                return self.save()
+        return False
+
+    def duplicate_response(self, section_name: str, text: str) -> bool:
+        """Duplica uma resposta (com formato, marca de modelo e demais chaves)"""
+        if section_name not in self.data:
+            return False
+        original = next((item for item in self.data[section_name] if item["texto"] == text), None)
+        if original is None:
+            return False
+            
+        new_text = f"{text} (cópia)"
+        counter = 1
+        while any(item["texto"] == new_text for item in self.data[section_name]):
+            new_text = f"{text} (cópia {counter})"
+            counter += 1
+            
+        self.data[section_name].append(dict(original, texto=new_text, data=datetime.now().isoformat()))
+        self._notify(RESPONSE_INSERTED, section_name, len(self.data[section_name]) - 1)
+        return self.save()
+
+    def remove_response(self, section_name: str, text: str) -> bool:
+        """Remove uma resposta"""
+        if section_name not in self.data:
+            return False
+            
+        responses = self.data[section_name]
+        for index in reversed(range(len(responses))):
+            if responses[index]["texto"] == text:
+                del responses[index]
+                self._notify(RESPONSE_REMOVED, section_name, index)
+        return self.save()
+
+    def move_response(self, section_name: str, from_index: int, to_index: int) -> bool:
+        """Move a resposta de `from_index` para a posição final `to_index`"""
+        if section_name not in self.data:
+            return False
+            
+        responses = self.data[section_name]
+        if not (0 <= from_index < len(responses) and 0 <= to_index < len(responses)):
+            return False
+        if from_index == to_index:
+            return True
+            
+        responses.insert(to_index, responses.pop(from_index))
+        self._notify(RESPONSE_MOVED, section_name, from_index, to_index)
+        return self.save()
+
+    def move_response_to_section(self, section_name: str, text: str, target_section: str) -> bool:
+        """Move uma resposta para o final de outra seção"""
+        if (section_name not in self.data or target_section not in self.data or
+                section_name == target_section):
+            return False
+            
+        responses = self.data[section_name]
+        index = next((i for i, item in enumerate(responses) if item["texto"] == text), None)
+        if index is None:
+            return False
+            
+        item = responses.pop(index)
+        self._notify(RESPONSE_REMOVED, section_name, index)
+        self.data[target_section].append(item)
+        self._notify(RESPONSE_INSERTED, target_section, len(self.data[target_section]) - 1)
+        return self.save()
+
+    def reorder_sections(self, new_order: List[str]) -> bool:
+        """Reordena seções"""
+        if set(new_order) != set(self.data.keys()):
+            return False
+            
+        self.data = {section: self.data[section] for section in new_order}
+        self._notify(SECTIONS_RESET)
+        return self.save()
+
+    def reorder_responses(self, section_name: str, new_order: List[str]) -> bool:
+        """Reordena respostas em uma seção"""
+        if section_name not in self.data:
+            return False
+
+        item_map = {item["texto"]: item for item in self.data[section_name]}
+        new_list = [item_map[text] for text in new_order if text in item_map]
+        
+        # Adicionar itens que não estão na nova ordem
+        new_order_set = set(new_order)
+        for text, item in item_map.items():
+            if text not in new_order_set:
+                new_list.append(item)
+
+        self.data[section_name] = new_list
+        self._notify(RESPONSES_RESET, section_name)
+        return self.save()
+
+    def sort_responses(self, section_name: str, sort_by: str, usage_stats: Dict[str, int]) -> bool:
+        """Ordena respostas por critério especificado"""
+        if section_name not in self.data:
+            return False
+            
+        responses = self.data[section_name]
+        
+        if sort_by == "alphabetical":
+            responses.sort(key=lambda x: x["texto"].lower())
+        elif sort_by == "creation":
+            responses.sort(key=lambda x: x.get("data", ""))
+        elif sort_by == "usage":
+            responses.sort(key=lambda x: usage_stats.get(x["texto"], 0), reverse=True)
+            
+        self._notify(RESPONSES_RESET, section_name)
+        return self.save()
+
+    def export_data(self, file_path: str, section_name: Optional[str] = None) -> bool:
+        """Exporta dados para arquivo"""
+        try:
+            if section_name and section_name in self.data:
+                export_data = {section_name: self.data[section_name]}
+            else:
+                export_data = self.data
+                
+            with open(file_path, 'w', encoding='utf-8') as f:
+                if file_path.endswith('.json'):
+                    json.dump(export_data, f, ensure_ascii=False, indent=4)
+                else:  # .txt
+                    for section, responses in export_data.items():
+                        f.write(f"=== {section} ===\n\n")
+                        for response in responses:
+                            f.write(f"{response['texto']}\n\n")
+                        f.write("\n" + "="*50 + "\n\n")
+            return True
+        except IOError:
+            return False
+
+    def import_data(self, file_path: str) -> bool:
+        """Importa dados de arquivo"""
+        try:
+            if file_path.endswith('.json'):
+                imported_data = safe_json_load(file_path, {})
+                
+                # Merge com dados existentes
+                for section, responses in imported_data.items():
+                    if section not in self.data:
+                        self.data[section] = []
+                    
+                    existing_texts = {r["texto"] for r in self.data[section]}
+                    for response in responses:
+                        if isinstance(response, str):
+                            response = {
+                                "texto": response, 
+                                "data": datetime.now().isoformat()
+                            }
+                        if response["texto"] not in existing_texts:
+                            self.data[section].append(response)
+                            
+            else:  # .txt
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    
+                # Processar arquivo texto simples
+                if "Geral" not in self.data:
+                    self.data["Geral"] = []
+                    
+                existing_texts = {r["texto"] for r in self.data["Geral"]}
+                lines = [line.strip() for line in content.split('\n') if line.strip()]
+                
+                for line in lines:
+                    if line not in existing_texts and not line.startswith('==='):
+                        self.data["Geral"].append({
+                            "texto": line,
+                            "data": datetime.now().isoformat()
+                        })
+                        
+            self._notify(SECTIONS_RESET)
+            return self.save()
+        except (IOError, json.JSONDecodeError):
+            return False
@@ -0,0 +1,100 @@
+"""
+Índice de busca das respostas (paleta de busca rápida)
+
+Os textos são normalizados uma vez (minúsculas, sem acentos: "ola" encontra
+"Olá") e a busca é por substring de todos os termos. Alterações no
+DataManager só marcam o índice como desatualizado; a remontagem reaproveita
+os textos já normalizados, então custa uma passada de consultas a dict.
+"""
+
+import heapq
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from .data import DataChange, DataManager
+
+
+def fold(text: str) -> str:
+    """Texto em minúsculas e sem acentos, para comparação"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class SearchIndex:
+    """Busca incremental nas respostas de todas as seções"""
+
+    def __init__(self, data_manager: DataManager):
+        self.data_manager = data_manager
+        # (seção, texto, texto normalizado), na ordem da biblioteca
+        self.entries: List[Tuple[str, str, str]] = []
+        self._folded: Dict[str, str] = {}
+        self._stale = True
+        # Última consulta e todos os seus resultados (ver search)
+        self._last_query: Optional[str] = None
+        self._last_matches: List[Tuple[str, str, str]] = []
+        data_manager.add_listener(self._on_data_changed)
+
+    def _on_data_changed(self, change: DataChange) -> None:
+        self._stale = True
+
+    def rebuild(self) -> None:
+        """Remonta as entradas a partir do DataManager"""
+        folded_cache = self._folded
+        folded: Dict[str, str] = {}
+        entries = []
+        for section, responses in self.data_manager.data.items():
+            for response in responses:
+                text = response["texto"]
+                key = folded.get(text)
+                if key is None:
+                    key = folded_cache.get(text)
+                    if key is None:
+                        key = fold(text)
+                    folded[text] = key
+                entries.append((section, text, key))
+        # Só textos ainda presentes: o cache não cresce com respostas removidas
+        self._folded = folded
+        self.entries = entries
+        self._stale = False
+        self._last_query = None
+        self._last_matches = []
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """
+        Retorna (seção, texto) das respostas que contêm todos os termos de `query`
+
+        Respostas em que o primeiro termo aparece mais cedo vêm primeiro; no
+        empate, vale a ordem da biblioteca. Ao digitar (consulta que estende a
+        anterior), só os resultados anteriores são examinados.
+        """
+        if self._stale:
+            self.rebuild()
+        folded_query = fold(query)
+        terms = folded_query.split()
+        if not terms:
+            self._last_query = None
+            return [(section, text) for section, text, _ in self.entries[:limit]]
+
+        if self._last_query is not None and folded_query.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = self.entries
+        if len(terms) == 1:
+            term = terms[0]
+            matches = [entry for entry in candidates if term in entry[2]]
+        else:
+            matches = [entry for entry in candidates if all(term in entry[2] for term in terms)]
+        self._last_query = folded_query
+        self._last_matches = matches
+
+        first = terms[0]
+
+        def rank(entry: Tuple[str, str, str]) -> int:
+            return entry[2].find(first)
+
+        # nsmallest equivale a sorted()[:limit] (estável), sem ordenar tudo
+        if limit is None:
+            ranked = sorted(matches, key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, matches, key=rank)
+        return [(section, text) for section, text, _ in ranked]
@@ -0,0 +1,116 @@
+"""
+Estatísticas de uso das respostas
+"""
+
+import heapq
+import os
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import load_json_cached
+from .storage import safe_json_load, safe_json_save
+
+class StatsManager:
+    """Gerenciador de estatísticas de uso"""
+    
+    # Tamanho do ranking mantido incrementalmente (menus de cópia rápida)
+    TOP_SIZE = 20
+    
+    def __init__(self, stats_file: str):
+        self.stats_file = stats_file
+        self.stats = self._load_stats()
+        self._top: Optional[List[Tuple[str, int]]] = None
+        # Muda quando a ordem ou os itens do ranking mudam (não a cada cópia)
+        self.top_version = 0
+
+    def _load_stats(self) -> Dict[str, Any]:
+        """Carrega estatísticas do arquivo"""
+        default_stats = {
+            "response_usage": {},  # {texto: count}
+            "section_usage": {},   # {section: count}
+            "total_copies": 0,
+            "daily_usage": {},     # {date: count}
+            "created_responses": 0,
+            "deleted_responses": 0
+        }
+        
+        try:
+            stats = load_json_cached(self.stats_file)
+        except (OSError, ValueError):
+            # Ausente ou fora do UTF-8: leitura tolerante
+            stats = safe_json_load(self.stats_file, default_stats)
+        
+        # Salvar default se arquivo não existia
+        if not os.path.exists(self.stats_file):
+            safe_json_save(self.stats_file, default_stats)
+            
+        return stats
+
+    def save_stats(self) -> bool:
+        """Salva estatísticas no arquivo"""
+        return safe_json_save(self.stats_file, self.stats)
+
+    def record_copy(self, text: str, section: str) -> None:
+        """Registra uma cópia de resposta"""
+        self.stats["total_copies"] += 1
+        count = self.stats["response_usage"][text] = self.stats["response_usage"].get(text, 0) + 1
+        self._update_top(text, count)
+        self.stats["section_usage"][section] = self.stats["section_usage"].get(section, 0) + 1
+        
+        today = datetime.now().strftime("%Y-%m-%d")
+        self.stats["daily_usage"][today] = self.stats["daily_usage"].get(today, 0) + 1
+        
+        self.save_stats()
+
+    def record_response_created(self) -> None:
+        """Registra criação de resposta"""
+        self.stats["created_responses"] += 1
+        self.save_stats()
+
+    def record_response_deleted(self) -> None:
+        """Registra remoção de resposta"""
+        self.stats["deleted_responses"] += 1
+        self.save_stats()
+
+    def top_responses(self, limit: int = TOP_SIZE) -> List[Tuple[str, int]]:
+        """
+        Retorna (texto, uso) das `limit` respostas mais usadas (até TOP_SIZE)
+        
+        O ranking é montado uma vez e depois atualizado a cada cópia, sem
+        reordenar todo o histórico de uso.
+        """
+        if self._top is None:
+            self._top = heapq.nlargest(self.TOP_SIZE, self.stats["response_usage"].items(),
+                                       key=itemgetter(1))
+        return self._top[:limit]
+
+    def _update_top(self, text: str, count: int) -> None:
+        """Ajusta o ranking após `text` passar a ter `count` usos (sempre +1)"""
+        top = self._top
+        if top is None:
+            return
+        for index, (top_text, _) in enumerate(top):
+            if top_text == text:
+                top[index] = (text, count)
+                break
+        else:
+            # Fora do ranking: entra se houver vaga ou se passou o último
+            if len(top) < self.TOP_SIZE:
+                top.append((text, count))
+            elif count > top[-1][1]:
+                top[-1] = (text, count)
+            else:
+                return
+            index = len(top) - 1
+            self.top_version += 1
+        
+        while index > 0 and top[index - 1][1] < count:
+            top[index - 1], top[index] = top[index], top[index - 1]
+            index -= 1
+            self.top_version += 1
+
+    def get_most_used_responses(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Retorna lista de (texto, uso) das respostas mais usadas"""
+        return sorted(self.stats["response_usage"].items(), 
+                     key=lambda x: x[1], reverse=True)[:limit]
@@ -0,0 +1,134 @@
+"""
+Leitura e gravação tolerantes a falhas dos arquivos JSON do FCTBI
+"""
+
+import json
+import os
+from typing import Any
+
+def clean_corrupted_file(file_path: str, default_data: Any) -> bool:
+    """
+    Limpa arquivo corrompido e recria com dados padrão
+    
+    Args:
+        file_path: Caminho do arquivo
+        default_data: Dados padrão para recriar
+        
+    Returns:
+        True se limpou com sucesso, False caso contrário
+    """
+    # shutil só é necessário neste caso raro; importar aqui poupa a inicialização
+    import shutil
+    
+    try:
+        # Fazer backup do arquivo corrompido
+        if os.path.exists(file_path):
+            backup_path = f"{file_path}.corrupted_backup"
+            shutil.copy2(file_path, backup_path)
+            print(f"Backup do arquivo corrompido criado: {backup_path}")
+        
+        # Remover arquivo corrompido
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        
+        # Recriar com dados padrão
+        return safe_json_save(file_path, default_data)
+    except Exception as e:
+        print(f"Erro ao limpar arquivo {file_path}: {e}")
+        return False
+
+def safe_json_load(file_path: str, default_data: Any) -> Any:
+    """
+    Carrega dados JSON de forma segura
+    
+    Args:
+        file_path: Caminho do arquivo
+        default_data: Dados padrão em caso de erro
+        
+    Returns:
+        Dados carregados ou dados padrão
+    """
+    try:
+        if not os.path.exists(file_path):
+            return default_data
+        
+        # Tentar diferentes codificações
+        encodings = ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be', 'latin-1', 'cp1252']
+        
+        for encoding in encodings:
+            try:
+                with open(file_path, 'r', encoding=encoding) as f:
+                    return json.load(f)
+            except UnicodeDecodeError:
+                continue
+            except json.JSONDecodeError:
+                continue
+        
+        # Se nenhuma codificação funcionou, tentar ler como bytes e detectar
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+                # Tentar detectar BOM
+                if content.startswith(b'\xff\xfe'):
+                    # UTF-16 LE
+                    return json.loads(content.decode('utf-16-le'))
+                elif content.startswith(b'\xfe\xff'):
+                    # UTF-16 BE
+                    return json.loads(content.decode('utf-16-be'))
+                elif content.startswith(b'\xef\xbb\xbf'):
+                    # UTF-8 with BOM
+                    return json.loads(content.decode('utf-8-sig'))
+                else:
+                    # Tentar UTF-8 sem BOM
+                    return json.loads(content.decode('utf-8'))
+        except:
+            pass
+            
+        print(f"Erro ao carregar {file_path}: não foi possível decodificar o arquivo")
+        
+        # Tentar limpar o arquivo corrompido
+        if clean_corrupted_file(file_path, default_data):
+            print(f"Arquivo {file_path} foi limpo e recriado com dados padrão")
+        
+        return default_data
+        
+    except Exception as e:
+        print(f"Erro ao carregar {file_path}: {e}")
+        
+        # Tentar limpar o arquivo corrompido
+        if clean_corrupted_file(file_path, default_data):
+            print(f"Arquivo {file_path} foi limpo e recriado com dados padrão")
+        
+        return default_data
+
+def safe_json_save(file_path: str, data: Any) -> bool:
+    """
+    Salva dados JSON de forma segura
+    
+    Args:
+        file_path: Caminho do arquivo
+        data: Dados para salvar
+        
+    Returns:
+        True se salvou com sucesso, False caso contrário
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        
+        # Salvar com encoding UTF-8 explícito
+        with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        
+        # Verificar se o arquivo foi salvo corretamente
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                json.load(f)
+        except:
+            # Se não conseguiu ler, tentar recriar o arquivo
+            with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+                
+        return True
+    except Exception as e:
+        print(f"Erro ao salvar {file_path}: {e}")
+        return False
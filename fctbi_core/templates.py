@@ -0,0 +1,241 @@
+"""
+Modelos nas respostas: variáveis e inclusão de outras respostas
+
+Sintaxe:
+    {nome}              variável; sem valor, o app pergunta ao copiar
+    {data}, {hora}      data (dd/mm/aaaa) e hora (hh:mm) do momento da cópia
+    {clipboard}         conteúdo atual da área de transferência
+    {incluir:<id>}      texto de outra resposta (id: ver response_id)
+    {{ e }}             chaves literais
+
+Só respostas marcadas como modelo ("modelo": true, ver
+DataManager.set_template) são expandidas; as demais, inclusive quando
+incluídas por um modelo, entram como estão. Textos gravados antes dos
+modelos (com "{0}", "{protocolo}" ou "{{") continuam sendo copiados sem
+alteração e sem perguntas.
+
+Em respostas HTML os valores das variáveis passam por escape_html antes de
+entrar no texto (um nome como "A&B <Ltda>" não quebra nem injeta marcação).
+
+Cada texto é compilado uma vez em um Template (partes fixas e marcadores) e
+guardado em cache pelo próprio texto; respostas sem "{" nem "}" nem chegam a
+passar pela expressão regular. Inclusões são resolvidas na expansão, então
+um Template nunca fica desatualizado: alterações no DataManager só descartam
+o mapa de ids e os modelos de textos que saíram da biblioteca.
+"""
+
+import re
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from .data import (
+    DataChange, DataManager, response_id,
+    RESPONSE_CHANGED, RESPONSE_REMOVED, RESPONSES_RESET, SECTION_REMOVED, SECTIONS_RESET,
+)
+
+BUILTIN_VARIABLES = frozenset({"data", "hora", "clipboard"})
+INCLUDE = "incluir"
+
+_TOKEN = re.compile(r"\{\{|\}\}|\{(\w+)(?::(\w+))?\}")
+
+# Parte de um modelo: texto fixo, ("var", nome) ou ("include", id)
+Part = Union[str, Tuple[str, str]]
+
+
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;",
+                                '"': "&quot;", "'": "&#x27;"})
+
+
+def escape_html(value: str) -> str:
+    """Escapa &, <, >, aspas e apóstrofos (o módulo html fica fora do executável)"""
+    return value.translate(_HTML_ESCAPES)
+
+
+class TemplateError(ValueError):
+    """Inclusão inexistente ou circular"""
+
+
+class Template:
+    """Resposta compilada em partes fixas e marcadores"""
+
+    __slots__ = ("source", "parts", "variables", "includes")
+
+    def __init__(self, source: str, parts: Tuple[Part, ...],
+                 variables: FrozenSet[str] = frozenset(), includes: Tuple[str, ...] = ()):
+        self.source = source
+        self.parts = parts
+        self.variables = variables
+        self.includes = includes
+
+    @property
+    def is_static(self) -> bool:
+        """True se a expansão é o próprio texto (sem marcadores nem chaves duplas)"""
+        return self.parts == (self.source,) or not self.source
+
+
+def compile_template(text: str) -> Template:
+    """Separa `text` em partes fixas e marcadores"""
+    if "{" not in text and "}" not in text:
+        return Template(text, (text,))
+
+    parts: List[Part] = []
+    literal: List[str] = []
+    variables: Set[str] = set()
+    includes: List[str] = []
+    position = 0
+    for match in _TOKEN.finditer(text):
+        literal.append(text[position:match.start()])
+        position = match.end()
+        token = match.group(0)
+        if token in ("{{", "}}"):
+            literal.append(token[0])
+            continue
+        name, argument = match.group(1), match.group(2)
+        if argument is not None and name != INCLUDE:
+            literal.append(token)  # "{algo:coisa}" não é marcador
+            continue
+        if literal:
+            parts.append("".join(literal))
+            literal = []
+        if argument is not None:
+            parts.append(("include", argument))
+            includes.append(argument)
+        else:
+            parts.append(("var", name))
+            variables.add(name)
+    literal.append(text[position:])
+    if "".join(literal):
+        parts.append("".join(literal))
+    return Template(text, tuple(parts), frozenset(variables), tuple(includes))
+
+
+class TemplateEngine:
+    """Cache de modelos compilados e expansão das respostas de um DataManager"""
+
+    def __init__(self, data_manager: DataManager):
+        self.data_manager = data_manager
+        self._templates: Dict[str, Template] = {}
+        self._ids: Optional[Dict[str, Dict]] = None
+        self._prune = False
+        data_manager.add_listener(self._on_data_changed)
+
+    def _on_data_changed(self, change: DataChange) -> None:
+        self._ids = None
+        if change.kind in (RESPONSE_CHANGED, RESPONSE_REMOVED, RESPONSES_RESET,
+                           SECTION_REMOVED, SECTIONS_RESET):
+            # Editadas e removidas: modelos antigos saem do cache na próxima consulta
+            self._prune = True
+
+    def _responses_by_id(self) -> Dict[str, Dict]:
+        if self._ids is None:
+            self._ids = {response_id(response["texto"]): response
+                         for responses in self.data_manager.data.values()
+                         for response in responses}
+        return self._ids
+
+    def get(self, text: str) -> Template:
+        """Modelo compilado de `text` (compilado na primeira chamada)"""
+        if self._prune:
+            live = {response["texto"] for responses in self.data_manager.data.values()
+                    for response in responses}
+            self._templates = {t: template for t, template in self._templates.items() if t in live}
+            self._prune = False
+        template = self._templates.get(text)
+        if template is None:
+            template = self._templates[text] = compile_template(text)
+        return template
+
+    def _resolve(self, item_id: str, chain: List[str]) -> Template:
+        if item_id in chain:
+            cycle = " → ".join(chain[chain.index(item_id):] + [item_id])
+            raise TemplateError(f"Inclusão circular: {cycle}")
+        response = self._responses_by_id().get(item_id)
+        if response is None:
+            raise TemplateError(f"Resposta incluída não encontrada: {item_id}")
+        if not response.get("modelo"):
+            # Resposta comum: entra literalmente, chaves e tudo
+            return Template(response["texto"], (response["texto"],))
+        return self.get(response["texto"])
+
+    def variables(self, text: str) -> Set[str]:
+        """
+        Variáveis usadas por `text` e pelas respostas que ele inclui
+
+        Raises:
+            TemplateError: Inclusão inexistente ou circular
+        """
+        names: Set[str] = set()
+
+        def visit(template: Template, chain: List[str]) -> None:
+            names.update(template.variables)
+            for item_id in template.includes:
+                visit(self._resolve(item_id, chain), chain + [item_id])
+
+        visit(self.get(text), [response_id(text)])
+        return names
+
+    def missing_variables(self, text: str, values: Dict[str, str]) -> List[str]:
+        """Variáveis sem valor em `values` (nem automáticas), em ordem alfabética"""
+        return sorted(self.variables(text) - BUILTIN_VARIABLES - set(values))
+
+    def render(self, text: str, values: Optional[Dict[str, str]] = None,
+               now: Optional[datetime] = None,
+               escape: Optional[Callable[[str], str]] = None) -> str:
+        """
+        Expande `text`; variáveis sem valor ficam como estão ("{nome}")
+
+        Args:
+            values: Valores das variáveis, inclusive "clipboard" se usada
+            now: Momento usado em {data} e {hora} (padrão: agora)
+            escape: Aplicado a cada valor inserido (escape_html em respostas HTML)
+
+        Raises:
+            TemplateError: Inclusão inexistente ou circular
+        """
+        template = self.get(text)
+        if template.is_static:
+            return text
+        now = now or datetime.now()
+        context = {"data": now.strftime("%d/%m/%Y"), "hora": now.strftime("%H:%M")}
+        context.update(values or {})
+        if escape is not None:
+            context = {name: escape(value) for name, value in context.items()}
+        output: List[str] = []
+
+        def expand(template: Template, chain: List[str]) -> None:
+            for part in template.parts:
+                if isinstance(part, str):
+                    output.append(part)
+                elif part[0] == "var":
+                    output.append(context.get(part[1], "{" + part[1] + "}"))
+                else:
+                    expand(self._resolve(part[1], chain), chain + [part[1]])
+
+        expand(template, [response_id(text)])
+        return "".join(output)
+
+    def retarget_includes(self, old_text: str, new_text: str,
+                          _seen: Optional[Set[str]] = None) -> int:
+        """
+        Atualiza inclusões de `old_text` para `new_text` após uma edição
+
+        O id de uma resposta vem do texto, então editar a resposta mudaria
+        o id usado em {incluir:...}; quem a inclui também muda de texto e é
+        atualizado em cadeia. Só modelos são alterados. Retorna quantas
+        respostas foram alteradas.
+        """
+        seen = _seen if _seen is not None else {response_id(old_text)}
+        old_token = "{%s:%s}" % (INCLUDE, response_id(old_text))
+        new_token = "{%s:%s}" % (INCLUDE, response_id(new_text))
+        changed = [(section, response["texto"])
+                   for section, responses in self.data_manager.data.items()
+                   for response in responses
+                   if response.get("modelo") and old_token in response["texto"]
+                   and response_id(response["texto"]) not in seen]
+        count = 0
+        for section, text in changed:
+            seen.add(response_id(text))
+            updated = text.replace(old_token, new_token)
+            if self.data_manager.edit_response(section, text, updated):
+                count += 1 + self.retarget_includes(text, updated, seen)
+        return count
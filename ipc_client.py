@@ -0,0 +1,137 @@
+"""
+Cliente leve do servidor de comandos do FCTBI
+
+Conversa com a instância em execução pelo mesmo socket local usado pela
+instância única (QLocalServer), sem importar PyQt5: uma ida e volta custa
+poucos milissegundos, em vez do tempo de iniciar o Qt.
+
+Protocolo: uma linha JSON por mensagem. Pedidos com a chave "command"
+recebem uma linha JSON de resposta com "ok" e, em caso de erro, "error".
+
+Uso:
+    python ipc_client.py search "texto" [--limit 10]
+    python ipc_client.py copy --id 1a2b3c4d5e [--var nome=Ana]
+    python ipc_client.py copy --query "texto"
+    python ipc_client.py add "Seção" "Texto da resposta"
+    python ipc_client.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Igual a fctbi_core.config.DEFAULT_APP_DATA_DIR, repetido para que o cliente
+# inicie sem importar o núcleo (dados, estatísticas, busca, modelos)
+DEFAULT_DATA_DIR = Path.home() / "Documents" / "FCTBI_data"
+
+
+class InstanceNotRunning(Exception):
+    """Nenhuma instância do FCTBI está escutando"""
+
+
+def server_name(data_dir: Path = DEFAULT_DATA_DIR) -> str:
+    """Nome do socket local da instância (um por usuário e diretório de dados)"""
+    digest = hashlib.sha1(str(Path(data_dir).resolve()).encode("utf-8")).hexdigest()
+    return f"fctbi-{digest[:12]}"
+
+
+def socket_path(name: str) -> str:
+    """Caminho do socket criado pelo QLocalServer para `name`"""
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{name}"
+    # QDir::tempPath() no Unix: $TMPDIR ou /tmp
+    temp_dir = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(temp_dir.rstrip("/") or "/", name)
+
+
+def _read_line(stream) -> bytes:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("conexão encerrada sem resposta")
+    return line
+
+
+def send_command(command: Dict[str, Any], data_dir: Path = DEFAULT_DATA_DIR,
+                 timeout: float = 2.0) -> Dict[str, Any]:
+    """
+    Envia um comando à instância em execução e retorna a resposta
+
+    Raises:
+        InstanceNotRunning: Se não houver instância escutando
+    """
+    payload = json.dumps(command, ensure_ascii=False).encode("utf-8") + b"\n"
+    path = socket_path(server_name(data_dir))
+
+    if sys.platform == "win32":
+        try:
+            with open(path, "r+b", buffering=0) as pipe:
+                pipe.write(payload)
+                return json.loads(_read_line(pipe).decode("utf-8"))
+        except FileNotFoundError as e:
+            raise InstanceNotRunning(path) from e
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise InstanceNotRunning(path) from e
+        sock.sendall(payload)
+        with sock.makefile("rb") as stream:
+            return json.loads(_read_line(stream).decode("utf-8"))
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="fctbi-ipc",
+                                     description="Envia comandos ao FCTBI em execução")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR,
+                        help="diretório de dados da instância (padrão: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=2.0)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="busca respostas")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+
+    copy = commands.add_parser("copy", help="copia uma resposta para a área de transferência")
+    target = copy.add_mutually_exclusive_group(required=True)
+    target.add_argument("--id", dest="id")
+    target.add_argument("--query")
+    copy.add_argument("--var", action="append", default=[], metavar="NOME=VALOR",
+                      help="valor de uma variável do modelo (pode repetir)")
+
+    add = commands.add_parser("add", help="adiciona uma resposta")
+    add.add_argument("section")
+    add.add_argument("text")
+
+    commands.add_parser("stats", help="estatísticas de uso")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_arguments(argv)
+    command = {key: value for key, value in vars(args).items()
+               if key not in ("data_dir", "timeout", "var") and value is not None}
+    if getattr(args, "var", None):
+        command["values"] = dict(item.partition("=")[::2] for item in args.var)
+    try:
+        reply = send_command(command, args.data_dir, args.timeout)
+    except InstanceNotRunning:
+        print("FCTBI não está em execução", file=sys.stderr)
+        return 2
+    except (OSError, ValueError) as e:
+        print(f"Erro de comunicação: {e}", file=sys.stderr)
+        return 1
+
+    json.dump(reply, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
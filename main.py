@@ -8,61 +8,55 @@ Versão: 2.0 - Otimizada com boas práticas
 """
 
 import sys
+import time
+
+# Referência das fases do --startup-trace (inclui a importação do PyQt5)
+_IMPORT_START = time.perf_counter()
+
 import json
 import os
-import shutil
-from datetime import datetime
+import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from collections import OrderedDict
+from bisect import bisect_right
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QInputDialog, QMenu,
     QAction, QSystemTrayIcon, QStyle, QLabel, QScrollArea, QHBoxLayout,
     QMessageBox, QLineEdit, QMainWindow, QSizePolicy, QShortcut,
     QTextEdit, QTextBrowser, QDialog, QCheckBox, QSpinBox, QFormLayout, QGroupBox,
-    QFileDialog, QProgressBar, QSplitter, QFrame, QToolTip, QComboBox
+    QFileDialog, QProgressBar, QSplitter, QFrame, QToolTip, QComboBox, QButtonGroup,
+    QStackedWidget, QStyleOptionButton, QStylePainter, QListWidget, QListWidgetItem,
+    QActionGroup
 )
 from PyQt5.QtGui import (
     QIcon, QPainter, QColor, QFontDatabase, QFont,
-    QCursor, QDrag, QPixmap, QMouseEvent, QKeySequence, QPen
+    QCursor, QDrag, QPixmap, QMouseEvent, QKeySequence, QPen, QPalette, QRegion,
+    QPainterPath, QStaticText, QFontMetrics, QTransform, QTextDocument
 )
 from PyQt5.QtCore import (
     Qt, QSize, QPropertyAnimation, QEasingCurve, QTimer,
-    pyqtProperty, QPoint, QMimeData, QRect, pyqtSignal
+    pyqtProperty, QPoint, QPointF, QMimeData, QRect, QRectF, pyqtSignal, QEvent,
+    QObject, QThread
 )
-
-# Importação de validação de seções
-from special_effects import validate_section_name
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+# Dados, estatísticas e configurações (sem Qt), reexportados por este módulo
+from fctbi_core import (
+    AppConfig, BUILTIN_VARIABLES, CONFIG, ConfigManager, DataChange, DataManager, SearchIndex,
+    StatsManager, TemplateError, escape_html, FORMAT_TEXT, FORMAT_HTML, RESPONSE_FORMATS,
+    clean_corrupted_file, response_id, safe_json_load, safe_json_save,
+    RESPONSE_INSERTED, RESPONSE_REMOVED, RESPONSE_MOVED, RESPONSE_CHANGED,
+    RESPONSES_RESET, SECTION_INSERTED, SECTION_REMOVED, SECTION_RENAMED,
+    SECTION_MOVED, SECTIONS_RESET,
+)
+from ipc_client import server_name
 
 # =============================================================================
 # CONSTANTES E CONFIGURAÇÕES
 # =============================================================================
 
-@dataclass
-class AppConfig:
-    """Configurações da aplicação"""
-    APP_DATA_DIR: Path = field(default_factory=lambda: Path.home() / "Documents" / "FCTBI_data")
-    DATA_FILE: str = field(init=False)
-    BACKUP_FILE: str = field(init=False)
-    CONFIG_FILE: str = field(init=False)
-    STATS_FILE: str = field(init=False)
-    FONT_FILE: str = "BLMelody-Regular.otf"
-    APP_FONT_NAME: str = "BL Melody Regular"
-    WINDOW_WIDTH: int = 480
-    WINDOW_HEIGHT: int = 720
-    MIN_WINDOW_WIDTH: int = 420
-    MIN_WINDOW_HEIGHT: int = 580
-    
-    def __post_init__(self):
-        self.DATA_FILE = str(self.APP_DATA_DIR / "respostas.json")
-        self.BACKUP_FILE = str(self.APP_DATA_DIR / "respostas_backup.json")
-        self.CONFIG_FILE = str(self.APP_DATA_DIR / "config.json")
-        self.STATS_FILE = str(self.APP_DATA_DIR / "stats.json")
-
-# Instância global de configuração
-CONFIG = AppConfig()
-
 # Temas modernizados
 THEMES = {
     "light": {
@@ -94,39 +88,12 @@ THEMES = {
         "HOVER_BG": "#334155"           # Slate 700
     }
 }
+BUILTIN_THEMES = tuple(THEMES)
 
 # =============================================================================
 # UTILITÁRIOS
 # =============================================================================
 
-def clean_corrupted_file(file_path: str, default_data: Any) -> bool:
-    """
-    Limpa arquivo corrompido e recria com dados padrão
-    
-    Args:
-        file_path: Caminho do arquivo
-        default_data: Dados padrão para recriar
-        
-    Returns:
-        True se limpou com sucesso, False caso contrário
-    """
-    try:
-        # Fazer backup do arquivo corrompido
-        if os.path.exists(file_path):
-            backup_path = f"{file_path}.corrupted_backup"
-            shutil.copy2(file_path, backup_path)
-            print(f"Backup do arquivo corrompido criado: {backup_path}")
-        
-        # Remover arquivo corrompido
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        
-        # Recriar com dados padrão
-        return safe_json_save(file_path, default_data)
-    except Exception as e:
-        print(f"Erro ao limpar arquivo {file_path}: {e}")
-        return False
-
 def resource_path(relative_path: str) -> str:
     """
     Obtém o caminho absoluto para o recurso, funciona para dev e para PyInstaller
@@ -143,451 +110,675 @@ def resource_path(relative_path: str) -> str:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def safe_json_load(file_path: str, default_data: Any) -> Any:
+# =============================================================================
+# TEMAS E FOLHAS DE ESTILO
+# =============================================================================
+
+# Caches por nome de tema: a QSS é montada uma única vez por tema
+_STYLESHEET_CACHE: Dict[str, str] = {}
+_PALETTE_CACHE: Dict[str, QPalette] = {}
+# Temas do usuário carregados: {nome: mtime do arquivo}
+_USER_THEME_MTIMES: Dict[str, float] = {}
+
+def build_stylesheet(theme: Dict[str, str]) -> str:
     """
-    Carrega dados JSON de forma segura
+    Monta a folha de estilos (QSS) da janela principal para um tema
     
     Args:
-        file_path: Caminho do arquivo
-        default_data: Dados padrão em caso de erro
+        theme: Dicionário de cores do tema
         
     Returns:
-        Dados carregados ou dados padrão
+        Folha de estilos completa
+    """
+    return f"""
+        #centralWidget {{
+            background-color: {theme['BACKGROUND']};
+            border: 3px solid {theme['PRIMARY_COLOR']};
+            border-radius: 16px;
+        }}
+        #titleBar {{ 
+            background-color: transparent; 
+            border-bottom: 1px solid {theme['BORDER_COLOR']};
+        }}
+        #titleLabel {{
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            color: {theme['PRIMARY_COLOR']};
+            font-size: 18px;
+            font-weight: bold;
+            letter-spacing: 0.5px;
+        }}
+        #titleButton {{
+            background-color: transparent;
+            color: {theme['PRIMARY_COLOR']};
+            border: none;
+            font-size: 16px;
+            font-weight: bold;
+            min-width: 32px;
+            min-height: 32px;
+            border-radius: 8px;
+        }}
+        #titleButton:hover {{ 
+            background-color: {theme['HOVER_BG']}; 
+        }}
+        #searchBar {{ 
+            background-color: transparent; 
+            padding: 8px 0;
+        }}
+        #searchInput {{
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 12px;
+            padding: 10px 16px;
+            font-size: 13px;
+            background-color: {theme['BACKGROUND']};
+            color: {theme['TEXT_COLOR']};
+            font-family: "{CONFIG.APP_FONT_NAME}";
+        }}
+        #searchInput:focus {{ 
+            border-color: {theme['PRIMARY_COLOR']}; 
+        }}
+        #clearSearchButton {{
+            background-color: {theme['SECONDARY_COLOR']};
+            color: {theme['TEXT_COLOR']};
+            border: none;
+            border-radius: 10px;
+            font-size: 12px;
+            font-weight: bold;
+        }}
+        #clearSearchButton:hover {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+        }}
+        QComboBox {{
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 10px;
+            padding: 8px 12px;
+            background-color: {theme['BACKGROUND']};
+            color: {theme['TEXT_COLOR']};
+            min-width: 110px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            font-size: 12px;
+        }}
+        QComboBox:hover {{
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        QComboBox:focus {{
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        QComboBox::drop-down {{
+            border: none;
+            width: 20px;
+        }}
+        QComboBox::down-arrow {{
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 5px solid {theme['TEXT_COLOR']};
+            margin-right: 8px;
+        }}
+        #sectionsContainer {{ 
+            background-color: transparent; 
+            border-bottom: 1px solid {theme['BORDER_COLOR']}; 
+            padding: 8px 0;
+        }}
+        #addSectionButton, #importButton, #exportButton {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+            border: none;
+            border-radius: 12px;
+            font-weight: bold;
+            font-size: 13px;
+            min-width: 32px;
+            min-height: 32px;
+        }}
+        #addSectionButton:hover, #importButton:hover, #exportButton:hover {{ 
+            background-color: {theme['ACCENT_COLOR']}; 
+        }}
+        #addSectionButton {{
+            color: white !important;
+        }}
+        QPushButton#sectionButton {{
+            background-color: {theme['SECONDARY_COLOR']};
+            color: {theme['TEXT_COLOR']};
+            border: 2px solid {theme['BORDER_COLOR']};
+            padding: 8px 14px;
+            border-radius: 12px;
+            font-size: 12px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            min-width: 70px;
+        }}
+        QPushButton#sectionButton:hover {{ 
+            background-color: {theme['HOVER_BG']}; 
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        QPushButton#sectionButton:checked {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+            font-weight: bold;
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        #contentContainer {{ 
+            background-color: transparent; 
+            padding: 8px 0;
+        }}
+        #sectionInfo {{
+            color: {theme['TEXT_COLOR']};
+            font-size: 12px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            margin: 8px 0;
+            opacity: 0.8;
+            font-weight: 500;
+        }}
+        QPushButton#responseButton {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+            border: none;
+            padding: 14px 16px;
+            text-align: left;
+            border-radius: 10px;
+            font-size: 13px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+        }}
+        QPushButton#responseButton:hover {{ 
+            background-color: {theme['ACCENT_COLOR']}; 
+        }}
+        QPushButton#menuButton {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+            border: none;
+            border-radius: 10px;
+            min-width: 32px;
+            max-width: 32px;
+            font-weight: bold;
+            font-size: 16px;
+        }}
+        QPushButton#menuButton:hover {{ 
+            background-color: {theme['ACCENT_COLOR']}; 
+        }}
+        QPushButton#menuButton::menu-indicator {{ 
+            image: none; 
+        }}
+        QPushButton#arrowButton {{
+            background-color: {theme['SECONDARY_COLOR']};
+            color: {theme['TEXT_COLOR']};
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 10px;
+            font-weight: bold;
+            font-size: 12px;
+        }}
+        QPushButton#arrowButton:hover {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        QPushButton#arrowButton:disabled {{
+            background-color: {theme['BORDER_COLOR']};
+            color: {theme['TEXT_COLOR']};
+            opacity: 0.4;
+            border-color: {theme['BORDER_COLOR']};
+        }}
+        #addButton {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white !important;
+            font-weight: bold;
+            border: none;
+            padding: 14px;
+            border-radius: 10px;
+            font-size: 14px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+        }}
+        #addButton:hover {{ 
+            background-color: {theme['ACCENT_COLOR']}; 
+        }}
+        QScrollBar:vertical {{
+            border: none;
+            background: {theme['SECONDARY_COLOR']};
+            width: 10px;
+            margin: 0px;
+            border-radius: 5px;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {theme['BORDER_COLOR']};
+            min-height: 30px;
+            border-radius: 5px;
+            margin: 2px;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background: {theme['PRIMARY_COLOR']};
+        }}
+        QScrollBar:horizontal {{
+            border: none;
+            background: {theme['SECONDARY_COLOR']};
+            height: 10px;
+            margin: 0px;
+            border-radius: 5px;
+        }}
+        QScrollBar::handle:horizontal {{
+            background: {theme['BORDER_COLOR']};
+            min-width: 30px;
+            border-radius: 5px;
+            margin: 2px;
+        }}
+        QScrollBar::handle:horizontal:hover {{
+            background: {theme['PRIMARY_COLOR']};
+        }}
+        #emptyLabel {{
+            color: {theme['TEXT_COLOR']};
+            font-size: 13px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            font-style: italic;
+            opacity: 0.6;
+            text-align: center;
+            padding: 20px;
+        }}
+        QMenu {{
+            background-color: {theme['CARD_BG']};
+            color: {theme['TEXT_COLOR']};
+            border: 1px solid {theme['BORDER_COLOR']};
+            border-radius: 8px;
+            padding: 4px;
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            font-size: 12px;
+        }}
+        QMenu::item {{
+            padding: 8px 12px;
+            border-radius: 4px;
+            margin: 1px;
+        }}
+        QMenu::item:selected {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+        }}
+        QGroupBox {{
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            font-weight: bold;
+            font-size: 13px;
+            color: {theme['PRIMARY_COLOR']};
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 8px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 8px 0 8px;
+        }}
+        #quickLauncher {{
+            background-color: {theme['BACKGROUND']};
+            border: 2px solid {theme['PRIMARY_COLOR']};
+            border-radius: 12px;
+        }}
+        QListWidget#quickResults {{
+            background-color: transparent;
+            border: none;
+            outline: none;
+            color: {theme['TEXT_COLOR']};
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            font-size: 12px;
+        }}
+        QListWidget#quickResults::item {{
+            padding: 6px 8px;
+            border-radius: 6px;
+        }}
+        QListWidget#quickResults::item:selected {{
+            background-color: {theme['PRIMARY_COLOR']};
+            color: white;
+        }}
+        #quickHint {{
+            font-size: 11px;
+            color: {theme['BORDER_COLOR']};
+        }}
+        QDialog {{
+            background-color: {theme['BACKGROUND']};
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 12px;
+        }}
+        QLabel {{
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            color: {theme['TEXT_COLOR']};
+        }}
+        QLineEdit, QTextEdit {{
+            font-family: "{CONFIG.APP_FONT_NAME}";
+            border: 2px solid {theme['BORDER_COLOR']};
+            border-radius: 8px;
+            padding: 8px;
+            background-color: {theme['BACKGROUND']};
+            color: {theme['TEXT_COLOR']};
+        }}
+        QLineEdit:focus, QTextEdit:focus {{
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
+        EnhancedDraggableResponseWidget {{
+            background-color: {theme['CARD_BG']};
+            border: 1px solid {theme['BORDER_COLOR']};
+            border-radius: 8px;
+            margin: 2px 0;
+        }}
+        EnhancedDraggableResponseWidget:hover {{
+            background-color: {theme['HOVER_BG']};
+            border-color: {theme['PRIMARY_COLOR']};
+        }}
     """
-    try:
-        if not os.path.exists(file_path):
-            return default_data
-        
-        # Tentar diferentes codificações
-        encodings = ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be', 'latin-1', 'cp1252']
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return json.load(f)
-            except UnicodeDecodeError:
-                continue
-            except json.JSONDecodeError:
-                continue
-        
-        # Se nenhuma codificação funcionou, tentar ler como bytes e detectar
-        try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-                # Tentar detectar BOM
-                if content.startswith(b'\xff\xfe'):
-                    # UTF-16 LE
-                    return json.loads(content.decode('utf-16-le'))
-                elif content.startswith(b'\xfe\xff'):
-                    # UTF-16 BE
-                    return json.loads(content.decode('utf-16-be'))
-                elif content.startswith(b'\xef\xbb\xbf'):
-                    # UTF-8 with BOM
-                    return json.loads(content.decode('utf-8-sig'))
-                else:
-                    # Tentar UTF-8 sem BOM
-                    return json.loads(content.decode('utf-8'))
-        except:
-            pass
-            
-        print(f"Erro ao carregar {file_path}: não foi possível decodificar o arquivo")
-        
-        # Tentar limpar o arquivo corrompido
-        if clean_corrupted_file(file_path, default_data):
-            print(f"Arquivo {file_path} foi limpo e recriado com dados padrão")
-        
-        return default_data
-        
-    except Exception as e:
-        print(f"Erro ao carregar {file_path}: {e}")
-        
-        # Tentar limpar o arquivo corrompido
-        if clean_corrupted_file(file_path, default_data):
-            print(f"Arquivo {file_path} foi limpo e recriado com dados padrão")
-        
-        return default_data
 
-def safe_json_save(file_path: str, data: Any) -> bool:
+def get_theme_stylesheet(theme_name: str) -> str:
+    """Retorna a QSS do tema, compilada na primeira chamada"""
+    stylesheet = _STYLESHEET_CACHE.get(theme_name)
+    if stylesheet is None:
+        stylesheet = _STYLESHEET_CACHE[theme_name] = build_stylesheet(THEMES[theme_name])
+    return stylesheet
+
+def get_theme_palette(theme_name: str) -> QPalette:
+    """Retorna a QPalette do tema, criada na primeira chamada"""
+    palette = _PALETTE_CACHE.get(theme_name)
+    if palette is None:
+        theme = THEMES[theme_name]
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(theme["BACKGROUND"]))
+        palette.setColor(QPalette.WindowText, QColor(theme["TEXT_COLOR"]))
+        palette.setColor(QPalette.Base, QColor(theme["BACKGROUND"]))
+        palette.setColor(QPalette.AlternateBase, QColor(theme["SECONDARY_COLOR"]))
+        palette.setColor(QPalette.Text, QColor(theme["TEXT_COLOR"]))
+        palette.setColor(QPalette.Button, QColor(theme["SECONDARY_COLOR"]))
+        palette.setColor(QPalette.ButtonText, QColor(theme["TEXT_COLOR"]))
+        palette.setColor(QPalette.Highlight, QColor(theme["PRIMARY_COLOR"]))
+        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+        palette.setColor(QPalette.ToolTipBase, QColor(theme["CARD_BG"]))
+        palette.setColor(QPalette.ToolTipText, QColor(theme["TEXT_COLOR"]))
+        _PALETTE_CACHE[theme_name] = palette
+    return palette
+
+def load_user_themes(themes_dir: str) -> List[str]:
     """
-    Salva dados JSON de forma segura
+    Carrega temas do usuário (arquivos .json) para THEMES
+    
+    Cada arquivo define cores sobre o tema "light"; o nome do tema é o nome
+    do arquivo. Temas alterados desde a última carga têm o cache invalidado.
     
     Args:
-        file_path: Caminho do arquivo
-        data: Dados para salvar
+        themes_dir: Diretório com os arquivos de tema
         
     Returns:
-        True se salvou com sucesso, False caso contrário
+        Nomes dos temas do usuário disponíveis
     """
-    try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Salvar com encoding UTF-8 explícito
-        with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        
-        # Verificar se o arquivo foi salvo corretamente
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-        except:
-            # Se não conseguiu ler, tentar recriar o arquivo
-            with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-                
-        return True
-    except Exception as e:
-        print(f"Erro ao salvar {file_path}: {e}")
-        return False
+    loaded = []
+    for theme_file in sorted(Path(themes_dir).glob("*.json")):
+        name = theme_file.stem
+        if name in BUILTIN_THEMES:
+            print(f"Tema {theme_file} ignorado: nome reservado")
+            continue
+            
+        mtime = theme_file.stat().st_mtime
+        if _USER_THEME_MTIMES.get(name) != mtime:
+            colors = safe_json_load(str(theme_file), None)
+            if not isinstance(colors, dict):
+                print(f"Tema {theme_file} inválido")
+                continue
+            theme = dict(THEMES["light"])
+            theme.update({key: str(value) for key, value in colors.items() if key in theme})
+            THEMES[name] = theme
+            _USER_THEME_MTIMES[name] = mtime
+            _STYLESHEET_CACHE.pop(name, None)
+            _PALETTE_CACHE.pop(name, None)
+        loaded.append(name)
+    return loaded
 
 # =============================================================================
-# GERENCIADORES DE DADOS
+# INICIALIZAÇÃO EM ETAPAS
 # =============================================================================
 
-class ConfigManager:
-    """Gerenciador de configurações da aplicação"""
-    
-    def __init__(self, config_file: str):
-        self.config_file = config_file
-        self.config = self._load_config()
-
-    def _load_config(self) -> Dict[str, Any]:
-        """Carrega configurações do arquivo"""
-        default_config = {
-            "theme": "light",
-            "auto_backup": True,
-            "backup_interval": 60,  # minutos
-            "show_copy_confirmation": True,
-            "play_copy_sound": False,
-            "sort_responses_by": "creation",  # creation, alphabetical, usage
-            "window_position": None,
-            "window_size": [CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT],
-            "minimize_on_focus_loss": True  # Minimizar quando clicar fora
-        }
-        
-        config = safe_json_load(self.config_file, default_config)
-        
-        # Merge com default para garantir todas as chaves
-        for key, value in default_config.items():
-            if key not in config:
-                config[key] = value
-                
-        return config
-
-    def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
-        """Salva configurações no arquivo"""
-        config_to_save = config or self.config
-        if safe_json_save(self.config_file, config_to_save):
-            if config:
-                self.config = config
-            return True
-        return False
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Obtém valor de configuração"""
-        return self.config.get(key, default)
-
-    def set(self, key: str, value: Any) -> None:
-        """Define valor de configuração"""
-        self.config[key] = value
-        self.save_config()
-
-class StatsManager:
-    """Gerenciador de estatísticas de uso"""
-    
-    def __init__(self, stats_file: str):
-        self.stats_file = stats_file
-        self.stats = self._load_stats()
-
-    def _load_stats(self) -> Dict[str, Any]:
-        """Carrega estatísticas do arquivo"""
-        default_stats = {
-            "response_usage": {},  # {texto: count}
-            "section_usage": {},   # {section: count}
-            "total_copies": 0,
-            "daily_usage": {},     # {date: count}
-            "created_responses": 0,
-            "deleted_responses": 0
-        }
-        
-        stats = safe_json_load(self.stats_file, default_stats)
-        
-        # Salvar default se arquivo não existia
-        if not os.path.exists(self.stats_file):
-            safe_json_save(self.stats_file, default_stats)
-            
-        return stats
-
-    def save_stats(self) -> bool:
-        """Salva estatísticas no arquivo"""
-        return safe_json_save(self.stats_file, self.stats)
-
-    def record_copy(self, text: str, section: str) -> None:
-        """Registra uma cópia de resposta"""
-        self.stats["total_copies"] += 1
-        self.stats["response_usage"][text] = self.stats["response_usage"].get(text, 0) + 1
-        self.stats["section_usage"][section] = self.stats["section_usage"].get(section, 0) + 1
-        
-        today = datetime.now().strftime("%Y-%m-%d")
-        self.stats["daily_usage"][today] = self.stats["daily_usage"].get(today, 0) + 1
+class StartupTrace(QObject):
+    """
+    Registra o instante de cada fase da inicialização
+    
+    Com --startup-trace cada fase é impressa em stderr assim que termina,
+    com a duração desde a fase anterior, o total desde a importação e o
+    instante absoluto (time.time(), usado por benchmarks/bench_startup.py).
+    Com --startup-trace=ARQUIVO as linhas vão para o arquivo: executáveis
+    sem console (PyInstaller console=False no Windows) não têm stderr.
+    
+    Quando todas as fases de `interactive_after` terminam, a fase
+    "interactive" é marcada e o sinal `interactive` é emitido.
+    """
+    
+    interactive = pyqtSignal()
+    
+    def __init__(self, enabled: bool = False, start: Optional[float] = None,
+                 path: Optional[str] = None):
+        super().__init__()
+        self.enabled = enabled
+        self.path = path
+        self.start = _IMPORT_START if start is None else start
+        self.phases: List[Tuple[str, float]] = []
+        # Janela pintada e linhas, bandeja e atalhos prontos
+        self.interactive_after = {"first_paint", "deferred"}
+
+    def mark(self, phase: str) -> None:
+        """Marca o fim de uma fase"""
+        now = time.perf_counter()
+        previous = self.phases[-1][1] if self.phases else self.start
+        self.phases.append((phase, now))
+        if self.enabled:
+            line = (f"[startup] {phase:<14} +{(now - previous) * 1000:8.1f} ms "
+                    f"(total {(now - self.start) * 1000:8.1f} ms) @{time.time():.6f}")
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            else:
+                print(line, file=sys.stderr, flush=True)
         
-        self.save_stats()
+        if self.interactive_after and self.interactive_after <= {name for name, _ in self.phases}:
+            self.interactive_after = set()
+            self.mark("interactive")
+            self.interactive.emit()
 
-    def record_response_created(self) -> None:
-        """Registra criação de resposta"""
-        self.stats["created_responses"] += 1
-        self.save_stats()
+    def as_dict(self) -> Dict[str, float]:
+        """Total (ms desde a importação) ao fim de cada fase"""
+        return {phase: round((moment - self.start) * 1000, 3) for phase, moment in self.phases}
 
-    def record_response_deleted(self) -> None:
-        """Registra remoção de resposta"""
-        self.stats["deleted_responses"] += 1
-        self.save_stats()
+    def watch_first_paint(self, widget: QWidget) -> None:
+        """Marca a fase "first_paint" no primeiro paintEvent do widget"""
+        widget.installEventFilter(self)
 
-    def get_most_used_responses(self, limit: int = 10) -> List[Tuple[str, int]]:
-        """Retorna lista de (texto, uso) das respostas mais usadas"""
-        return sorted(self.stats["response_usage"].items(), 
-                     key=lambda x: x[1], reverse=True)[:limit]
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.mark("first_paint")
+        return False
 
-class DataManager:
-    """Gerenciador de dados das respostas"""
+class DataLoadThread(QThread):
+    """Lê e interpreta o arquivo de respostas fora da thread da interface"""
+    
+    loaded = pyqtSignal(object)
     
-    def __init__(self, data_file: str):
+    def __init__(self, data_file: str, parent: Optional[QObject] = None):
+        super().__init__(parent)
         self.data_file = data_file
-        self.data = self._load_data()
 
-    def _load_data(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Carrega dados das respostas"""
-        default_data = {"Geral": []}
-        
-        if not os.path.exists(self.data_file):
-            safe_json_save(self.data_file, default_data)
-            return default_data
-            
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            if not data:
-                return default_data
-                
-            # Migração de formato antigo (lista) para novo (dicionário)
-            if isinstance(data, list):
-                migrated = {
-                    "Geral": [
-                        {"texto": item, "data": datetime.now().isoformat()} 
-                        for item in data
-                    ]
-                }
-                safe_json_save(self.data_file, migrated)
-                return migrated
-                
-            return data
-            
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Erro ao carregar dados: {e}")
-            # Tentar usar backup se existir
-            if os.path.exists(CONFIG.BACKUP_FILE):
-                backup_data = safe_json_load(CONFIG.BACKUP_FILE, default_data)
-                if backup_data != default_data:
-                    return backup_data
-            return default_data
-
-    def save(self) -> bool:
-        """Salva dados no arquivo com backup automático"""
-        try:
-            if os.path.exists(self.data_file): 
-                # Criar backup com timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_name = f"{CONFIG.BACKUP_FILE}_{timestamp}"
-                shutil.copy2(self.data_file, backup_name)
-                
-                # Manter apenas os 5 backups mais recentes
-                backup_dir = Path(self.data_file).parent
-                backup_files = sorted(backup_dir.glob("respostas_backup.json_*"))
-                if len(backup_files) > 5:
-                    for old_backup in backup_files[:-5]:
-                        old_backup.unlink()
-                        
-            return safe_json_save(self.data_file, self.data)
-        except IOError as e:
-            print(f"Erro ao salvar dados: {e}")
-            return False
+    def run(self) -> None:
+        # DataManager não usa Qt, então pode ser criado nesta thread
+        self.loaded.emit(DataManager(self.data_file))
 
-    def add_section(self, section_name: str) -> bool:
-        """Adiciona nova seção"""
-        if section_name and section_name not in self.data:
-            self.data[section_name] = []
-            return self.save()
-        return False
-
-    def rename_section(self, old_name: str, new_name: str) -> bool:
-        """Renomeia uma seção"""
-        if (old_name not in self.data or 
-            new_name in self.data or 
-            not new_name):
-            return False
-            
-        self.data[new_name] = self.data.pop(old_name)
-        return self.save()
+# =============================================================================
+# INSTÂNCIA ÚNICA E COMANDOS LOCAIS
+# =============================================================================
 
-    def remove_section(self, section_name: str) -> bool:
-        """Remove uma seção"""
-        if len(self.data) <= 1 or section_name not in self.data:
-            return False
-            
-        del self.data[section_name]
-        return self.save()
+def instance_server_name() -> str:
+    """Nome do socket local da instância em execução (um por usuário e diretório de dados)"""
+    return server_name(CONFIG.APP_DATA_DIR)
 
-    def add_response(self, section_name: str, text: str) -> bool:
-        """Adiciona nova resposta"""
-        if section_name not in self.data or not text:
-            return False
-            
-        self.data[section_name].append({
-            "texto": text, 
-            "data": datetime.now().isoformat()
-        })
-        return self.save()
-
-    def edit_response(self, section_name: str, old_text: str, new_text: str) -> bool:
-        """Edita uma resposta existente"""
-        if section_name not in self.data or not new_text:
-            return False
-            
-        for item in self.data[section_name]:
-            if item["texto"] == old_text:
-                item["texto"] = new_text
-                item["data"] = datetime.now().isoformat()
-                return self.save()
+def forward_to_running_instance(message: Dict[str, Any], timeout_ms: int = 200) -> bool:
+    """
+    Envia os argumentos para a instância já aberta
+    
+    Não precisa de QApplication; a segunda execução chama isto antes de
+    montar qualquer interface e sai logo em seguida se retornar True.
+    
+    Returns:
+        True se outra instância recebeu a mensagem
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(instance_server_name())
+    if not socket.waitForConnected(timeout_ms):
         return False
+    socket.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    sent = socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return sent
+
+def _invalid_request(request: Dict[str, Any]) -> Optional[str]:
+    """Descreve o primeiro campo de tipo errado em um comando (None se tudo certo)"""
+    for field in ("section", "text", "query", "id"):
+        if field in request and not isinstance(request[field], str):
+            return f"'{field}' deve ser texto"
+    limit = request.get("limit", 1)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0:
+        return "'limit' deve ser um inteiro positivo"
+    values = request.get("values")
+    if values is not None and not (isinstance(values, dict) and all(
+            isinstance(k, str) and isinstance(v, str) for k, v in values.items())):
+        return "'values' deve mapear nomes para textos"
+    return None
+
+def run_command(request: Dict[str, Any], data_manager: DataManager,
+                stats_manager: StatsManager) -> Dict[str, Any]:
+    """
+    Executa um comando local (ver ipc_client.py) e retorna a resposta
+    
+    Comandos: "search" (query, limit), "copy" (id ou query; values com as
+    variáveis do modelo), "add" (section, text) e "stats".
+    """
+    error = _invalid_request(request)
+    if error:
+        return {"ok": False, "error": error}
+    command = request.get("command")
+    if command == "search":
+        matches = data_manager.search(request.get("query", ""), request.get("limit", 20))
+        return {"ok": True, "results": [
+            {"id": response_id(response["texto"]), "section": section, "texto": response["texto"]}
+            for section, response in matches]}
+    
+    if command == "copy":
+        if request.get("id"):
+            match = data_manager.find_by_id(request["id"])
+        else:
+            matches = data_manager.search(request.get("query", ""), 1)
+            match = matches[0] if matches else None
+        if match is None:
+            return {"ok": False, "error": "resposta não encontrada"}
+        section, response = match
+        values = dict(request.get("values") or {})
+        fmt = response.get("formato", FORMAT_TEXT)
+        if not response.get("modelo"):
+            set_clipboard_content(response["texto"], fmt)
+            stats_manager.record_copy(response["texto"], section)
+            return {"ok": True, "id": response_id(response["texto"]), "section": section}
+        try:
+            variables = data_manager.templates.variables(response["texto"])
+            missing = sorted(variables - BUILTIN_VARIABLES - set(values))
+            if missing:
+                return {"ok": False, "error": f"variáveis sem valor: {', '.join(missing)}"}
+            if "clipboard" in variables and "clipboard" not in values:
+                values["clipboard"] = QApplication.clipboard().text()
+            content = data_manager.templates.render(
+                response["texto"], values, escape=escape_html if fmt == FORMAT_HTML else None)
+        except TemplateError as e:
+            return {"ok": False, "error": str(e)}
+        set_clipboard_content(content, fmt)
+        stats_manager.record_copy(response["texto"], section)
+        return {"ok": True, "id": response_id(response["texto"]), "section": section}
+    
+    if command == "add":
+        section, text = request.get("section"), request.get("text")
+        if not data_manager.add_response(section, text):
+            return {"ok": False, "error": f"não foi possível adicionar em '{section}'"}
+        stats_manager.record_response_created()
+        return {"ok": True, "id": response_id(text)}
+    
+    if command == "stats":
+        stats = stats_manager.stats
+        return {"ok": True,
+                "total_copies": stats["total_copies"],
+                "created_responses": stats["created_responses"],
+                "deleted_responses": stats["deleted_responses"],
+                "section_usage": stats["section_usage"],
+                "most_used": [{"texto": text, "count": count}
+                              for text, count in stats_manager.get_most_used_responses()]}
+    
+    return {"ok": False, "error": f"comando desconhecido: {command}"}
 
-    def duplicate_response(self, section_name: str, text: str) -> bool:
-        """Duplica uma resposta"""
-        if section_name not in self.data:
-            return False
-            
-        new_text = f"{text} (cópia)"
-        counter = 1
-        while any(item["texto"] == new_text for item in self.data[section_name]):
-            new_text = f"{text} (cópia {counter})"
-            counter += 1
-            
-        return self.add_response(section_name, new_text)
-
-    def remove_response(self, section_name: str, text: str) -> bool:
-        """Remove uma resposta"""
-        if section_name not in self.data:
-            return False
-            
-        self.data[section_name] = [
-            item for item in self.data[section_name] 
-            if item["texto"] != text
-        ]
-        return self.save()
-
-    def reorder_sections(self, new_order: List[str]) -> bool:
-        """Reordena seções"""
-        if set(new_order) != set(self.data.keys()):
-            return False
-            
-        self.data = {section: self.data[section] for section in new_order}
-        return self.save()
-
-    def reorder_responses(self, section_name: str, new_order: List[str]) -> bool:
-        """Reordena respostas em uma seção"""
-        if section_name not in self.data:
-            return False
+class SingleInstanceServer(QObject):
+    """
+    Servidor local da instância em execução
+    
+    Linhas sem "command" são argumentos de outra execução do app e viram
+    `message_received`; linhas com "command" são respondidas na hora por
+    `command_handler` (ver ipc_client.py).
+    """
+    
+    message_received = pyqtSignal(dict)
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.command_handler: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
 
-        item_map = {item["texto"]: item for item in self.data[section_name]}
-        new_list = [item_map[text] for text in new_order if text in item_map]
+    def listen(self, timeout_ms: int = 500) -> bool:
+        """
+        Começa a escutar; remove o socket deixado por uma instância que travou
+        
+        O socket só é removido se ninguém atender nele: com duas execuções
+        disputando a partida (ou uma instância lenta para aceitar), a segunda
+        não apaga o servidor da primeira.
         
-        # Adicionar itens que não estão na nova ordem
-        new_order_set = set(new_order)
-        for text, item in item_map.items():
-            if text not in new_order_set:
-                new_list.append(item)
+        Returns:
+            False se outra instância atendeu ou se o servidor não pôde ser criado
+        """
+        name = instance_server_name()
+        if self.server.listen(name):
+            return True
+        probe = QLocalSocket()
+        probe.connectToServer(name)
+        if probe.waitForConnected(timeout_ms):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(name)
+        return self.server.listen(name)
 
-        self.data[section_name] = new_list
-        return self.save()
+    def close(self) -> None:
+        self.server.close()
 
-    def sort_responses(self, section_name: str, sort_by: str, usage_stats: Dict[str, int]) -> bool:
-        """Ordena respostas por critério especificado"""
-        if section_name not in self.data:
-            return False
-            
-        responses = self.data[section_name]
-        
-        if sort_by == "alphabetical":
-            responses.sort(key=lambda x: x["texto"].lower())
-        elif sort_by == "creation":
-            responses.sort(key=lambda x: x.get("data", ""))
-        elif sort_by == "usage":
-            responses.sort(key=lambda x: usage_stats.get(x["texto"], 0), reverse=True)
-            
-        return self.save()
+    def _on_new_connection(self) -> None:
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self._read_messages(s))
+            socket.disconnected.connect(socket.deleteLater)
 
-    def export_data(self, file_path: str, section_name: Optional[str] = None) -> bool:
-        """Exporta dados para arquivo"""
-        try:
-            if section_name and section_name in self.data:
-                export_data = {section_name: self.data[section_name]}
+    def _read_messages(self, socket: QLocalSocket) -> None:
+        while socket.canReadLine():
+            line = bytes(socket.readLine()).strip()
+            try:
+                message = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if not isinstance(message, dict):
+                continue
+            if "command" in message:
+                self._reply(socket, message)
             else:
-                export_data = self.data
-                
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if file_path.endswith('.json'):
-                    json.dump(export_data, f, ensure_ascii=False, indent=4)
-                else:  # .txt
-                    for section, responses in export_data.items():
-                        f.write(f"=== {section} ===\n\n")
-                        for response in responses:
-                            f.write(f"{response['texto']}\n\n")
-                        f.write("\n" + "="*50 + "\n\n")
-            return True
-        except IOError:
-            return False
+                self.message_received.emit(message)
 
-    def import_data(self, file_path: str) -> bool:
-        """Importa dados de arquivo"""
-        try:
-            if file_path.endswith('.json'):
-                imported_data = safe_json_load(file_path, {})
-                
-                # Merge com dados existentes
-                for section, responses in imported_data.items():
-                    if section not in self.data:
-                        self.data[section] = []
-                    
-                    existing_texts = {r["texto"] for r in self.data[section]}
-                    for response in responses:
-                        if isinstance(response, str):
-                            response = {
-                                "texto": response, 
-                                "data": datetime.now().isoformat()
-                            }
-                        if response["texto"] not in existing_texts:
-                            self.data[section].append(response)
-                            
-            else:  # .txt
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Processar arquivo texto simples
-                if "Geral" not in self.data:
-                    self.data["Geral"] = []
-                    
-                existing_texts = {r["texto"] for r in self.data["Geral"]}
-                lines = [line.strip() for line in content.split('\n') if line.strip()]
-                
-                for line in lines:
-                    if line not in existing_texts and not line.startswith('==='):
-                        self.data["Geral"].append({
-                            "texto": line,
-                            "data": datetime.now().isoformat()
-                        })
-                        
-            return self.save()
-        except (IOError, json.JSONDecodeError):
-            return False
+    def _reply(self, socket: QLocalSocket, request: Dict[str, Any]) -> None:
+        if self.command_handler is None:
+            reply = {"ok": False, "error": "comandos indisponíveis"}
+        else:
+            try:
+                reply = self.command_handler(request)
+            except Exception as e:
+                # Exceção em slot do Qt encerra o app: um cliente nunca derruba a janela
+                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        socket.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        socket.flush()
 
 # =============================================================================
 # WIDGETS PERSONALIZADOS
@@ -614,6 +805,7 @@ class FaderWidget(QWidget):
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        self.animations_enabled = True
         self._opacity = 1.0
         self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
         self.fade_animation.setDuration(300)
@@ -634,6 +826,10 @@ class FaderWidget(QWidget):
         """Anima fade in"""
         self._is_hiding = False
         self.fade_animation.stop()
+        if not self.animations_enabled:
+            self.setWindowOpacity(1.0)
+            self.show()
+            return
         self.setWindowOpacity(0.0)
         self.show()
         self.fade_animation.setStartValue(0.0)
@@ -644,6 +840,9 @@ class FaderWidget(QWidget):
         """Anima fade out"""
         self._is_hiding = True
         self.fade_animation.stop()
+        if not self.animations_enabled:
+            self.hide()
+            return
         self.fade_animation.setStartValue(1.0)
         self.fade_animation.setEndValue(0.0)
         self.fade_animation.start()
@@ -654,11 +853,27 @@ class FaderWidget(QWidget):
             self.hide()
 
 class FloatingButton(FaderWidget):
-    """Botão flutuante para minimizar aplicação"""
+    """
+    Botão flutuante para minimizar aplicação
+    
+    A bola é desenhada uma vez por (escala da tela, tema, estado) em um
+    QPixmap; cada paintEvent (fade, arraste) é um único drawPixmap.
+    
+    Clique direito ou clique longo emitem `menu_requested` (menu de cópia
+    rápida, ver QuickCopyMenu).
+    """
+    
+    LONG_PRESS_MS = 500
+    menu_requested = pyqtSignal(QPoint)
     
-    def __init__(self, callback):
+    def __init__(self, callback, theme_name: str = "light"):
         super().__init__()
         self.callback = callback
+        self.theme_name = theme_name if theme_name in THEMES else "light"
+        self.theme = THEMES[self.theme_name]
+        self.hovered = False
+        self._pixmap_cache: Dict[Tuple[float, str, bool], QPixmap] = {}
+        self._screen_window = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -668,10 +883,38 @@ class FloatingButton(FaderWidget):
         self.setFixedSize(70, 70)
         self.drag_position = None
         self._was_click = False
-        self.setToolTip("Clique para abrir o FCTBI\nArraste para mover")
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        self.setToolTip("Clique para abrir o FCTBI\nArraste para mover\n"
+                        "Clique direito ou segure para copiar rápido")
+        
+        self.long_press_timer = QTimer(self)
+        self.long_press_timer.setSingleShot(True)
+        self.long_press_timer.setInterval(self.LONG_PRESS_MS)
+        self.long_press_timer.timeout.connect(self._on_long_press)
+
+    def set_theme(self, theme_name: str) -> None:
+        """Passa a usar as cores do tema; imagens de outros temas continuam em cache"""
+        theme = THEMES.get(theme_name, THEMES["light"])
+        if theme_name == self.theme_name and theme is self.theme:
+            return
+        if theme_name == self.theme_name:
+            # Tema do usuário recarregado com outras cores
+            self.invalidate_cache()
+        self.theme_name = theme_name
+        self.theme = theme
+        self.update()
+
+    def invalidate_cache(self) -> None:
+        """Descarta as imagens pré-renderizadas"""
+        self._pixmap_cache.clear()
+        self.update()
+
+    def _render_pixmap(self, ratio: float) -> QPixmap:
+        """Desenha sombra, bola, borda e texto em um pixmap na escala da tela"""
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Sombra externa
@@ -679,9 +922,9 @@ class FloatingButton(FaderWidget):
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(8, 10, 54, 54)
         
-        # Gradiente principal
-        gradient = QColor("#6366f1")
-        painter.setBrush(gradient)
+        # Cor principal do tema
+        color_key = "ACCENT_COLOR" if self.hovered else "PRIMARY_COLOR"
+        painter.setBrush(QColor(self.theme[color_key]))
         painter.drawEllipse(5, 5, 60, 60)
         
         # Borda interna
@@ -691,23 +934,73 @@ class FloatingButton(FaderWidget):
         
         # Texto
         painter.setPen(QColor("#ffffff"))
-        font = QFont(CONFIG.APP_FONT_NAME, 9, QFont.Bold)
-        painter.setFont(font)
+        painter.setFont(QFont(CONFIG.APP_FONT_NAME, 9, QFont.Bold))
         painter.drawText(self.rect(), Qt.AlignCenter, "FCTBI")
+        painter.end()
+        return pixmap
+
+    def current_pixmap(self) -> QPixmap:
+        """Imagem da bola para a escala, tema e estado atuais"""
+        ratio = self.devicePixelRatioF()
+        key = (ratio, self.theme_name, self.hovered)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._pixmap_cache[key] = self._render_pixmap(ratio)
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.current_pixmap())
+        painter.end()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Trocar de tela pode mudar a escala (DPI): redesenhar as imagens.
+        # setWindowFlags recria a janela nativa, então a conexão é refeita.
+        handle = self.windowHandle()
+        if handle is not None and handle is not self._screen_window:
+            handle.screenChanged.connect(self._on_screen_changed)
+            self._screen_window = handle
+
+    def _on_screen_changed(self, screen) -> None:
+        self.invalidate_cache()
+
+    def enterEvent(self, event):
+        self.hovered = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered = False
+        self.update()
+        super().leaveEvent(event)
+
+    def contextMenuEvent(self, event):
+        self.menu_requested.emit(event.globalPos())
+        event.accept()
+
+    def _on_long_press(self) -> None:
+        # Segurar sem arrastar: menu em vez de clique
+        self._was_click = False
+        self.drag_position = None
+        self.menu_requested.emit(QCursor.pos())
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
             self._was_click = True
+            self.long_press_timer.start()
             event.accept()
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.LeftButton and self.drag_position:
             self.move(event.globalPos() - self.drag_position)
             self._was_click = False
+            self.long_press_timer.stop()
             event.accept()
 
     def mouseReleaseEvent(self, event):
+        self.long_press_timer.stop()
         if event.button() == Qt.LeftButton and self._was_click:
             self.callback()
             event.accept()
@@ -720,12 +1013,448 @@ class FloatingButton(FaderWidget):
         self._was_click = False
         self.drag_position = None
 
+def position_floating_button(button: FloatingButton, config_manager: ConfigManager) -> None:
+    """Posiciona a bola flutuante na posição salva ou no canto inferior direito"""
+    # Garantir que a bola flutuante esteja configurada corretamente
+    button.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+    
+    # Usar a posição salva ou posição padrão
+    floating_pos = config_manager.get("floating_button_position")
+    if floating_pos:
+        button.move(floating_pos[0], floating_pos[1])
+    else:
+        # Posição padrão no canto inferior direito
+        screen = QApplication.primaryScreen().geometry()
+        button.move(screen.width() - 90, screen.height() - 90)
+
+
+class LazyMimeData(QMimeData):
+    """
+    Conteúdo de uma resposta rica (Markdown ou HTML) na área de transferência
+    
+    Copiar só guarda o texto-fonte: texto simples, HTML e Markdown são gerados
+    (uma vez) em retrieveData, quando o aplicativo de destino pede o formato.
+    """
+    
+    MIME_PLAIN = "text/plain"
+    MIME_HTML = "text/html"
+    MIME_MARKDOWN = "text/markdown"
+    # Preferência: quem entende HTML cola formatado
+    FORMATS = (MIME_HTML, MIME_MARKDOWN, MIME_PLAIN)
+    
+    def __init__(self, source: str, fmt: str):
+        super().__init__()
+        self.source = source
+        self.source_mime = self.MIME_HTML if fmt == FORMAT_HTML else self.MIME_MARKDOWN
+        self.rendered: Dict[str, str] = {self.source_mime: source}
+        self._document: Optional[QTextDocument] = None
+
+    def formats(self) -> List[str]:
+        return list(self.FORMATS)
+
+    def hasFormat(self, mime_type: str) -> bool:
+        return mime_type in self.FORMATS
+
+    def retrieveData(self, mime_type: str, preferred_type):
+        # text() pede "text/plain;charset=utf-8"; o Qt converte str para bytes em data()
+        base_type = mime_type.split(";", 1)[0]
+        if base_type not in self.FORMATS:
+            return super().retrieveData(mime_type, preferred_type)
+        return self.render(base_type)
+
+    def render(self, mime_type: str) -> str:
+        """Conteúdo no formato `mime_type`, convertido na primeira vez que é pedido"""
+        text = self.rendered.get(mime_type)
+        if text is None:
+            if self._document is None:
+                self._document = QTextDocument()
+                if self.source_mime == self.MIME_HTML:
+                    self._document.setHtml(self.source)
+                else:
+                    self._document.setMarkdown(self.source)
+            if mime_type == self.MIME_PLAIN:
+                text = self._document.toPlainText()
+            elif mime_type == self.MIME_HTML:
+                text = self._document.toHtml()
+            else:
+                text = self._document.toMarkdown()
+            self.rendered[mime_type] = text
+        return text
+
+def set_clipboard_content(content: str, fmt: str = FORMAT_TEXT) -> None:
+    """Copia uma resposta; as ricas vão como LazyMimeData (formatos sob demanda)"""
+    clipboard = QApplication.clipboard()
+    if fmt == FORMAT_TEXT:
+        clipboard.setText(content)
+    else:
+        clipboard.setMimeData(LazyMimeData(content, fmt))
+
+def expand_response(text: str, section: str, data_manager: Optional[DataManager],
+                    parent: Optional[QWidget], remembered: Dict[str, str],
+                    fmt: str = FORMAT_TEXT) -> Optional[str]:
+    """
+    Expande o modelo da resposta para a cópia, perguntando as variáveis sem valor
+    
+    Respostas não marcadas como modelo são copiadas como estão.
+    
+    Args:
+        remembered: Últimos valores digitados (sugeridos na próxima pergunta)
+        fmt: Formato da resposta; em HTML os valores digitados são escapados
+        
+    Returns:
+        Texto final, ou None se o usuário cancelar ou o modelo for inválido
+    """
+    if (data_manager is None or not data_manager.is_template(section, text)
+            or data_manager.templates.get(text).is_static):
+        return text
+    try:
+        variables = data_manager.templates.variables(text)
+        values: Dict[str, str] = {}
+        if "clipboard" in variables:
+            values["clipboard"] = QApplication.clipboard().text()
+        for name in sorted(variables - BUILTIN_VARIABLES):
+            value, ok = QInputDialog.getText(parent, "📝 Preencher resposta", f"{name}:",
+                                             text=remembered.get(name, ""))
+            if not ok:
+                return None
+            values[name] = remembered[name] = value
+        return data_manager.templates.render(
+            text, values, escape=escape_html if fmt == FORMAT_HTML else None)
+    except TemplateError as e:
+        QMessageBox.warning(parent, "⚠️ Modelo inválido", str(e))
+        return None
+
+class Toast(FaderWidget):
+    """
+    Aviso curto que some sozinho, sem foco e sem bloquear a janela
+
+    Substitui o QMessageBox modal da confirmação de cópia: não rouba o foco,
+    não recebe cliques e some após `duration_ms`.
+    """
+
+    DURATION_MS = 1200
+    MARGIN = 16
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.text = ""
+        self.theme = THEMES["light"]
+        self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+                            | Qt.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFont(QFont(CONFIG.APP_FONT_NAME, 10, QFont.Bold))
+
+        # Um único timer, reiniciado a cada aviso
+        self.hide_timer = QTimer(self)
+        self.hide_timer.setSingleShot(True)
+        self.hide_timer.timeout.connect(self.fade_out)
+
+    def show_message(self, text: str, anchor: QWidget, theme: Dict[str, str],
+                     duration_ms: Optional[int] = None, above: bool = False) -> None:
+        """Mostra `text` centralizado na base de `anchor` (ou logo acima dele, com `above`)"""
+        self.text = text
+        self.theme = theme
+        metrics = QFontMetrics(self.font())
+        self.resize(metrics.horizontalAdvance(text) + 32, metrics.height() + 20)
+
+        geometry = anchor.frameGeometry()
+        x = geometry.center().x() - self.width() // 2
+        if above:
+            y = geometry.top() - self.height() - 8
+        else:
+            y = geometry.bottom() - self.height() - self.MARGIN
+        screen = QApplication.screenAt(geometry.center()) or QApplication.primaryScreen()
+        available = screen.availableGeometry()
+        x = max(available.left(), min(x, available.right() - self.width()))
+        y = max(available.top(), min(y, available.bottom() - self.height()))
+        self.move(x, y)
+
+        if not self.isVisible() or self._is_hiding:
+            self.fade_in()
+        self.update()
+        self.hide_timer.start(duration_ms if duration_ms is not None else self.DURATION_MS)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        color = QColor(self.theme.get("SUCCESS_COLOR", "#10b981"))
+        color.setAlpha(235)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(self.rect()), 10, 10)
+        painter.setPen(QColor("#ffffff"))
+        painter.drawText(self.rect(), Qt.AlignCenter, self.text)
+        painter.end()
+
+class QuickCopyMenu(QMenu):
+    """
+    Menu de cópia rápida da bandeja e da bola flutuante
+    
+    Lista as respostas fixadas e as mais usadas (StatsManager.top_responses);
+    escolher uma emite `copy_requested` e não abre a janela. O menu é
+    remontado em aboutToShow só se as fixadas, o ranking ou as respostas
+    mudaram desde a última vez.
+    """
+    
+    TOP_COUNT = 8
+    LABEL_LENGTH = 60
+    
+    copy_requested = pyqtSignal(str, str)  # seção, texto
+    search_requested = pyqtSignal()
+    open_requested = pyqtSignal()
+    quit_requested = pyqtSignal()
+    
+    def __init__(self, config_manager: ConfigManager, stats_manager: StatsManager,
+                 parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.stats_manager = stats_manager
+        self.data_manager: Optional[DataManager] = None
+        self._built_key: Optional[tuple] = None
+        self.aboutToShow.connect(self.refresh)
+        self.triggered.connect(self._on_triggered)
+
+    def set_data_manager(self, data_manager: DataManager) -> None:
+        """Passa a listar as respostas de `data_manager` (após o carregamento)"""
+        self.data_manager = data_manager
+        data_manager.add_listener(self._on_data_changed)
+        self._built_key = None
+
+    def _on_data_changed(self, change: DataChange) -> None:
+        self._built_key = None
+
+    def refresh(self) -> None:
+        """Remonta as entradas se algo mudou desde a última exibição"""
+        pinned = list(self.config_manager.get("pinned_responses", []))
+        key = (self.stats_manager.top_version, tuple(pinned), self.data_manager is not None)
+        if key == self._built_key:
+            return
+        self._built_key = key
+        self.clear()
+        
+        if self.data_manager is None:
+            self.addAction("⏳ Carregando respostas...").setEnabled(False)
+        else:
+            # Seção de cada texto (primeira ocorrência), em uma passada
+            sections: Dict[str, str] = {}
+            for section, responses in self.data_manager.data.items():
+                for response in responses:
+                    sections.setdefault(response["texto"], section)
+            
+            pinned = [text for text in pinned if text in sections]
+            self._add_group("📌 Fixadas", pinned, sections)
+            # Ranking com folga: respostas removidas continuam nas estatísticas
+            pinned_set = set(pinned)
+            most_used = [text for text, _ in self.stats_manager.top_responses()
+                         if text in sections and text not in pinned_set][:self.TOP_COUNT]
+            self._add_group("🔥 Mais usadas", most_used, sections)
+            if not pinned and not most_used:
+                self.addAction("Nenhuma resposta usada ainda").setEnabled(False)
+        
+        self.addSeparator()
+        self.addAction("🔎 Buscar e copiar...").setData("search")
+        self.addAction("🪟 Abrir FCTBI").setData("open")
+        self.addAction("❌ Sair").setData("quit")
+
+    def _add_group(self, title: str, texts: List[str], sections: Dict[str, str]) -> None:
+        if not texts:
+            return
+        if not self.isEmpty():
+            self.addSeparator()
+        self.addSection(title)
+        for text in texts:
+            label = " ".join(text.split())
+            if len(label) > self.LABEL_LENGTH:
+                label = label[:self.LABEL_LENGTH - 1] + "…"
+            # "&" viraria atalho de teclado no texto do menu
+            action = self.addAction(label.replace("&", "&&"))
+            action.setToolTip(text)
+            action.setData((sections[text], text))
+
+    def _on_triggered(self, action: QAction) -> None:
+        data = action.data()
+        if data == "search":
+            self.search_requested.emit()
+        elif data == "open":
+            self.open_requested.emit()
+        elif data == "quit":
+            self.quit_requested.emit()
+        elif isinstance(data, tuple):
+            self.copy_requested.emit(*data)
+
+
+class AppTrayIcon(QSystemTrayIcon):
+    """
+    Ícone da bandeja com o menu de cópia rápida
+    
+    Clique simples chama `on_click` (paleta) e duplo clique `on_double_click`
+    (janela). O clique simples espera o intervalo de clique duplo: no
+    Windows o duplo clique emite Trigger antes de DoubleClick.
+    """
+    
+    def __init__(self, menu: QMenu, on_click: Callable[[], None],
+                 on_double_click: Callable[[], None], parent: Optional[QObject] = None):
+        super().__init__(QIcon(resource_path('fctbi.ico')), parent)
+        self.setToolTip("FCTBI Respostas Rápidas")
+        self.setContextMenu(menu)
+        self.on_double_click = on_double_click
+        self.click_timer = QTimer(self)
+        self.click_timer.setSingleShot(True)
+        self.click_timer.setInterval(QApplication.doubleClickInterval())
+        self.click_timer.timeout.connect(on_click)
+        self.activated.connect(self.on_activated)
+
+    def on_activated(self, reason) -> None:
+        if reason == QSystemTrayIcon.DoubleClick:
+            self.click_timer.stop()
+            self.on_double_click()
+        elif reason == QSystemTrayIcon.Trigger:
+            self.click_timer.start()
+
+class QuickLauncher(QWidget):
+    """
+    Paleta de busca rápida: digitar, escolher com as setas e copiar com Enter
+    
+    Fica montada e oculta (ver prebuild), com o índice de busca pronto, para
+    abrir sem o custo de montar widgets ou da animação da janela principal.
+    """
+    
+    MAX_RESULTS = 50
+    VISIBLE_ROWS = 8
+    LABEL_LENGTH = 70
+    NAVIGATION_KEYS = (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown)
+    
+    copy_requested = pyqtSignal(str, str)  # seção, texto
+    
+    def __init__(self, index: SearchIndex, theme_name: str = "light"):
+        super().__init__()
+        self.index = index
+        self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setFixedWidth(460)
+        
+        frame = QFrame(self)
+        frame.setObjectName("quickLauncher")
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(0, 0, 0, 0)
+        outer.addWidget(frame)
+        layout = QVBoxLayout(frame)
+        layout.setContentsMargins(10, 10, 10, 8)
+        layout.setSpacing(6)
+        
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("searchInput")
+        self.search_input.setPlaceholderText("🔍 Buscar em todas as seções...")
+        self.search_input.textChanged.connect(self.update_results)
+        self.search_input.installEventFilter(self)
+        layout.addWidget(self.search_input)
+        
+        self.results = QListWidget()
+        self.results.setObjectName("quickResults")
+        self.results.setFocusPolicy(Qt.NoFocus)
+        self.results.setUniformItemSizes(True)
+        self.results.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.results.itemClicked.connect(self.copy_item)
+        layout.addWidget(self.results)
+        
+        hint = QLabel("Enter copia · Esc fecha")
+        hint.setObjectName("quickHint")
+        layout.addWidget(hint)
+        
+        self.apply_theme(theme_name)
+
+    def apply_theme(self, theme_name: str) -> None:
+        self.setStyleSheet(get_theme_stylesheet(theme_name if theme_name in THEMES else "light"))
+        row_height = self.results.fontMetrics().height() + 14
+        self.results.setFixedHeight(row_height * self.VISIBLE_ROWS)
+
+    def prebuild(self) -> None:
+        """Monta índice, estilo e janela nativa sem exibir nada na tela"""
+        self.index.search("")
+        self.update_results("")
+        self.setAttribute(Qt.WA_DontShowOnScreen, True)
+        self.show()
+        self.hide()
+        self.setAttribute(Qt.WA_DontShowOnScreen, False)
+
+    def update_results(self, query: str) -> None:
+        self.results.clear()
+        for section, text in self.index.search(query, self.MAX_RESULTS):
+            label = " ".join(text.split())
+            if len(label) > self.LABEL_LENGTH:
+                label = label[:self.LABEL_LENGTH - 1] + "…"
+            item = QListWidgetItem(f"[{section}] {label}")
+            item.setToolTip(text)
+            item.setData(Qt.UserRole, (section, text))
+            self.results.addItem(item)
+        self.results.setCurrentRow(0)
+
+    def popup(self, anchor: Optional[QWidget] = None) -> None:
+        """Abre com a busca vazia, sobre `anchor` ou no terço superior da tela"""
+        if self.search_input.text():
+            self.search_input.clear()
+        else:
+            self.update_results("")  # Respostas podem ter mudado desde a última vez
+        self.adjustSize()
+        
+        if anchor is not None and anchor.isVisible():
+            geometry = anchor.frameGeometry()
+            center = geometry.center()
+            x = center.x() - self.width() // 2
+            y = geometry.top() - self.height() - 8
+        else:
+            center = QCursor.pos()
+            available = (QApplication.screenAt(center) or QApplication.primaryScreen()).availableGeometry()
+            x = available.center().x() - self.width() // 2
+            y = available.top() + available.height() // 4
+        available = (QApplication.screenAt(center) or QApplication.primaryScreen()).availableGeometry()
+        x = max(available.left(), min(x, available.right() - self.width()))
+        y = max(available.top(), min(y, available.bottom() - self.height()))
+        self.move(x, y)
+        
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.search_input.setFocus()
+
+    def copy_item(self, item: Optional[QListWidgetItem] = None) -> None:
+        """Copia a resposta escolhida (ou a selecionada) e fecha a paleta"""
+        item = item or self.results.currentItem()
+        if item is None:
+            return
+        section, text = item.data(Qt.UserRole)
+        self.hide()
+        self.copy_requested.emit(section, text)
+
+    def eventFilter(self, obj, event):
+        if obj is self.search_input and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key in self.NAVIGATION_KEYS:
+                # Setas navegam na lista sem tirar o foco da busca
+                QApplication.sendEvent(self.results, event)
+                return True
+            if key in (Qt.Key_Return, Qt.Key_Enter):
+                self.copy_item()
+                return True
+            if key == Qt.Key_Escape:
+                self.hide()
+                return True
+        return super().eventFilter(obj, event)
+
+    def event(self, event):
+        # Clicar fora fecha, como um menu
+        if event.type() == QEvent.WindowDeactivate and self.isVisible():
+            self.hide()
+        return super().event(event)
+
 class SettingsDialog(QDialog):
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.setWindowTitle("Configurações")
-        self.setFixedSize(420, 380)
+        self.setFixedSize(420, 500)
         self.setup_ui()
 
     def setup_ui(self):
@@ -736,10 +1465,19 @@ class SettingsDialog(QDialog):
         appearance_layout = QFormLayout()
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["light", "dark"])
+        self.theme_combo.addItems(list(THEMES))
         self.theme_combo.setCurrentText(self.config_manager.get("theme"))
         appearance_layout.addRow("Tema:", self.theme_combo)
         
+        self.rendering_combo = QComboBox()
+        self.rendering_combo.addItems(["translucent", "opaque"])
+        self.rendering_combo.setCurrentText(self.config_manager.get("rendering_mode"))
+        appearance_layout.addRow("Renderização:", self.rendering_combo)
+        
+        self.animations = QCheckBox()
+        self.animations.setChecked(self.config_manager.get("animations"))
+        appearance_layout.addRow("Animações:", self.animations)
+        
         appearance_group.setLayout(appearance_layout)
         
         # Grupo Comportamento
@@ -750,6 +1488,10 @@ class SettingsDialog(QDialog):
         self.copy_confirmation.setChecked(self.config_manager.get("show_copy_confirmation"))
         behavior_layout.addRow("Confirmar ao copiar:", self.copy_confirmation)
         
+        self.minimize_after_copy = QCheckBox()
+        self.minimize_after_copy.setChecked(self.config_manager.get("minimize_after_copy"))
+        behavior_layout.addRow("Minimizar após copiar:", self.minimize_after_copy)
+        
         self.play_sound = QCheckBox()
         self.play_sound.setChecked(self.config_manager.get("play_copy_sound"))
         behavior_layout.addRow("Som ao copiar:", self.play_sound)
@@ -763,6 +1505,10 @@ class SettingsDialog(QDialog):
         self.minimize_on_focus.setChecked(self.config_manager.get("minimize_on_focus_loss"))
         behavior_layout.addRow("Minimizar ao clicar fora:", self.minimize_on_focus)
         
+        self.start_floating = QCheckBox()
+        self.start_floating.setChecked(self.config_manager.get("launch_mode") == "floating")
+        behavior_layout.addRow("Iniciar como bola flutuante:", self.start_floating)
+        
         behavior_group.setLayout(behavior_layout)
         
         # Grupo Backup
@@ -802,12 +1548,16 @@ class SettingsDialog(QDialog):
     def save_settings(self):
         config = {
             "theme": self.theme_combo.currentText(),
+            "rendering_mode": self.rendering_combo.currentText(),
+            "animations": self.animations.isChecked(),
             "show_copy_confirmation": self.copy_confirmation.isChecked(),
+            "minimize_after_copy": self.minimize_after_copy.isChecked(),
             "play_copy_sound": self.play_sound.isChecked(),
             "sort_responses_by": self.sort_combo.currentText(),
             "auto_backup": self.auto_backup.isChecked(),
             "backup_interval": self.backup_interval.value(),
-            "minimize_on_focus_loss": self.minimize_on_focus.isChecked()
+            "minimize_on_focus_loss": self.minimize_on_focus.isChecked(),
+            "launch_mode": "floating" if self.start_floating.isChecked() else "window"
         }
         
         # Preservar configurações existentes
@@ -893,6 +1643,12 @@ class HelpDialog(QDialog):
                 <li><b>Estatísticas:</b> Veja quais respostas são mais utilizadas</li>
                 <li><b>Temas:</b> Escolha entre modo claro e escuro</li>
                 <li><b>Backup automático:</b> Seus dados são salvos automaticamente</li>
+                <li><b>Modelos:</b> Marque "Modelo" no menu da resposta e use {nome} (ou qualquer
+                    {variável}) para preencher ao copiar, {data}, {hora} e {clipboard} para valores
+                    automáticos e {incluir:id} para inserir outra resposta ("Copiar referência" no
+                    menu da resposta); {{ e }} viram chaves. Respostas sem a marca são copiadas como estão</li>
+                <li><b>Formato:</b> No menu da resposta, escolha Markdown ou HTML para colar com
+                    formatação em e-mails e editores (texto simples nos demais aplicativos)</li>
             </ul>
             <h3>Drag and Drop - Organização Livre:</h3>
             <ul>
@@ -937,6 +1693,68 @@ class HelpDialog(QDialog):
         layout.addWidget(close_btn)
         self.setLayout(layout)
 
+def highlight_theme(widget: QWidget) -> Dict[str, str]:
+    """Retorna o tema da janela principal que contém o widget"""
+    return getattr(widget.window(), "current_theme", THEMES["light"])
+
+def paint_highlight(widget: QWidget, color: str, alpha: int, border_width: int,
+                    radius: int) -> None:
+    """
+    Pinta o destaque de seleção/drag sobre o widget
+    
+    Substitui as regras QSS baseadas em propriedades dinâmicas, que exigiam
+    unpolish()/polish() e reavaliavam a folha de estilos a cada clique.
+    
+    Args:
+        widget: Widget sendo pintado (chamar dentro do paintEvent)
+        color: Cor do destaque
+        alpha: Transparência do preenchimento (0-255)
+        border_width: Espessura da borda
+        radius: Raio dos cantos arredondados
+    """
+    painter = QPainter(widget)
+    painter.setRenderHint(QPainter.Antialiasing)
+    fill = QColor(color)
+    fill.setAlpha(alpha)
+    painter.setBrush(fill)
+    painter.setPen(QPen(QColor(color), border_width))
+    margin = border_width / 2
+    painter.drawRoundedRect(QRectF(widget.rect()).adjusted(margin, margin, -margin, -margin),
+                            radius, radius)
+    painter.end()
+
+def drag_pixmap(widget: QWidget, content_key: Any) -> QPixmap:
+    """
+    Retorna a imagem semitransparente exibida durante o drag do widget
+    
+    O widget é renderizado uma única vez direto com opacidade, e a imagem é
+    reaproveitada enquanto conteúdo, tamanho, escala e tema não mudarem.
+    
+    Args:
+        widget: Widget sendo arrastado
+        content_key: Identifica o conteúdo exibido pelo widget
+        
+    Returns:
+        Pixmap para QDrag.setPixmap
+    """
+    ratio = widget.devicePixelRatioF()
+    key = (content_key, widget.width(), widget.height(), ratio,
+           getattr(widget.window(), "current_theme_name", None))
+    cached = getattr(widget, "_drag_pixmap_cache", None)
+    if cached and cached[0] == key:
+        return cached[1]
+    
+    pixmap = QPixmap(round(widget.width() * ratio), round(widget.height() * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setOpacity(0.7)
+    widget.render(painter, QPoint(), QRegion(),
+                  QWidget.RenderFlags(QWidget.DrawWindowBackground | QWidget.DrawChildren))
+    painter.end()
+    widget._drag_pixmap_cache = (key, pixmap)
+    return pixmap
+
 class DraggableSectionButton(QPushButton):
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
@@ -948,10 +1766,16 @@ class DraggableSectionButton(QPushButton):
         self.is_dragging = False
 
     def set_dragging(self, dragging: bool):
+        """Destaca o botão durante o drag sem reaplicar a folha de estilos"""
+        if dragging == self.is_dragging:
+            return
         self.is_dragging = dragging
-        self.setProperty("dragging", dragging)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.is_dragging:
+            paint_highlight(self, highlight_theme(self)['ACCENT_COLOR'], 0x60, 2, 12)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
@@ -964,7 +1788,6 @@ class DraggableSectionButton(QPushButton):
         if (event.pos() - self.drag_start_position).manhattanLength() < QApplication.startDragDistance():
             return
             
-        self.is_dragging = True
         self.set_dragging(True)
         self.setCursor(Qt.ClosedHandCursor)
         
@@ -976,20 +1799,7 @@ class DraggableSectionButton(QPushButton):
         mime_data = QMimeData()
         mime_data.setText(f"SECTION:{self.text()}")
         
-        # Criar pixmap com efeito visual
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.transparent)
-        self.render(pixmap)
-        
-        # Adicionar efeito de transparência
-        transparent_pixmap = QPixmap(pixmap.size())
-        transparent_pixmap.fill(Qt.transparent)
-        painter = QPainter(transparent_pixmap)
-        painter.setOpacity(0.7)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.end()
-        
-        drag.setPixmap(transparent_pixmap)
+        drag.setPixmap(drag_pixmap(self, (self.text(), self.isChecked())))
         drag.setHotSpot(event.pos())
         drag.setMimeData(mime_data)
         
@@ -1002,16 +1812,188 @@ class DraggableSectionButton(QPushButton):
             if hasattr(main_window, 'end_drag_operation'):
                 main_window.end_drag_operation()
         
-        self.is_dragging = False
         self.set_dragging(False)
         self.setCursor(Qt.OpenHandCursor)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
-        self.is_dragging = False
         self.set_dragging(False)
         self.setCursor(Qt.OpenHandCursor)
         super().mouseReleaseEvent(event)
 
+# Layouts de texto prontos: (texto, largura, fonte, expandido) -> (linhas, truncado)
+_PREVIEW_CACHE: "OrderedDict[Tuple[str, int, str, bool], Tuple[List[QStaticText], bool]]" = OrderedDict()
+
+def response_preview(text: str, width: int, font: QFont,
+                     expanded: bool = False) -> Tuple[List[QStaticText], bool]:
+    """
+    Retorna as linhas já diagramadas para exibir uma resposta
+    
+    Recolhida, a resposta mostra no máximo CONFIG.RESPONSE_PREVIEW_LINES
+    parágrafos, cada um elidido em uma linha; expandida, cada parágrafo
+    quebra na largura disponível. O resultado fica em um cache LRU, então
+    repinturas e redimensionamentos repetidos não refazem o layout do texto.
+    
+    Args:
+        text: Texto completo da resposta
+        width: Largura disponível para o texto
+        font: Fonte usada na pintura
+        expanded: Se True, exibe o texto completo
+        
+    Returns:
+        Tupla (linhas prontas para drawStaticText, se há texto oculto)
+    """
+    key = (text, width, font.key(), expanded)
+    cached = _PREVIEW_CACHE.get(key)
+    if cached is not None:
+        _PREVIEW_CACHE.move_to_end(key)
+        return cached
+    
+    paragraphs = text.splitlines() or [""]
+    lines = []
+    if expanded:
+        truncated = False
+        for paragraph in paragraphs:
+            static = QStaticText(paragraph)
+            static.setTextFormat(Qt.PlainText)
+            static.setTextWidth(width)
+            static.prepare(QTransform(), font)
+            lines.append(static)
+    else:
+        metrics = QFontMetrics(font)
+        max_lines = CONFIG.RESPONSE_PREVIEW_LINES
+        truncated = len(paragraphs) > max_lines
+        for i, paragraph in enumerate(paragraphs[:max_lines]):
+            if truncated and i == max_lines - 1:
+                paragraph = paragraph.rstrip() + " …"
+            elided = metrics.elidedText(paragraph, Qt.ElideRight, width)
+            truncated = truncated or elided != paragraph
+            static = QStaticText(elided)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QTransform(), font)
+            lines.append(static)
+    
+    result = (lines, truncated)
+    _PREVIEW_CACHE[key] = result
+    while len(_PREVIEW_CACHE) > CONFIG.RESPONSE_PREVIEW_CACHE_SIZE:
+        _PREVIEW_CACHE.popitem(last=False)
+    return result
+
+class ResponseButton(QPushButton):
+    """
+    Botão de resposta que pinta uma prévia de altura limitada do texto
+    
+    O texto completo continua em text() (acessibilidade, testes); a altura
+    depende apenas do número de parágrafos exibidos, então redimensionar a
+    janela não exige diagramar o texto de linhas fora da tela.
+    """
+    
+    # Altura mínima do texto (antes um min-height na QSS, que fixava a
+    # altura mínima explícita e impedia as linhas de crescer)
+    MIN_TEXT_HEIGHT = 24
+    
+    def __init__(self, text: str, parent: Optional[QWidget] = None):
+        super().__init__(text, parent)
+        self.expanded = False
+        self._paragraphs: Tuple[Optional[str], int] = (None, 1)
+        self._metrics: Optional[Tuple[QSize, int, int]] = None  # padding, entrelinha, largura média
+        self.tooltip_provider: Optional[Callable[[], str]] = None  # Tooltip calculado sob demanda
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+    def set_expanded(self, expanded: bool) -> None:
+        """Alterna entre a prévia recolhida e o texto completo"""
+        if expanded == self.expanded:
+            return
+        self.expanded = expanded
+        size_policy = self.sizePolicy()
+        size_policy.setHeightForWidth(expanded)
+        self.setSizePolicy(size_policy)
+        self.updateGeometry()
+        self.update()
+
+    def is_truncated(self) -> bool:
+        """Se a prévia recolhida esconde parte do texto na largura atual"""
+        return response_preview(self.text(), self._text_width(self.width()), self.font())[1]
+
+    def _style_option(self) -> QStyleOptionButton:
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        option.text = ""
+        return option
+
+    def _padding(self) -> QSize:
+        """Espaço ocupado por borda e padding da folha de estilos (em cache)"""
+        if self._metrics is None:
+            padding = self.style().sizeFromContents(
+                QStyle.CT_PushButton, self._style_option(), QSize(0, 0), self)
+            metrics = QFontMetrics(self.font())
+            self._metrics = (padding, metrics.lineSpacing(), metrics.averageCharWidth())
+        return self._metrics[0]
+
+    def _line_spacing(self) -> int:
+        self._padding()
+        return self._metrics[1]
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip and self.tooltip_provider:
+            QToolTip.showText(event.globalPos(), self.tooltip_provider(), self)
+            return True
+        return super().event(event)
+
+    def changeEvent(self, event):
+        # Fonte e folha de estilos mudam o espaçamento em cache
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._metrics = None
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def _paragraph_count(self) -> int:
+        text = self.text()
+        if self._paragraphs[0] != text:
+            self._paragraphs = (text, len(text.splitlines()) or 1)
+        return self._paragraphs[1]
+
+    def _text_width(self, width: int) -> int:
+        return max(1, width - self._padding().width())
+
+    def _text_height(self, width: int) -> int:
+        if not self.expanded:
+            height = min(self._paragraph_count(), CONFIG.RESPONSE_PREVIEW_LINES) * self._line_spacing()
+        else:
+            lines, _ = response_preview(self.text(), self._text_width(width), self.font(), True)
+            height = sum(int(line.size().height()) for line in lines)
+        return max(self.MIN_TEXT_HEIGHT, height)
+
+    def sizeHint(self) -> QSize:
+        padding = self._padding()
+        return QSize(padding.width() + self._metrics[2] * 20,
+                     padding.height() + self._text_height(self.width()))
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def heightForWidth(self, width: int) -> int:
+        return self._padding().height() + self._text_height(width)
+
+    def paintEvent(self, event):
+        painter = QStylePainter(self)
+        option = self._style_option()
+        painter.drawControl(QStyle.CE_PushButton, option)
+        
+        rect = self.style().subElementRect(QStyle.SE_PushButtonContents, option, self)
+        lines, _ = response_preview(self.text(), rect.width(), self.font(), self.expanded)
+        painter.setPen(option.palette.color(QPalette.ButtonText))
+        painter.setFont(self.font())
+        if self.expanded:
+            heights = [line.size().height() for line in lines]
+        else:
+            # Mesmo passo usado em sizeHint, para a prévia caber na altura reservada
+            heights = [self._line_spacing()] * len(lines)
+        y = rect.top() + max(0.0, (rect.height() - sum(heights)) / 2)
+        painter.setClipRect(rect)
+        for line, height in zip(lines, heights):
+            painter.drawStaticText(QPointF(rect.left(), y), line)
+            y += height
+
 class EnhancedDraggableResponseWidget(QWidget):
     """Versão melhorada com melhor feedback visual e funcionalidades"""
     
@@ -1044,63 +2026,52 @@ class EnhancedDraggableResponseWidget(QWidget):
         self.down_arrow_btn.clicked.connect(self.move_down)
         
         # Botão principal da resposta
-        self.response_btn = QPushButton(self.response_data["texto"])
-        self.response_btn.setObjectName("responseButton")
-        
-        # Tooltip com informações adicionais
-        tooltip_text = f"Texto: {self.response_data['texto']}\n"
-        tooltip_text += f"Criado: {self.response_data.get('data', 'N/A')}\n"
-        usage_count = self.main_window.stats_manager.stats["response_usage"].get(
-            self.response_data["texto"], 0)
-        tooltip_text += f"Usado: {usage_count}x\n"
-        tooltip_text += "Clique para copiar | Arraste para reordenar ou mover entre seções"
-        self.response_btn.setToolTip(tooltip_text)
+        self.response_btn = ResponseButton(self.response_data["texto"])
+        self.response_btn.setObjectName("responseButton")
+        
+        # Tooltip calculado apenas quando solicitado (ver ResponseButton.event)
+        self.response_btn.tooltip_provider = self.tooltip_text
         
         self.response_btn.clicked.connect(self.on_copy_clicked)
-        self.response_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         
-        # Botão de menu modernizado
+        # Botão de menu modernizado (menu compartilhado da janela principal)
         self.menu_btn = QPushButton("⋯")
         self.menu_btn.setObjectName("menuButton")
         self.menu_btn.setToolTip("Opções")
         self.menu_btn.setFixedSize(32, 32)
-        
-        menu = QMenu(self)
-        edit_action = menu.addAction("✏️ Editar (F2)")
-        edit_action.triggered.connect(self.on_edit_clicked)
-        
-        duplicate_action = menu.addAction("📋 Duplicar (Ctrl+D)")
-        duplicate_action.triggered.connect(self.on_duplicate_clicked)
-        
-        remove_action = menu.addAction("🗑️ Remover (Del)")
-        remove_action.triggered.connect(self.on_remove_clicked)
-        
-        menu.addSeparator()
-        
-        stats_action = menu.addAction(f"📊 Usado {usage_count}x")
-        stats_action.setEnabled(False)
-        
-        self.menu_btn.setMenu(menu)
+        self.menu_btn.clicked.connect(self.show_menu)
         
         layout.addWidget(self.up_arrow_btn)
         layout.addWidget(self.down_arrow_btn)
         layout.addWidget(self.response_btn)
         layout.addWidget(self.menu_btn)
         
-        # Estilo para seleção - removido para usar estilos globais do tema
-        # self.setStyleSheet("""
-        #     EnhancedDraggableResponseWidget[selected="true"] {
-        #         background-color: rgba(99, 102, 241, 0.1);
-        #         border: 1px solid #6366f1;
-        #         border-radius: 8px;
-        #     }
-        #     EnhancedDraggableResponseWidget[dragging="true"] {
-        #         background-color: rgba(99, 102, 241, 0.2);
-        #         border: 2px solid #6366f1;
-        #         border-radius: 8px;
-        #         opacity: 0.8;
-        #     }
-        # """)
+        # Destaque de seleção/drag é pintado em paintEvent (ver paint_highlight)
+
+    def usage_count(self) -> int:
+        """Número de usos da resposta, lido no momento da consulta"""
+        return self.main_window.stats_manager.stats["response_usage"].get(
+            self.response_data["texto"], 0)
+
+    def tooltip_text(self) -> str:
+        """Monta o tooltip com informações atualizadas da resposta"""
+        tooltip_text = f"Texto: {self.response_data['texto']}\n"
+        tooltip_text += f"Criado: {self.response_data.get('data', 'N/A')}\n"
+        tooltip_text += f"Usado: {self.usage_count()}x\n"
+        tooltip_text += "Clique para copiar | Arraste para reordenar ou mover entre seções"
+        return tooltip_text
+
+    def refresh(self):
+        """Atualiza o texto exibido após edição da resposta"""
+        self.response_btn.setText(self.response_data["texto"])
+
+    def show_menu(self):
+        """Abre o menu de opções abaixo do botão ⋯"""
+        self.main_window.show_response_menu(
+            self, self.menu_btn.mapToGlobal(self.menu_btn.rect().bottomLeft()))
+
+    def contextMenuEvent(self, event):
+        self.main_window.show_response_menu(self, event.globalPos())
 
     def move_up(self):
         """Move a resposta para cima na lista"""
@@ -1116,16 +2087,24 @@ class EnhancedDraggableResponseWidget(QWidget):
         self.down_arrow_btn.setEnabled(not is_last)
 
     def set_selected(self, selected: bool):
+        """Marca a linha como selecionada (destaque pintado, sem repolish)"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        self.setProperty("selected", selected)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self.update()
 
     def set_dragging(self, dragging: bool):
+        """Marca a linha como arrastada (destaque pintado, sem repolish)"""
+        if dragging == self.is_dragging:
+            return
         self.is_dragging = dragging
-        self.setProperty("dragging", dragging)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self.update()
+
+    def paintEvent(self, event):
+        if self.is_dragging:
+            paint_highlight(self, highlight_theme(self)['PRIMARY_COLOR'], 0x40, 2, 8)
+        elif self.is_selected:
+            paint_highlight(self, highlight_theme(self)['PRIMARY_COLOR'], 0x20, 1, 8)
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
@@ -1154,20 +2133,7 @@ class EnhancedDraggableResponseWidget(QWidget):
         mime_data = QMimeData()
         mime_data.setText(f"RESPONSE:{self.response_data['texto']}")
         
-        # Criar pixmap com efeito visual
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.transparent)
-        self.render(pixmap)
-        
-        # Adicionar efeito de transparência
-        transparent_pixmap = QPixmap(pixmap.size())
-        transparent_pixmap.fill(Qt.transparent)
-        painter = QPainter(transparent_pixmap)
-        painter.setOpacity(0.7)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.end()
-        
-        drag.setPixmap(transparent_pixmap)
+        drag.setPixmap(drag_pixmap(self, self.response_data['texto']))
         drag.setHotSpot(event.pos())
         drag.setMimeData(mime_data)
         
@@ -1212,45 +2178,220 @@ class EnhancedDraggableResponseWidget(QWidget):
     def on_remove_clicked(self):
         self.main_window.remove_response(self.response_data["texto"])
 
+class SectionPage(QScrollArea):
+    """Página com as respostas de uma seção, mantida em cache pela janela principal"""
+    
+    def __init__(self, section: str, main_window):
+        super().__init__()
+        self.section = section
+        self.main_window = main_window
+        self.filter_text = ""
+        self.rows: List[EnhancedDraggableResponseWidget] = []
+        self._filtered_rows: List[EnhancedDraggableResponseWidget] = []
+        self.empty_label: Optional[QLabel] = None
+        self.setWidgetResizable(True)
+        
+        self.responses_widget = QWidget()
+        self.responses_widget.setAcceptDrops(True)
+        self.responses_layout = QVBoxLayout(self.responses_widget)
+        self.responses_layout.setAlignment(Qt.AlignTop)
+        self.responses_layout.setContentsMargins(0, 0, 8, 0)
+        self.responses_layout.setSpacing(6)
+        
+        self.setWidget(self.responses_widget)
+        main_window.setup_response_drop_area(self.responses_widget)
+        self.rebuild()
+
+    @property
+    def visible_rows(self) -> List[EnhancedDraggableResponseWidget]:
+        """Linhas exibidas com o filtro de busca atual"""
+        return self._filtered_rows if self.filter_text else self.rows
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    def rebuild(self) -> None:
+        """Recria todas as linhas da seção"""
+        self.responses_widget.setUpdatesEnabled(False)
+        for row in self.rows:
+            self._discard_row(row)
+        
+        self.rows = []
+        for response_data in self.main_window.data_manager.data.get(self.section, []):
+            row = EnhancedDraggableResponseWidget(response_data, self.main_window)
+            self.responses_layout.insertWidget(len(self.rows), row)
+            self.rows.append(row)
+        
+        self.apply_filter(self.filter_text)
+        self.responses_widget.setUpdatesEnabled(True)
+
+    def apply_filter(self, search_text: str) -> None:
+        """Esconde as linhas que não contêm o texto buscado"""
+        self.filter_text = search_text
+        needle = search_text.lower()
+        self._filtered_rows = []
+        for row in self.rows:
+            visible = not needle or needle in row.response_data["texto"].lower()
+            row.setVisible(visible)
+            if visible and needle:
+                self._filtered_rows.append(row)
+        
+        self._update_empty_label()
+        self.update_arrow_buttons(range(len(self.visible_rows)))
+
+    def apply_change(self, change: DataChange) -> None:
+        """Aplica uma alteração do DataManager tocando apenas as linhas afetadas"""
+        index, to_index = change.index, change.to_index
+        if change.kind == RESPONSES_RESET:
+            self.rebuild()
+            return
+        elif change.kind == RESPONSE_INSERTED:
+            response_data = self.main_window.data_manager.data[self.section][index]
+            row = EnhancedDraggableResponseWidget(response_data, self.main_window)
+            self.responses_layout.insertWidget(index, row)
+            self.rows.insert(index, row)
+            affected = (index - 1, index, index + 1)
+        elif change.kind == RESPONSE_REMOVED and 0 <= index < len(self.rows):
+            self._discard_row(self.rows.pop(index))
+            affected = (index - 1, index)
+        elif change.kind == RESPONSE_MOVED and 0 <= index < len(self.rows):
+            row = self.rows.pop(index)
+            self.rows.insert(to_index, row)
+            self.responses_layout.removeWidget(row)
+            self.responses_layout.insertWidget(to_index, row)
+            affected = (index, to_index, 0, len(self.rows) - 1)
+        elif change.kind == RESPONSE_CHANGED and 0 <= index < len(self.rows):
+            self.rows[index].refresh()
+            affected = ()
+        else:
+            return
+            
+        if self.filter_text:
+            # Índices filtrados não correspondem aos da seção: refiltrar
+            self.apply_filter(self.filter_text)
+        else:
+            self._update_empty_label()
+            self.update_arrow_buttons(affected)
+
+    def update_arrow_buttons(self, indices) -> None:
+        """Atualiza os botões de seta apenas das linhas indicadas"""
+        rows = self.visible_rows
+        last = len(rows) - 1
+        for i in indices:
+            if 0 <= i <= last:
+                rows[i].update_arrow_buttons(i == 0, i == last)
+
+    def _discard_row(self, row: EnhancedDraggableResponseWidget) -> None:
+        """Remove a linha do layout e agenda sua destruição"""
+        if row is self.main_window.selected_response_widget:
+            self.main_window.selected_response_widget = None
+        self.responses_layout.removeWidget(row)
+        row.setParent(None)
+        row.deleteLater()
+
+    def _update_empty_label(self) -> None:
+        """Mostra mensagem quando não há respostas visíveis"""
+        if self.visible_rows:
+            if self.empty_label:
+                self.empty_label.hide()
+            return
+            
+        if self.empty_label is None:
+            self.empty_label = QLabel("📝 Nenhuma resposta encontrada\nClique em 'Adicionar Resposta' para começar")
+            self.empty_label.setObjectName("emptyLabel")
+            self.empty_label.setAlignment(Qt.AlignCenter)
+            self.responses_layout.addWidget(self.empty_label)
+        self.empty_label.show()
+
 class RespostaRapidaApp(QMainWindow, FaderWidget):
-    def __init__(self):
+    def __init__(self, trace: Optional[StartupTrace] = None, load_in_background: bool = False,
+                 config_manager: Optional[ConfigManager] = None,
+                 stats_manager: Optional[StatsManager] = None,
+                 data_manager: Optional[DataManager] = None,
+                 floating_button: Optional[FloatingButton] = None,
+                 quick_menu: Optional[QuickCopyMenu] = None,
+                 quick_launcher: Optional[QuickLauncher] = None,
+                 tray_icon: Optional[AppTrayIcon] = None):
+        """
+        Args:
+            trace: Marcação das fases da inicialização
+            load_in_background: Se True, mostra a janela vazia e carrega as
+                respostas em uma thread; as linhas são montadas ao terminar
+            config_manager, stats_manager, data_manager: Gerenciadores já
+                criados (ex.: pelo FloatingLauncher); criados aqui se ausentes
+            floating_button: Bola flutuante já exibida, reaproveitada
+            quick_menu: Menu de cópia rápida já ligado à bola (criado aqui se ausente)
+            quick_launcher: Paleta de busca rápida já montada (senão montada
+                em tempo ocioso após a inicialização)
+            tray_icon: Ícone da bandeja já exibido (criado aqui se ausente)
+        """
         QMainWindow.__init__(self)
         FaderWidget.__init__(self)
+        self.trace = trace or StartupTrace()
 
         CONFIG.APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
         
-        # Managers
-        self.config_manager = ConfigManager(CONFIG.CONFIG_FILE)
-        self.stats_manager = StatsManager(CONFIG.STATS_FILE)
-        self.data_manager = DataManager(CONFIG.DATA_FILE)
+        # Managers (respostas: ver _on_data_loaded)
+        self.config_manager = config_manager or ConfigManager(CONFIG.CONFIG_FILE)
+        self.stats_manager = stats_manager or StatsManager(CONFIG.STATS_FILE)
+        self.data_manager: Optional[DataManager] = None
+        self.data_loader: Optional[DataLoadThread] = None
+        self.pending_instance_messages: List[Dict[str, Any]] = []
+        self.tray_icon: Optional[AppTrayIcon] = tray_icon  # Senão criado após a primeira exibição
+        self.trace.mark("managers")
         
-        self.current_section = list(self.data_manager.data.keys())[0] if self.data_manager.data else "Geral"
+        self.current_section = "Geral"
         self.search_filter = ""
         self.drag_position = None
         self.selected_response_widget = None
         self.drop_indicator = None
         self.section_drop_indicator = None
         self.is_dragging = False
+        self.drag_geometry: Dict[bool, List[int]] = {}  # Pontos médios cacheados durante o drag
+        self.pending_drag_move: Optional[Tuple[Callable[[QPoint], None], QPoint]] = None
         self.focus_loss_timer = None  # Timer para delay na minimização
-
-        # Configurar tema
-        self.current_theme = THEMES[self.config_manager.get("theme", "light")]
+        self.focus_lost_under_cursor = False  # Foco saiu com o mouse sobre a janela (ver leaveEvent)
+        self.is_closing = False
+        self.rendering_mode: Optional[str] = None  # Definido em apply_rendering_mode
+        self.page_cache: "OrderedDict[str, SectionPage]" = OrderedDict()
+        self.response_menu = None  # Menu de opções compartilhado pelas respostas
+        self.section_buttons: List[DraggableSectionButton] = []
+
+        # Configurar tema (temas do usuário entram no mesmo cache)
+        load_user_themes(CONFIG.THEMES_DIR)
+        self.current_theme_name = self.config_manager.get("theme", "light")
+        if self.current_theme_name not in THEMES:
+            self.current_theme_name = "light"
+        self.current_theme = THEMES[self.current_theme_name]
 
         # Configurar o ícone da janela
         self.setWindowIcon(QIcon(resource_path('fctbi.ico')))
 
         self.setup_ui()
         self.setup_connections()
-        self.setup_tray_icon()
-        self.setup_shortcuts()
         self.setup_timers()
         
-        self.floating_button = FloatingButton(self.show_window)
-        # Garantir que a bola flutuante seja sempre visível quando necessário
-        self.floating_button.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        
-        # Posicionar bola flutuante
-        self._position_floating_button()
+        if floating_button is not None:
+            # Bola já posicionada e possivelmente visível: só assumir o clique
+            self.floating_button = floating_button
+            self.floating_button.callback = self.show_window
+        else:
+            self.floating_button = FloatingButton(self.show_window, self.current_theme_name)
+            self._position_floating_button()
+        self.floating_button.animations_enabled = self.animations_enabled
+        self.toast: Optional[Toast] = None
+        self.template_values: Dict[str, str] = {}  # Últimos valores das variáveis de modelo
+        
+        if quick_menu is None:
+            quick_menu = QuickCopyMenu(self.config_manager, self.stats_manager, self)
+            quick_menu.copy_requested.connect(self.quick_copy)
+            quick_menu.search_requested.connect(self.open_quick_launcher)
+            quick_menu.open_requested.connect(self.show_window)
+            quick_menu.quit_requested.connect(self.close_window)
+            self.floating_button.menu_requested.connect(quick_menu.popup)
+        self.quick_menu = quick_menu
+        self.quick_launcher = quick_launcher
 
         # Restaurar posição e tamanho da janela
         window_pos = self.config_manager.get("window_position")
@@ -1260,39 +2401,144 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
             self.move(window_pos[0], window_pos[1])
         self.resize(window_size[0], window_size[1])
 
+        # Pré-montagem da próxima seção em tempo ocioso
+        self.prebuild_timer = QTimer(self)
+        self.prebuild_timer.setSingleShot(True)
+        self.prebuild_timer.setInterval(250)
+        self.prebuild_timer.timeout.connect(self._prebuild_next_section)
+
+        # Processamento do drag limitado à taxa de atualização da tela
+        self.drag_move_timer = QTimer(self)
+        self.drag_move_timer.setSingleShot(True)
+        self.drag_move_timer.timeout.connect(self._flush_drag_move)
+        self.trace.mark("shell")
+        self.trace.watch_first_paint(self)
+
+        if data_manager is not None:
+            self._on_data_loaded(data_manager)
+        elif load_in_background:
+            self._set_data_widgets_enabled(False)
+            self.data_loader = DataLoadThread(CONFIG.DATA_FILE, self)
+            self.data_loader.loaded.connect(self._on_data_loaded)
+            self.data_loader.finished.connect(self.data_loader.deleteLater)
+            self.data_loader.start()
+        else:
+            self._on_data_loaded(DataManager(CONFIG.DATA_FILE))
+
+    def _on_data_loaded(self, data_manager: DataManager) -> None:
+        """Recebe as respostas carregadas e monta seções e linhas"""
+        self.trace.mark("data")
+        self.data_manager = data_manager
+        self.data_loader = None
+        self.current_section = next(iter(data_manager.data), "Geral")
+        
         self.update_sections_ui()
         self.update_responses_ui()
+        self.data_manager.add_listener(self._on_data_changed)
+        if self.quick_menu.data_manager is not data_manager:
+            self.quick_menu.set_data_manager(data_manager)
+        self._set_data_widgets_enabled(True)
+        self.trace.mark("rows")
+        
+        for message in self.pending_instance_messages:
+            self.handle_instance_message(message)
+        self.pending_instance_messages.clear()
+        
+        # Bandeja e atalhos não são necessários para a primeira exibição
+        QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self) -> None:
+        """Última etapa da inicialização, fora do caminho da primeira pintura"""
+        self.setup_tray_icon()
+        self.setup_shortcuts()
+        self.trace.mark("deferred")
+        if self.quick_launcher is None:
+            QTimer.singleShot(0, self.ensure_quick_launcher)
+
+    def _set_data_widgets_enabled(self, enabled: bool) -> None:
+        """Bloqueia busca, seções e respostas enquanto os dados carregam"""
+        for widget in (self.search_bar, self.sections_container, self.content_container):
+            widget.setEnabled(enabled)
+
+    @property
+    def current_page(self) -> SectionPage:
+        """Página da seção exibida"""
+        return self.pages_stack.currentWidget()
+
+    @property
+    def responses_scroll(self) -> SectionPage:
+        return self.current_page
+
+    @property
+    def responses_widget(self) -> QWidget:
+        return self.current_page.responses_widget
+
+    @property
+    def responses_layout(self) -> QVBoxLayout:
+        return self.current_page.responses_layout
+
+    @property
+    def response_widgets(self) -> List[EnhancedDraggableResponseWidget]:
+        """Linhas visíveis da seção exibida"""
+        return self.current_page.visible_rows
 
     def setup_timers(self):
-        """Configura timers para backup automático e verificação da bola flutuante"""
+        """
+        Configura o backup automático e o acompanhamento de foco/visibilidade
+        
+        Foco e bola flutuante são tratados por eventos (focusWindowChanged,
+        applicationStateChanged, show/hide); com o app ocioso nenhum timer
+        periódico acorda a CPU.
+        """
         # Timer para backup automático
         if self.config_manager.get("auto_backup"):
             self.backup_timer = QTimer()
-            self.backup_timer.timeout.connect(self.data_manager.save)
+            self.backup_timer.timeout.connect(self._auto_backup)
             interval = self.config_manager.get("backup_interval", 60) * 60000  # converter para ms
             self.backup_timer.start(interval)
         
-        # Timer para verificar visibilidade da bola flutuante
-        self.floating_check_timer = QTimer()
-        self.floating_check_timer.timeout.connect(self._update_floating_button_visibility)
-        self.floating_check_timer.start(1000)  # Verificar a cada segundo
+        # Atraso para exibir a bola flutuante depois que a janela some
+        self.floating_show_timer = QTimer(self)
+        self.floating_show_timer.setSingleShot(True)
+        self.floating_show_timer.setInterval(100)
+        self.floating_show_timer.timeout.connect(self._update_floating_button_visibility)
         
-        # Timer para verificar se a janela perdeu o foco
-        self.focus_check_timer = QTimer()
-        self.focus_check_timer.timeout.connect(self._check_window_focus)
-        self.focus_check_timer.start(100)  # Verificar a cada 100ms
+        app = QApplication.instance()
+        app.focusWindowChanged.connect(self._on_focus_window_changed)
+        app.applicationStateChanged.connect(self._on_application_state_changed)
+
+    def _auto_backup(self) -> None:
+        """Salva as respostas periodicamente (depois que foram carregadas)"""
+        if self.data_manager is not None:
+            self.data_manager.save()
 
     def _update_floating_button_visibility(self):
         """Atualiza visibilidade da bola flutuante baseado no estado da janela principal"""
+        if self.is_closing:
+            return
         main_visible = self.isVisible()
         floating_visible = self.floating_button.isVisible()
         
         if not main_visible and not floating_visible:
-            self.floating_button.show()
-            self.floating_button.raise_()
+            self.show_floating_button()
         elif main_visible and floating_visible:
             self.floating_button.hide()
 
+    def _on_focus_window_changed(self, focus_window) -> None:
+        """Agenda a minimização quando o foco sai do aplicativo"""
+        if focus_window is None:
+            self._check_window_focus()
+        else:
+            # Foco em uma janela do próprio app (janela principal, diálogos, menus)
+            self._cancel_focus_loss()
+
+    def _on_application_state_changed(self, state) -> None:
+        """Trata a ativação/desativação do aplicativo como um todo"""
+        if state == Qt.ApplicationActive:
+            self._cancel_focus_loss()
+        else:
+            self._check_window_focus()
+
     def _check_window_focus(self):
         """Verifica se a janela perdeu o foco e minimiza se necessário"""
         # Só verificar se a funcionalidade estiver ativada
@@ -1300,24 +2546,44 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
             return
             
         if self.isVisible() and not self.isActiveWindow():
-            # Verificar se o mouse está fora da janela
-            mouse_pos = QCursor.pos()
-            window_rect = self.geometry()
-            
-            # Se o mouse está fora da janela e a janela não está ativa, agendar minimização
-            if not window_rect.contains(mouse_pos):
+            # Mouse ainda sobre a janela (Alt+Tab, clique que atravessou): sem
+            # outro evento de foco a caminho, a decisão fica para o leaveEvent
+            if self.geometry().contains(QCursor.pos()):
+                self.focus_lost_under_cursor = True
+            else:
                 # Usar timer para evitar minimização acidental
-                if not self.focus_loss_timer:
-                    self.focus_loss_timer = QTimer()
-                    self.focus_loss_timer.setSingleShot(True)
-                    self.focus_loss_timer.timeout.connect(self.minimize_window)
-                
-                if not self.focus_loss_timer.isActive():
-                    self.focus_loss_timer.start(300)  # 300ms de delay
+                self._schedule_focus_loss(300)
         else:
             # Se a janela está ativa, cancelar timer de minimização
-            if self.focus_loss_timer and self.focus_loss_timer.isActive():
-                self.focus_loss_timer.stop()
+            self._cancel_focus_loss()
+
+    def _schedule_focus_loss(self, delay: int) -> None:
+        """Agenda a minimização após `delay` ms, se ainda não agendada"""
+        if not self.focus_loss_timer:
+            self.focus_loss_timer = QTimer(self)
+            self.focus_loss_timer.setSingleShot(True)
+            self.focus_loss_timer.timeout.connect(self.minimize_window)
+        
+        if not self.focus_loss_timer.isActive():
+            self.focus_loss_timer.start(delay)
+
+    def _cancel_focus_loss(self) -> None:
+        """Cancela a minimização agendada"""
+        self.focus_lost_under_cursor = False
+        if self.focus_loss_timer and self.focus_loss_timer.isActive():
+            self.focus_loss_timer.stop()
+
+    def showEvent(self, event):
+        """Esconde a bola flutuante quando a janela aparece"""
+        super().showEvent(event)
+        self.floating_show_timer.stop()
+        self._update_floating_button_visibility()
+
+    def hideEvent(self, event):
+        """Mostra a bola flutuante (com atraso) quando a janela some"""
+        super().hideEvent(event)
+        if not self.isVisible():
+            self.floating_show_timer.start()
 
     def focusOutEvent(self, event):
         """Evento chamado quando a janela perde o foco"""
@@ -1325,20 +2591,20 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         # Minimizar quando perder o foco (clicar fora) se a funcionalidade estiver ativada
         if self.isVisible() and self.config_manager.get("minimize_on_focus_loss", True):
             # Usar timer para evitar minimização acidental
-            if not self.focus_loss_timer:
-                self.focus_loss_timer = QTimer()
-                self.focus_loss_timer.setSingleShot(True)
-                self.focus_loss_timer.timeout.connect(self.minimize_window)
-            
-            if not self.focus_loss_timer.isActive():
-                self.focus_loss_timer.start(200)  # 200ms de delay para focusOutEvent
+            self._schedule_focus_loss(200)  # 200ms de delay para focusOutEvent
+
+    def leaveEvent(self, event):
+        """Mouse saiu da janela: conclui a perda de foco adiada em _check_window_focus"""
+        super().leaveEvent(event)
+        if self.focus_lost_under_cursor:
+            self.focus_lost_under_cursor = False
+            self._check_window_focus()
 
     def focusInEvent(self, event):
         """Evento chamado quando a janela ganha o foco"""
         super().focusInEvent(event)
         # Cancelar timer de minimização quando a janela ganhar foco
-        if self.focus_loss_timer and self.focus_loss_timer.isActive():
-            self.focus_loss_timer.stop()
+        self._cancel_focus_loss()
 
     def set_selected_response(self, widget):
         """Define o widget de resposta selecionado"""
@@ -1352,14 +2618,23 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
     def start_drag_operation(self):
         """Inicia operação de drag"""
         self.is_dragging = True
+        self.drag_geometry.clear()
+        screen = self.screen() if hasattr(self, "screen") else QApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 60.0
+        self.drag_move_timer.setInterval(max(1, int(1000 / max(refresh_rate, 1.0))))
         if not self.drop_indicator:
             self.drop_indicator = DragDropIndicator(self.responses_widget)
+        elif self.drop_indicator.parent() is not self.responses_widget:
+            self.drop_indicator.setParent(self.responses_widget)
         if not self.section_drop_indicator:
             self.section_drop_indicator = DragDropIndicator(self.sections_widget)
 
     def end_drag_operation(self):
         """Finaliza operação de drag"""
         self.is_dragging = False
+        self.drag_geometry.clear()
+        self.drag_move_timer.stop()
+        self.pending_drag_move = None
         if self.drop_indicator:
             self.drop_indicator.hide()
         if self.section_drop_indicator:
@@ -1376,19 +2651,16 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
             return
             
         # Se a posição é maior que o número de widgets, inserir no final
-        if position > self.responses_layout.count():
-            position = self.responses_layout.count()
+        rows = self.response_widgets
+        if position > len(rows):
+            position = len(rows)
             
         # Posicionar o indicador
         if position == 0:
             y = 0
         else:
-            widget = self.responses_layout.itemAt(position - 1).widget()
-            if widget:
-                widget_rect = widget.geometry()
-                y = widget_rect.y() + widget_rect.height()
-            else:
-                y = 0
+            widget_rect = rows[position - 1].geometry()
+            y = widget_rect.y() + widget_rect.height()
                 
         self.drop_indicator.setGeometry(0, y, self.responses_widget.width(), 2)
         self.drop_indicator.show()
@@ -1399,7 +2671,7 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if not self.section_drop_indicator or not self.is_dragging:
             return
             
-        if position < 0 or position >= self.sections_layout.count():
+        if position < 0 or position > len(self.section_buttons):
             self.section_drop_indicator.hide()
             return
             
@@ -1407,11 +2679,8 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if position == 0:
             x = 0
         else:
-            widget = self.sections_layout.itemAt(position - 1).widget()
-            if widget:
-                x = widget.x() + widget.width()
-            else:
-                x = 0
+            widget = self.section_buttons[position - 1]
+            x = widget.x() + widget.width()
                 
         self.section_drop_indicator.setGeometry(x, 0, 2, self.sections_widget.height())
         self.section_drop_indicator.show()
@@ -1422,7 +2691,8 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.setMinimumSize(CONFIG.MIN_WINDOW_WIDTH, CONFIG.MIN_WINDOW_HEIGHT)
         self.resize(CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.apply_rendering_mode(self.config_manager.get("rendering_mode", "translucent"))
+        self.animations_enabled = self.config_manager.get("animations", True)
         
         central_widget = QWidget()
         central_widget.setObjectName("centralWidget")
@@ -1486,7 +2756,7 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         btn_close.clicked.connect(self.close_window)
         
         # Barra de busca moderna
-        search_bar = QWidget()
+        search_bar = self.search_bar = QWidget()
         search_bar.setObjectName("searchBar")
         search_bar.setFixedHeight(65)
         search_layout = QHBoxLayout(search_bar)
@@ -1534,7 +2804,24 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.sections_layout.setAlignment(Qt.AlignLeft)
         self.sections_layout.setContentsMargins(0, 0, 0, 0)
         
+        # Depois dos botões: mensagem de barra vazia e spacer (botões entram antes deles)
+        self.no_sections_label = QLabel("📁 Nenhuma seção criada")
+        self.no_sections_label.setObjectName("emptyLabel")
+        self.no_sections_label.setAlignment(Qt.AlignCenter)
+        self.no_sections_label.hide()
+        self.sections_layout.addWidget(self.no_sections_label)
+        spacer = QWidget()
+        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.sections_layout.addWidget(spacer)
+        
         self.sections_scroll.setWidget(self.sections_widget)
+        # Roda do mouse rola a barra de seções na horizontal
+        self.sections_scroll.viewport().installEventFilter(self)
+        
+        # Botões de seção persistentes; a seleção apenas alterna o estado marcado
+        self.section_group = QButtonGroup(self)
+        self.section_group.setExclusive(True)
+        self.section_group.buttonClicked.connect(self._on_section_button_clicked)
         
         # Botões de ação com ícones modernos
         btn_import = QPushButton("📁")
@@ -1575,24 +2862,14 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.section_info.setAlignment(Qt.AlignCenter)
         content_layout.addWidget(self.section_info)
         
-        # Área de respostas
-        self.responses_scroll = QScrollArea()
-        self.responses_scroll.setWidgetResizable(True)
-        
-        self.responses_widget = QWidget()
-        self.responses_widget.setAcceptDrops(True)
-        self.responses_layout = QVBoxLayout(self.responses_widget)
-        self.responses_layout.setAlignment(Qt.AlignTop)
-        self.responses_layout.setContentsMargins(0, 0, 8, 0)
-        self.responses_layout.setSpacing(6)
-        
-        self.responses_scroll.setWidget(self.responses_widget)
+        # Área de respostas: uma SectionPage em cache por seção visitada
+        self.pages_stack = QStackedWidget()
         
         # Botão adicionar resposta moderno
         self.btn_add_response = QPushButton("➕ Adicionar Resposta (Ctrl+N)")
         self.btn_add_response.setObjectName("addButton")
         
-        content_layout.addWidget(self.responses_scroll)
+        content_layout.addWidget(self.pages_stack)
         content_layout.addWidget(self.btn_add_response)
         
         main_layout.addWidget(self.content_container)
@@ -1602,329 +2879,62 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.apply_styles()
 
     def apply_styles(self):
-        theme = self.current_theme
-        stylesheet = f"""
-            #centralWidget {{
-                background-color: {theme['BACKGROUND']};
-                border: 3px solid {theme['PRIMARY_COLOR']};
-                border-radius: 16px;
-            }}
-            #titleBar {{ 
-                background-color: transparent; 
-                border-bottom: 1px solid {theme['BORDER_COLOR']};
-            }}
-            #titleLabel {{
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                color: {theme['PRIMARY_COLOR']};
-                font-size: 18px;
-                font-weight: bold;
-                letter-spacing: 0.5px;
-            }}
-            #titleButton {{
-                background-color: transparent;
-                color: {theme['PRIMARY_COLOR']};
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 32px;
-                min-height: 32px;
-                border-radius: 8px;
-            }}
-            #titleButton:hover {{ 
-                background-color: {theme['HOVER_BG']}; 
-            }}
-            #searchBar {{ 
-                background-color: transparent; 
-                padding: 8px 0;
-            }}
-            #searchInput {{
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 12px;
-                padding: 10px 16px;
-                font-size: 13px;
-                background-color: {theme['BACKGROUND']};
-                color: {theme['TEXT_COLOR']};
-                font-family: "{CONFIG.APP_FONT_NAME}";
-            }}
-            #searchInput:focus {{ 
-                border-color: {theme['PRIMARY_COLOR']}; 
-            }}
-            #clearSearchButton {{
-                background-color: {theme['SECONDARY_COLOR']};
-                color: {theme['TEXT_COLOR']};
-                border: none;
-                border-radius: 10px;
-                font-size: 12px;
-                font-weight: bold;
-            }}
-            #clearSearchButton:hover {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-            }}
-            QComboBox {{
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 10px;
-                padding: 8px 12px;
-                background-color: {theme['BACKGROUND']};
-                color: {theme['TEXT_COLOR']};
-                min-width: 110px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                font-size: 12px;
-            }}
-            QComboBox:hover {{
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            QComboBox:focus {{
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {theme['TEXT_COLOR']};
-                margin-right: 8px;
-            }}
-            #sectionsContainer {{ 
-                background-color: transparent; 
-                border-bottom: 1px solid {theme['BORDER_COLOR']}; 
-                padding: 8px 0;
-            }}
-            #addSectionButton, #importButton, #exportButton {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 32px;
-                min-height: 32px;
-            }}
-            #addSectionButton:hover, #importButton:hover, #exportButton:hover {{ 
-                background-color: {theme['ACCENT_COLOR']}; 
-            }}
-            #addSectionButton {{
-                color: white !important;
-            }}
-            QPushButton#sectionButton {{
-                background-color: {theme['SECONDARY_COLOR']};
-                color: {theme['TEXT_COLOR']};
-                border: 2px solid {theme['BORDER_COLOR']};
-                padding: 8px 14px;
-                border-radius: 12px;
-                font-size: 12px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                min-width: 70px;
-            }}
-            QPushButton#sectionButton:hover {{ 
-                background-color: {theme['HOVER_BG']}; 
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            QPushButton#sectionButton:checked {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-                font-weight: bold;
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            QPushButton#sectionButton[dragging="true"] {{
-                background-color: {theme['ACCENT_COLOR']};
-                color: white;
-                border: 2px solid {theme['PRIMARY_COLOR']};
-            }}
-            #contentContainer {{ 
-                background-color: transparent; 
-                padding: 8px 0;
-            }}
-            #sectionInfo {{
-                color: {theme['TEXT_COLOR']};
-                font-size: 12px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                margin: 8px 0;
-                opacity: 0.8;
-                font-weight: 500;
-            }}
-            QPushButton#responseButton {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-                border: none;
-                padding: 14px 16px;
-                text-align: left;
-                border-radius: 10px;
-                font-size: 13px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                min-height: 24px;
-            }}
-            QPushButton#responseButton:hover {{ 
-                background-color: {theme['ACCENT_COLOR']}; 
-            }}
-            QPushButton#menuButton {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                min-width: 32px;
-                max-width: 32px;
-                font-weight: bold;
-                font-size: 16px;
-            }}
-            QPushButton#menuButton:hover {{ 
-                background-color: {theme['ACCENT_COLOR']}; 
-            }}
-            QPushButton#menuButton::menu-indicator {{ 
-                image: none; 
-            }}
-            QPushButton#arrowButton {{
-                background-color: {theme['SECONDARY_COLOR']};
-                color: {theme['TEXT_COLOR']};
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton#arrowButton:hover {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            QPushButton#arrowButton:disabled {{
-                background-color: {theme['BORDER_COLOR']};
-                color: {theme['TEXT_COLOR']};
-                opacity: 0.4;
-                border-color: {theme['BORDER_COLOR']};
-            }}
-            #addButton {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white !important;
-                font-weight: bold;
-                border: none;
-                padding: 14px;
-                border-radius: 10px;
-                font-size: 14px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-            }}
-            #addButton:hover {{ 
-                background-color: {theme['ACCENT_COLOR']}; 
-            }}
-            QScrollBar:vertical {{
-                border: none;
-                background: {theme['SECONDARY_COLOR']};
-                width: 10px;
-                margin: 0px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {theme['BORDER_COLOR']};
-                min-height: 30px;
-                border-radius: 5px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: {theme['PRIMARY_COLOR']};
-            }}
-            QScrollBar:horizontal {{
-                border: none;
-                background: {theme['SECONDARY_COLOR']};
-                height: 10px;
-                margin: 0px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {theme['BORDER_COLOR']};
-                min-width: 30px;
-                border-radius: 5px;
-                margin: 2px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: {theme['PRIMARY_COLOR']};
-            }}
-            #emptyLabel {{
-                color: {theme['TEXT_COLOR']};
-                font-size: 13px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                font-style: italic;
-                opacity: 0.6;
-                text-align: center;
-                padding: 20px;
-            }}
-            QMenu {{
-                background-color: {theme['CARD_BG']};
-                color: {theme['TEXT_COLOR']};
-                border: 1px solid {theme['BORDER_COLOR']};
-                border-radius: 8px;
-                padding: 4px;
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                font-size: 12px;
-            }}
-            QMenu::item {{
-                padding: 8px 12px;
-                border-radius: 4px;
-                margin: 1px;
-            }}
-            QMenu::item:selected {{
-                background-color: {theme['PRIMARY_COLOR']};
-                color: white;
-            }}
-            QGroupBox {{
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                font-weight: bold;
-                font-size: 13px;
-                color: {theme['PRIMARY_COLOR']};
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-            }}
-            QDialog {{
-                background-color: {theme['BACKGROUND']};
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 12px;
-            }}
-            QLabel {{
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                color: {theme['TEXT_COLOR']};
-            }}
-            QLineEdit, QTextEdit {{
-                font-family: "{CONFIG.APP_FONT_NAME}";
-                border: 2px solid {theme['BORDER_COLOR']};
-                border-radius: 8px;
-                padding: 8px;
-                background-color: {theme['BACKGROUND']};
-                color: {theme['TEXT_COLOR']};
-            }}
-            QLineEdit:focus, QTextEdit:focus {{
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            EnhancedDraggableResponseWidget {{
-                background-color: {theme['CARD_BG']};
-                border: 1px solid {theme['BORDER_COLOR']};
-                border-radius: 8px;
-                margin: 2px 0;
-            }}
-            EnhancedDraggableResponseWidget:hover {{
-                background-color: {theme['HOVER_BG']};
-                border-color: {theme['PRIMARY_COLOR']};
-            }}
-            EnhancedDraggableResponseWidget[selected="true"] {{
-                background-color: {theme['PRIMARY_COLOR']}20;
-                border: 1px solid {theme['PRIMARY_COLOR']};
-                border-radius: 8px;
-            }}
-            EnhancedDraggableResponseWidget[dragging="true"] {{
-                background-color: {theme['PRIMARY_COLOR']}40;
-                border: 2px solid {theme['PRIMARY_COLOR']};
-                border-radius: 8px;
-                opacity: 0.8;
-            }}
+        """Aplica a folha de estilos e a paleta do tema atual"""
+        self.setStyleSheet(get_theme_stylesheet(self.current_theme_name))
+        self.setPalette(get_theme_palette(self.current_theme_name))
+
+    def apply_theme(self, theme_name: str) -> None:
+        """
+        Troca o tema sem recriar widgets; não faz nada se o tema não mudou
+        
+        Um tema do usuário recarregado por load_user_themes é um novo dict em
+        THEMES, então o mesmo nome com outras cores também é reaplicado.
+        """
+        if theme_name not in THEMES:
+            theme_name = "light"
+        if theme_name == self.current_theme_name and THEMES[theme_name] is self.current_theme:
+            return
+        self.current_theme_name = theme_name
+        self.current_theme = THEMES[theme_name]
+        self.apply_styles()
+        self.floating_button.set_theme(theme_name)
+        if self.quick_launcher is not None:
+            self.quick_launcher.apply_theme(theme_name)
+
+    def apply_rendering_mode(self, mode: str) -> None:
+        """
+        Alterna entre janela translúcida (ARGB) e opaca com máscara arredondada
+        
+        No modo opaco o compositor não precisa mesclar a janela inteira a cada
+        repintura; os cantos arredondados vêm de uma máscara (sem antialiasing).
         """
-        self.setStyleSheet(stylesheet)
+        opaque = mode == "opaque"
+        new_mode = "opaque" if opaque else "translucent"
+        if new_mode != self.rendering_mode:
+            was_visible = self.isVisible()
+            self.rendering_mode = new_mode
+            self.setAttribute(Qt.WA_TranslucentBackground, not opaque)
+            self.setAutoFillBackground(opaque)
+            if self.windowHandle() is not None:
+                # O formato da superfície só muda ao recriar a janela nativa
+                self.setWindowFlags(self.windowFlags())
+                if was_visible:
+                    self.show()
+        self._update_window_mask()
+
+    def _update_window_mask(self) -> None:
+        """Recorta os cantos da janela opaca seguindo o raio do #centralWidget"""
+        if self.rendering_mode != "opaque":
+            self.clearMask()
+            return
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(self.rect()), 16, 16)
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.rendering_mode == "opaque":
+            self._update_window_mask()
 
     def setup_connections(self):
         self.search_input.textChanged.connect(self.filter_responses)
@@ -1935,10 +2945,12 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.sections_widget.dragMoveEvent = self.sections_drag_move_event
         self.sections_widget.dropEvent = self.sections_drop_event
         
-        # Drag and drop para respostas - versão melhorada
-        self.responses_widget.dragEnterEvent = self.responses_drag_enter_event
-        self.responses_widget.dragMoveEvent = self.responses_drag_move_event_enhanced
-        self.responses_widget.dropEvent = self.responses_drop_event_enhanced
+
+    def setup_response_drop_area(self, responses_widget: QWidget) -> None:
+        """Conecta o drag and drop de respostas na área de uma página"""
+        responses_widget.dragEnterEvent = self.responses_drag_enter_event
+        responses_widget.dragMoveEvent = self.responses_drag_move_event_enhanced
+        responses_widget.dropEvent = self.responses_drop_event_enhanced
 
     def sections_drag_enter_event(self, event):
         if event.mimeData().hasText():
@@ -1947,11 +2959,11 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
     def sections_drag_move_event(self, event):
         if event.mimeData().hasText():
             event.acceptProposedAction()
-            
-            # Mostrar indicador de drop para seções
-            pos = event.pos()
-            drop_position = self.calculate_section_drop_position(pos)
-            self.show_section_drop_indicator(drop_position)
+            self._queue_drag_move(self._update_section_drag, event.pos())
+
+    def _update_section_drag(self, pos: QPoint) -> None:
+        """Mostra o indicador de drop para seções"""
+        self.show_section_drop_indicator(self.calculate_section_drop_position(pos))
 
     def sections_drop_event(self, event):
         mime_text = event.mimeData().text()
@@ -1984,15 +2996,31 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
             return
             
         event.acceptProposedAction()
-        
-        # Calcular posição de inserção
-        pos = event.pos()
-        drop_position = self.calculate_drop_position(pos)
-        self.show_drop_indicator(drop_position)
-        
-        # Scroll automático
+        self._queue_drag_move(self._update_response_drag, event.pos())
+
+    def _update_response_drag(self, pos: QPoint) -> None:
+        """Mostra o indicador de drop e rola a área de respostas"""
+        self.show_drop_indicator(self.calculate_drop_position(pos))
         self._auto_scroll_during_drag(pos)
 
+    def _queue_drag_move(self, handler: Callable[[QPoint], None], pos: QPoint) -> None:
+        """
+        Agenda o processamento do movimento do drag
+        
+        Eventos de movimento chegam mais rápido do que a tela é atualizada;
+        apenas a última posição de cada quadro é processada.
+        """
+        self.pending_drag_move = (handler, QPoint(pos))
+        if not self.drag_move_timer.isActive():
+            self.drag_move_timer.start()
+
+    def _flush_drag_move(self) -> None:
+        """Processa a última posição recebida durante o drag"""
+        pending, self.pending_drag_move = self.pending_drag_move, None
+        if pending and self.is_dragging:
+            handler, pos = pending
+            handler(pos)
+
     def responses_drop_event_enhanced(self, event):
         mime_text = event.mimeData().text()
         pos = event.pos()
@@ -2013,142 +3041,106 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         
         event.acceptProposedAction()
 
-    def _calculate_drop_position(self, pos: QPoint, layout, is_horizontal: bool = False) -> int:
+    def _calculate_drop_position(self, pos: QPoint, widgets: List[QWidget],
+                                 is_horizontal: bool = False) -> int:
         """
         Calcula a posição onde o item será inserido
         
         Args:
             pos: Posição do cursor
-            layout: Layout a ser verificado
+            widgets: Widgets visíveis, na ordem de exibição
             is_horizontal: Se True, calcula posição horizontal (para seções)
             
         Returns:
             Posição de inserção
         """
-        if layout.count() == 0:
-            return 0
-            
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                widget_rect = widget.geometry()
-                
-                if is_horizontal:
-                    # Para seções (horizontal)
-                    if pos.x() < widget_rect.x() + widget_rect.width() // 2:
-                        return i
-                else:
-                    # Para respostas (vertical)
-                    if pos.y() < widget_rect.y() + widget_rect.height() // 2:
-                        return i
+        midpoints = self._drop_midpoints(widgets, is_horizontal)
+        return bisect_right(midpoints, pos.x() if is_horizontal else pos.y())
+
+    def _drop_midpoints(self, widgets: List[QWidget], is_horizontal: bool) -> List[int]:
+        """
+        Retorna os pontos médios dos widgets (ordenados) no eixo do drag
         
-        return layout.count()
+        Durante o drag a geometria é lida uma única vez e reaproveitada a cada
+        movimento; a rolagem não altera a posição dos widgets na área interna.
+        """
+        midpoints = self.drag_geometry.get(is_horizontal) if self.is_dragging else None
+        if midpoints is None or len(midpoints) != len(widgets):
+            if is_horizontal:
+                midpoints = [w.x() + w.width() // 2 for w in widgets]
+            else:
+                midpoints = [w.y() + w.height() // 2 for w in widgets]
+            if self.is_dragging:
+                self.drag_geometry[is_horizontal] = midpoints
+        return midpoints
 
-    def _get_widget_at_position(self, pos: QPoint, layout) -> Optional[str]:
+    def _get_widget_at_position(self, pos: QPoint, widgets: List[QWidget]) -> Optional[str]:
         """
         Retorna o texto do widget na posição especificada
         
         Args:
             pos: Posição do cursor
-            layout: Layout a ser verificado
+            widgets: Widgets a serem verificados
             
         Returns:
             Texto do widget ou None
         """
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if widget.geometry().contains(pos):
-                    return widget.text()
+        for widget in widgets:
+            if widget.geometry().contains(pos):
+                return widget.text()
         return None
 
-    def _reorder_items(self, item_name: str, new_position: int, 
-                      items_list: List, save_func) -> bool:
+    @staticmethod
+    def _drop_target_index(current_index: int, drop_position: int, count: int) -> int:
         """
-        Reordena itens em uma lista
+        Converte a posição de drop (antes da remoção do item) em índice final
         
         Args:
-            item_name: Nome do item a ser movido
-            new_position: Nova posição
-            items_list: Lista de itens (strings para seções, dicionários para respostas)
-            save_func: Função para salvar mudanças
+            current_index: Índice atual do item arrastado
+            drop_position: Posição de inserção calculada durante o drag
+            count: Número de itens na lista
             
         Returns:
-            True se reordenou com sucesso
+            Índice final do item após o movimento
         """
-        try:
-            # Verificar se é lista de strings (seções) ou dicionários (respostas)
-            if items_list and isinstance(items_list[0], str):
-                # Lista de seções (strings)
-                current_index = next(i for i, item in enumerate(items_list) 
-                                   if item == item_name)
-            else:
-                # Lista de respostas (dicionários)
-                current_index = next(i for i, item in enumerate(items_list) 
-                                   if item["texto"] == item_name)
-        except StopIteration:
-            return False
-            
-        if current_index == new_position:
-            return True
-            
-        # Remover da posição atual
-        item = items_list.pop(current_index)
-        
-        # Ajustar nova posição se necessário
-        if current_index < new_position:
-            new_position -= 1
-        
-        # Inserir na nova posição
-        if new_position >= len(items_list):
-            items_list.append(item)
-        else:
-            items_list.insert(new_position, item)
-            
-        return save_func()
+        if current_index < drop_position:
+            drop_position -= 1
+        return max(0, min(drop_position, count - 1))
 
     def calculate_section_drop_position(self, pos: QPoint) -> int:
         """Calcula a posição onde a seção será inserida"""
-        return self._calculate_drop_position(pos, self.sections_layout, is_horizontal=True)
+        return self._calculate_drop_position(pos, self.section_buttons, is_horizontal=True)
 
     def get_section_at_position(self, pos: QPoint) -> Optional[str]:
         """Retorna o nome da seção na posição especificada"""
-        return self._get_widget_at_position(pos, self.sections_layout)
+        return self._get_widget_at_position(pos, self.section_buttons)
 
     def reorder_section(self, section_name: str, new_position: int) -> None:
         """Reordena uma seção para nova posição"""
         sections = list(self.data_manager.data.keys())
-        
-        if self._reorder_items(section_name, new_position, sections, 
-                             lambda: self.data_manager.reorder_sections(sections)):
-            self.update_sections_ui()
+        if section_name not in sections:
+            return
+            
+        current_index = sections.index(section_name)
+        self.data_manager.move_section(
+            current_index, self._drop_target_index(current_index, new_position, len(sections)))
 
     def move_response_to_section(self, response_text: str, target_section: str) -> None:
         """Move uma resposta de uma seção para outra"""
-        current_responses = self.data_manager.data[self.current_section]
-        
-        # Encontrar a resposta na seção atual
-        response_data = next((item for item in current_responses 
-                            if item["texto"] == response_text), None)
-        
-        if response_data:
-            # Remover da seção atual e adicionar na nova
-            if (self.data_manager.remove_response(self.current_section, response_text) and
-                self.data_manager.add_response(target_section, response_text)):
-                self.update_sections_ui()
-                self.update_responses_ui()
+        self.data_manager.move_response_to_section(
+            self.current_section, response_text, target_section)
 
     def calculate_drop_position(self, pos: QPoint) -> int:
         """Calcula a posição onde o item será inserido"""
-        return self._calculate_drop_position(pos, self.responses_layout)
+        return self._calculate_drop_position(pos, self.response_widgets)
 
     def _auto_scroll_during_drag(self, pos: QPoint) -> None:
         """Scroll automático durante drag"""
         scroll_area = self.responses_scroll
         viewport = scroll_area.viewport()
         viewport_rect = viewport.rect()
+        # A posição chega em coordenadas da área interna (rolada)
+        pos = self.responses_widget.mapTo(viewport, pos)
         
         scroll_margin = 30
         scroll_speed = 5
@@ -2164,13 +3156,29 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
                 scroll_area.verticalScrollBar().value() + scroll_speed
             )
 
+    def _response_index(self, response_text: str) -> Optional[int]:
+        """Retorna o índice da resposta na seção atual"""
+        current_responses = self.data_manager.data.get(self.current_section, [])
+        return next((i for i, item in enumerate(current_responses)
+                     if item["texto"] == response_text), None)
+
     def reorder_response(self, response_text: str, new_position: int) -> None:
         """Reordena uma resposta para nova posição"""
-        current_responses = self.data_manager.data[self.current_section]
-        
-        if self._reorder_items(response_text, new_position, current_responses,
-                             self.data_manager.save):
-            self.update_responses_ui()
+        current_index = self._response_index(response_text)
+        if current_index is None:
+            return
+            
+        # A posição de drop refere-se às linhas visíveis (com filtro ativo)
+        if self.search_filter:
+            if new_position < len(self.response_widgets):
+                new_position = self.current_page.rows.index(self.response_widgets[new_position])
+            else:
+                new_position = len(self.data_manager.data[self.current_section])
+                
+        count = len(self.data_manager.data[self.current_section])
+        self.data_manager.move_response(
+            self.current_section, current_index,
+            self._drop_target_index(current_index, new_position, count))
 
     def _move_response(self, response_text: str, direction: int) -> None:
         """
@@ -2180,27 +3188,18 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
             response_text: Texto da resposta a ser movida
             direction: 1 para baixo, -1 para cima
         """
-        current_responses = self.data_manager.data[self.current_section]
-        
-        try:
-            current_index = next(i for i, item in enumerate(current_responses) 
-                               if item["texto"] == response_text)
-        except StopIteration:
+        current_index = self._response_index(response_text)
+        if current_index is None:
             return
             
         new_index = current_index + direction
         
         # Verificar limites
-        if new_index < 0 or new_index >= len(current_responses):
+        if new_index < 0 or new_index >= len(self.data_manager.data[self.current_section]):
             return
             
-        # Trocar posições
-        current_responses[current_index], current_responses[new_index] = \
-            current_responses[new_index], current_responses[current_index]
-        
-        # Salvar e atualizar UI
-        if self.data_manager.save():
-            self.update_responses_ui()
+        # Trocar posições (a UI é atualizada via _on_data_changed)
+        self.data_manager.move_response(self.current_section, current_index, new_index)
 
     def move_response_up(self, response_text: str) -> None:
         """Move uma resposta para cima na lista"""
@@ -2228,12 +3227,11 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         }
         
         sort_by = sort_map.get(sort_text, "creation")
-        if self.data_manager.sort_responses(
+        self.data_manager.sort_responses(
             self.current_section, 
             sort_by, 
             self.stats_manager.stats["response_usage"]
-        ):
-            self.update_responses_ui()
+        )
 
     def setup_shortcuts(self):
         # Atalhos existentes
@@ -2288,8 +3286,12 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if obj == self:
             if event.type() in [event.KeyPress, event.MouseButtonPress, event.MouseMove]:
                 # Cancelar timer de minimização se o usuário interagir
-                if self.focus_loss_timer and self.focus_loss_timer.isActive():
-                    self.focus_loss_timer.stop()
+                self._cancel_focus_loss()
+        elif obj is self.sections_scroll.viewport() and event.type() == QEvent.Wheel:
+            delta = event.angleDelta().y() or event.angleDelta().x()
+            scroll_bar = self.sections_scroll.horizontalScrollBar()
+            scroll_bar.setValue(scroll_bar.value() - delta)
+            return True
         
         return super().eventFilter(obj, event)
 
@@ -2324,116 +3326,212 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self._execute_on_selected_response(self.move_response_down)
 
     def update_sections_ui(self):
-        """Atualiza a interface das seções"""
+        """Reconstrói a barra de seções (carga inicial e redefinições)"""
+        self.sections_widget.setUpdatesEnabled(False)
+        
         # Limpar seções existentes
-        for i in reversed(range(self.sections_layout.count())):
-            child = self.sections_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        for button in self.section_buttons:
+            self.section_group.removeButton(button)
+            button.setParent(None)
+            button.deleteLater()
+        self.section_buttons = []
         
         # Adicionar seções
-        for section_name in self.data_manager.data.keys():
-            section_btn = DraggableSectionButton(section_name)
-            section_btn.clicked.connect(lambda checked, name=section_name: self.select_section(name))
-            section_btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            section_btn.customContextMenuRequested.connect(
-                lambda pos, name=section_name: self.show_section_menu(name, pos)
-            )
+        for index, section_name in enumerate(self.data_manager.data):
+            self._insert_section_button(index, section_name)
+        
+        self.no_sections_label.setVisible(not self.section_buttons)
+        self.sections_widget.setUpdatesEnabled(True)
+        self._sync_section_buttons()
+
+    def _insert_section_button(self, index: int, section_name: str) -> None:
+        """Cria o botão da seção na posição indicada"""
+        section_btn = DraggableSectionButton(section_name, self.sections_widget)
+        section_btn.setContextMenuPolicy(Qt.CustomContextMenu)
+        section_btn.customContextMenuRequested.connect(self._on_section_context_menu)
+        section_btn.setChecked(section_name == self.current_section)
+        
+        self.section_group.addButton(section_btn)
+        self.sections_layout.insertWidget(index, section_btn)
+        self.section_buttons.insert(index, section_btn)
+        self.no_sections_label.hide()
+
+    def _remove_section_button(self, index: int) -> None:
+        """Remove o botão da seção na posição indicada"""
+        if not 0 <= index < len(self.section_buttons):
+            return
             
-            if section_name == self.current_section:
-                section_btn.setChecked(True)
+        section_btn = self.section_buttons.pop(index)
+        self.section_group.removeButton(section_btn)
+        self.sections_layout.removeWidget(section_btn)
+        section_btn.setParent(None)
+        section_btn.deleteLater()
+        self.no_sections_label.setVisible(not self.section_buttons)
+
+    def _move_section_button(self, from_index: int, to_index: int) -> None:
+        """Move o botão da seção sem recriá-lo"""
+        count = len(self.section_buttons)
+        if not (0 <= from_index < count and 0 <= to_index < count):
+            # Barra fora de sincronia com os dados: reconstruir
+            self.update_sections_ui()
+            return
             
-            self.sections_layout.addWidget(section_btn)
-        
-        # Adicionar spacer
-        spacer = QWidget()
-        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.sections_layout.addWidget(spacer)
-        
-        # Se não há seções, mostrar mensagem
-        if not self.data_manager.data:
-            no_sections_label = QLabel("📁 Nenhuma seção criada")
-            no_sections_label.setObjectName("emptyLabel")
-            no_sections_label.setAlignment(Qt.AlignCenter)
-            self.sections_layout.addWidget(no_sections_label)
+        section_btn = self.section_buttons.pop(from_index)
+        self.section_buttons.insert(to_index, section_btn)
+        self.sections_layout.removeWidget(section_btn)
+        self.sections_layout.insertWidget(to_index, section_btn)
+
+    def _sync_section_buttons(self) -> None:
+        """Marca o botão da seção atual e garante que esteja visível"""
+        for section_btn in self.section_buttons:
+            if section_btn.text() == self.current_section:
+                section_btn.setChecked(True)
+                self.sections_scroll.ensureWidgetVisible(section_btn, 20, 0)
+                break
+
+    def _on_section_button_clicked(self, button) -> None:
+        """Seleciona a seção do botão clicado"""
+        self.select_section(button.text())
+
+    def _on_section_context_menu(self, pos: QPoint) -> None:
+        """Abre o menu de contexto da seção cujo botão foi clicado"""
+        section_btn = self.sender()
+        if section_btn in self.section_buttons:
+            self.show_section_menu(section_btn.text(), section_btn.mapToGlobal(pos))
 
     def update_responses_ui(self):
-        """Atualiza a interface das respostas"""
-        # Limpar respostas existentes
-        for i in reversed(range(self.responses_layout.count())):
-            child = self.responses_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        # Filtrar respostas se necessário
-        responses = self.data_manager.data.get(self.current_section, [])
-        if self.search_filter:
-            filtered_responses = []
-            for response in responses:
-                if self.search_filter.lower() in response["texto"].lower():
-                    filtered_responses.append(response)
-            responses = filtered_responses
-        
-        # Adicionar respostas
-        response_widgets = []
-        for response_data in responses:
-            response_widget = EnhancedDraggableResponseWidget(response_data, self)
-            self.responses_layout.addWidget(response_widget)
-            response_widgets.append(response_widget)
-        
-        # Configurar botões de seta
-        for i, widget in enumerate(response_widgets):
-            is_first = (i == 0)
-            is_last = (i == len(response_widgets) - 1)
-            widget.update_arrow_buttons(is_first, is_last)
-        
-        # Mostrar mensagem se não há respostas
-        if not responses:
-            empty_label = QLabel("📝 Nenhuma resposta encontrada\nClique em 'Adicionar Resposta' para começar")
-            empty_label.setObjectName("emptyLabel")
-            empty_label.setAlignment(Qt.AlignCenter)
-            self.responses_layout.addWidget(empty_label)
+        """Exibe a página da seção atual, montando-a se não estiver em cache"""
+        page = self.page_cache.get(self.current_section)
+        if page is None:
+            page = SectionPage(self.current_section, self)
+            self.page_cache[self.current_section] = page
+            self.pages_stack.addWidget(page)
+        self.page_cache.move_to_end(self.current_section)
+        
+        if page.filter_text != self.search_filter:
+            page.apply_filter(self.search_filter)
+        self.pages_stack.setCurrentWidget(page)
+        self._trim_page_cache()
+        
+        if self.config_manager.get("prebuild_sections", True):
+            self.prebuild_timer.start()
         
         # Atualizar info da seção (removido o texto da seção)
-        total_responses = len(self.data_manager.data.get(self.current_section, []))
-        filtered_count = len(responses) if self.search_filter else total_responses
-        # self.section_info.setText(f"Seção: {self.current_section} ({filtered_count}/{total_responses} respostas)")
         self.section_info.setText("")
 
+    def _trim_page_cache(self) -> None:
+        """Descarta as páginas menos usadas até respeitar os limites do cache"""
+        total_rows = sum(page.row_count for page in self.page_cache.values())
+        for section in list(self.page_cache):
+            if (len(self.page_cache) <= CONFIG.PAGE_CACHE_MAX_PAGES and
+                    total_rows <= CONFIG.PAGE_CACHE_MAX_ROWS):
+                break
+            if section == self.current_section:
+                continue
+            total_rows -= self.page_cache[section].row_count
+            self._discard_page(section)
+
+    def _discard_page(self, section: str) -> None:
+        """Remove a página da seção do cache"""
+        page = self.page_cache.pop(section, None)
+        if page is None:
+            return
+        if self.selected_response_widget in page.rows:
+            self.selected_response_widget = None
+        self.pages_stack.removeWidget(page)
+        page.deleteLater()
+
+    def _prebuild_next_section(self) -> None:
+        """Monta em segundo plano a página da seção seguinte, se couber no cache"""
+        sections = list(self.data_manager.data.keys())
+        if self.current_section not in sections:
+            return
+        index = sections.index(self.current_section) + 1
+        if index >= len(sections) or sections[index] in self.page_cache:
+            return
+            
+        next_section = sections[index]
+        total_rows = sum(page.row_count for page in self.page_cache.values())
+        if (len(self.page_cache) >= CONFIG.PAGE_CACHE_MAX_PAGES or
+                total_rows + len(self.data_manager.data[next_section]) > CONFIG.PAGE_CACHE_MAX_ROWS):
+            return
+            
+        page = SectionPage(next_section, self)
+        self.pages_stack.addWidget(page)
+        self.page_cache[next_section] = page
+        # Página pré-montada é a primeira candidata a sair do cache
+        self.page_cache.move_to_end(next_section, last=False)
+
+    def _on_data_changed(self, change: DataChange) -> None:
+        """Aplica na interface apenas a alteração emitida pelo DataManager"""
+        if change.kind == SECTION_INSERTED:
+            self._insert_section_button(change.index, change.section)
+        elif change.kind == SECTION_MOVED:
+            self._move_section_button(change.index, change.to_index)
+        elif change.kind == SECTION_RENAMED:
+            if change.old_name == self.current_section:
+                self.current_section = change.section
+            if 0 <= change.index < len(self.section_buttons):
+                self.section_buttons[change.index].setText(change.section)
+            else:
+                self.update_sections_ui()
+            if change.old_name in self.page_cache:
+                self.page_cache = OrderedDict(
+                    (change.section if section == change.old_name else section, page)
+                    for section, page in self.page_cache.items()
+                )
+                self.page_cache[change.section].section = change.section
+        elif change.kind == SECTION_REMOVED:
+            self._remove_section_button(change.index)
+            if change.section == self.current_section:
+                self.select_section(next(iter(self.data_manager.data), "Geral"))
+            self._discard_page(change.section)
+        elif change.kind == SECTIONS_RESET:
+            if self.current_section not in self.data_manager.data:
+                self.current_section = next(iter(self.data_manager.data), "Geral")
+            self.update_sections_ui()
+            # Importação pode alterar qualquer seção: descartar o cache
+            for section in list(self.page_cache):
+                self._discard_page(section)
+            self.update_responses_ui()
+        elif change.section in self.page_cache:
+            self.page_cache[change.section].apply_change(change)
+            if change.kind == RESPONSE_INSERTED:
+                self._trim_page_cache()
+
     def select_section(self, section_name: str):
         """Seleciona uma seção"""
         if section_name in self.data_manager.data:
+            self.set_selected_response(None)
             self.current_section = section_name
-            self.update_sections_ui()
+            self._sync_section_buttons()
             self.update_responses_ui()
 
     def filter_responses(self, search_text: str):
         """Filtra respostas baseado no texto de busca"""
         self.search_filter = search_text
-        self.update_responses_ui()
+        self.current_page.apply_filter(search_text)
 
     def add_section(self):
         """Adiciona nova seção"""
         name, ok = QInputDialog.getText(self, "Nova Seção", "Nome da seção:")
         if ok and name:
             # Verifica se há efeitos especiais para este nome de seção
+            # (importado sob demanda: o módulo não pesa na inicialização)
+            from special_effects import validate_section_name
             if validate_section_name(name, self):
                 print("🎉 Efeito especial ativado!")
                 return  # Não cria a seção, apenas mostra o efeito especial
             
             # Só cria a seção se não for o easter egg
             if self.data_manager.add_section(name):
-                self.update_sections_ui()
                 self.select_section(name)
 
     def rename_section(self, section_name: str):
         """Renomeia uma seção"""
         new_name, ok = QInputDialog.getText(self, "Renomear Seção", "Novo nome:", text=section_name)
         if ok and new_name and new_name != section_name:
-            if self.data_manager.rename_section(section_name, new_name):
-                self.current_section = new_name
-                self.update_sections_ui()
-                self.update_responses_ui()
+            self.data_manager.rename_section(section_name, new_name)
 
     def remove_section(self, section_name: str):
         """Remove uma seção"""
@@ -2445,10 +3543,69 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
                                    f"Remover a seção '{section_name}' e todas as suas respostas?",
                                    QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            if self.data_manager.remove_section(section_name):
-                self.current_section = list(self.data_manager.data.keys())[0]
-                self.update_sections_ui()
-                self.update_responses_ui()
+            self.data_manager.remove_section(section_name)
+
+    def _build_response_menu(self) -> None:
+        """Cria o menu de opções compartilhado por todas as respostas"""
+        self.response_menu = QMenu(self)
+        self.response_edit_action = self.response_menu.addAction("✏️ Editar (F2)")
+        self.response_duplicate_action = self.response_menu.addAction("📋 Duplicar (Ctrl+D)")
+        self.response_remove_action = self.response_menu.addAction("🗑️ Remover (Del)")
+        self.response_pin_action = self.response_menu.addAction("")
+        self.response_reference_action = self.response_menu.addAction("🔗 Copiar referência para modelos")
+        # Opcional: textos gravados antes dos modelos podem ter chaves literais
+        self.response_template_action = self.response_menu.addAction("🧩 Modelo (variáveis e inclusões)")
+        self.response_template_action.setCheckable(True)
+        # Formato colado: texto simples ou rico (Markdown/HTML, ver LazyMimeData)
+        format_menu = self.response_menu.addMenu("🎨 Formato")
+        format_group = QActionGroup(format_menu)
+        self.response_format_actions: Dict[str, QAction] = {}
+        for fmt, label in zip(RESPONSE_FORMATS, ("Texto simples", "Markdown", "HTML")):
+            action = format_menu.addAction(label)
+            action.setCheckable(True)
+            action.setData(fmt)
+            format_group.addAction(action)
+            self.response_format_actions[fmt] = action
+        self.response_menu.addSeparator()
+        self.response_expand_action = self.response_menu.addAction("")
+        self.response_menu.addSeparator()
+        self.response_stats_action = self.response_menu.addAction("")
+        self.response_stats_action.setEnabled(False)
+
+    def show_response_menu(self, widget: EnhancedDraggableResponseWidget, pos: QPoint):
+        """Mostra o menu de opções para a resposta clicada"""
+        if self.response_menu is None:
+            self._build_response_menu()
+        self.response_stats_action.setText(f"📊 Usado {widget.usage_count()}x")
+        text = widget.response_data["texto"]
+        self.response_pin_action.setText("📌 Desafixar do menu rápido" if self.is_pinned(text)
+                                         else "📌 Fixar no menu rápido")
+        self.response_template_action.setChecked(bool(widget.response_data.get("modelo")))
+        current_format = widget.response_data.get("formato", FORMAT_TEXT)
+        self.response_format_actions[current_format].setChecked(True)
+        expanded = widget.response_btn.expanded
+        self.response_expand_action.setText("🔼 Recolher texto" if expanded else "🔽 Expandir texto")
+        self.response_expand_action.setVisible(expanded or widget.response_btn.is_truncated())
+        
+        self.set_selected_response(widget)
+        action = self.response_menu.exec_(pos)
+        if action == self.response_edit_action:
+            widget.on_edit_clicked()
+        elif action == self.response_duplicate_action:
+            widget.on_duplicate_clicked()
+        elif action == self.response_remove_action:
+            widget.on_remove_clicked()
+        elif action == self.response_pin_action:
+            self.toggle_pinned(text)
+        elif action == self.response_reference_action:
+            # Para colar em outra resposta: {incluir:<id>}
+            QApplication.clipboard().setText("{incluir:%s}" % response_id(text))
+        elif action == self.response_template_action:
+            self.data_manager.set_template(self.current_section, text, action.isChecked())
+        elif action == self.response_expand_action:
+            widget.response_btn.set_expanded(not expanded)
+        elif action in self.response_format_actions.values() and action.data() != current_format:
+            self.data_manager.set_response_format(self.current_section, text, action.data())
 
     def show_section_menu(self, section_name: str, pos: QPoint):
         """Mostra menu de contexto da seção"""
@@ -2468,20 +3625,24 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if ok and text:
             if self.data_manager.add_response(self.current_section, text):
                 self.stats_manager.record_response_created()
-                self.update_responses_ui()
 
     def edit_response(self, old_text: str):
         """Edita uma resposta"""
         new_text, ok = QInputDialog.getText(self, "Editar Resposta", "Novo texto:", text=old_text)
         if ok and new_text and new_text != old_text:
-            if self.data_manager.edit_response(self.current_section, old_text, new_text):
-                self.update_responses_ui()
+            if not self.data_manager.edit_response(self.current_section, old_text, new_text):
+                return
+            # Quem inclui esta resposta passa a apontar para o novo texto
+            self.data_manager.templates.retarget_includes(old_text, new_text)
+            if self.is_pinned(old_text):
+                pinned = self.config_manager.get("pinned_responses")
+                self.config_manager.set("pinned_responses",
+                                        [new_text if t == old_text else t for t in pinned])
 
     def duplicate_response(self, text: str):
         """Duplica uma resposta"""
         if self.data_manager.duplicate_response(self.current_section, text):
             self.stats_manager.record_response_created()
-            self.update_responses_ui()
 
     def remove_response(self, text: str):
         """Remove uma resposta"""
@@ -2491,19 +3652,67 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if reply == QMessageBox.Yes:
             if self.data_manager.remove_response(self.current_section, text):
                 self.stats_manager.record_response_deleted()
-                self.update_responses_ui()
 
-    def copy_to_clipboard(self, text: str):
-        """Copia texto para área de transferência"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+    def copy_to_clipboard(self, text: str, section: Optional[str] = None):
+        """Copia texto para área de transferência (uso contado em `section` ou na seção atual)"""
+        # Modelos: variáveis e inclusões são expandidas; a estatística usa o texto original
+        section = section or self.current_section
+        fmt = self.data_manager.response_format(section, text) if self.data_manager else FORMAT_TEXT
+        content = expand_response(text, section, self.data_manager, self, self.template_values, fmt)
+        if content is None:
+            return
+        set_clipboard_content(content, fmt)
         
         # Registrar uso
-        self.stats_manager.record_copy(text, self.current_section)
+        self.stats_manager.record_copy(text, section)
+        
+        # Minimizar antes do aviso, para que ele apareça sobre a bola flutuante
+        if self.config_manager.get("minimize_after_copy", False) and self.isVisible():
+            self.minimize_window()
         
-        # Mostrar confirmação se configurado
+        # Mostrar confirmação se configurado (sem modal: copiar e colar com um clique)
         if self.config_manager.get("show_copy_confirmation", True):
-            QMessageBox.information(self, "✅ Copiado!", "Texto copiado para área de transferência!")
+            self.show_toast("✅ Copiado!")
+
+    def quick_copy(self, section: str, text: str) -> None:
+        """Entrada do menu de cópia rápida: copia sem mostrar a janela"""
+        self.copy_to_clipboard(text, section)
+
+    def ensure_quick_launcher(self) -> QuickLauncher:
+        """Monta (oculta) a paleta de busca rápida, se ainda não existir"""
+        if self.quick_launcher is None:
+            self.quick_launcher = QuickLauncher(SearchIndex(self.data_manager), self.current_theme_name)
+            self.quick_launcher.copy_requested.connect(self.quick_copy)
+            self.quick_launcher.prebuild()
+        return self.quick_launcher
+
+    def open_quick_launcher(self) -> None:
+        """Abre a paleta de busca sobre a bola flutuante (ou no meio da tela)"""
+        if self.data_manager is None:
+            return
+        self.ensure_quick_launcher().popup(self.floating_button)
+
+    def is_pinned(self, text: str) -> bool:
+        return text in self.config_manager.get("pinned_responses", [])
+
+    def toggle_pinned(self, text: str) -> None:
+        """Fixa ou desafixa a resposta no menu de cópia rápida"""
+        pinned = list(self.config_manager.get("pinned_responses", []))
+        if text in pinned:
+            pinned.remove(text)
+        else:
+            pinned.append(text)
+        self.config_manager.set("pinned_responses", pinned)
+
+    def show_toast(self, text: str) -> None:
+        """Mostra um aviso sobre a janela ou, com ela escondida, sobre a bola flutuante"""
+        if self.toast is None:
+            self.toast = Toast(self)
+        self.toast.animations_enabled = self.animations_enabled
+        if self.isVisible():
+            self.toast.show_message(text, self, self.current_theme)
+        else:
+            self.toast.show_message(text, self.floating_button, self.current_theme, above=True)
 
     def show_stats(self):
         """Mostra diálogo de estatísticas"""
@@ -2512,13 +3721,14 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
 
     def show_settings(self):
         """Mostra diálogo de configurações"""
+        load_user_themes(CONFIG.THEMES_DIR)
         dialog = SettingsDialog(self.config_manager, self)
         if dialog.exec_() == QDialog.Accepted:
             # Aplicar novo tema se necessário
-            new_theme = self.config_manager.get("theme", "light")
-            if new_theme != self.current_theme:
-                self.current_theme = THEMES[new_theme]
-                self.apply_styles()
+            self.apply_theme(self.config_manager.get("theme", "light"))
+            self.apply_rendering_mode(self.config_manager.get("rendering_mode", "translucent"))
+            self.animations_enabled = self.config_manager.get("animations", True)
+            self.floating_button.animations_enabled = self.animations_enabled
 
     def show_help(self):
         """Mostra diálogo de ajuda"""
@@ -2538,27 +3748,45 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.activateWindow()
         self.fade_in()
 
+    def handle_command(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Atende um comando do servidor local (ver run_command)"""
+        if self.data_manager is None:
+            return {"ok": False, "error": "respostas ainda carregando"}
+        return run_command(request, self.data_manager, self.stats_manager)
+
+    def handle_instance_message(self, message: Dict[str, Any]) -> None:
+        """
+        Atende os argumentos repassados por outra execução do app
+        
+        Chaves: "show" (trazer a janela para frente), "search" (texto da
+        busca) e "import" (caminho de arquivo a importar).
+        """
+        if self.data_manager is None:
+            # Respostas ainda carregando: atender quando chegarem
+            self.pending_instance_messages.append(message)
+            return
+        
+        if message.get("import"):
+            if not self.data_manager.import_data(message["import"]):
+                QMessageBox.warning(self, "❌ Erro", f"Erro ao importar {message['import']}.")
+        if message.get("search") is not None:
+            self.search_input.setText(message["search"])
+        if message.get("show"):
+            if self.isVisible():
+                self.raise_()
+                self.activateWindow()
+            else:
+                self.show_window()
+
     def _position_floating_button(self) -> None:
         """Posiciona a bola flutuante na tela"""
-        # Garantir que a bola flutuante esteja configurada corretamente
-        self.floating_button.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-        
-        # Usar a posição salva ou posição padrão
-        floating_pos = self.config_manager.get("floating_button_position")
-        if floating_pos:
-            self.floating_button.move(floating_pos[0], floating_pos[1])
-        else:
-            # Posição padrão no canto inferior direito
-            screen = QApplication.primaryScreen().geometry()
-            self.floating_button.move(screen.width() - 90, screen.height() - 90)
+        position_floating_button(self.floating_button, self.config_manager)
 
     def minimize_window(self) -> None:
         """Minimiza para a bola flutuante"""
-        self.hide()
         self._position_floating_button()
-        
-        # Mostrar a bola flutuante com delay para garantir visibilidade
-        QTimer.singleShot(100, self.show_floating_button)
+        # A bola flutuante aparece (com delay) a partir do hideEvent
+        self.hide()
 
     def show_floating_button(self) -> None:
         """Mostra a bola flutuante"""
@@ -2573,8 +3801,7 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
     def mousePressEvent(self, event):
         """Permite arrastar a janela apenas pela barra de título"""
         # Cancelar timer de minimização se o usuário interagir com a janela
-        if self.focus_loss_timer and self.focus_loss_timer.isActive():
-            self.focus_loss_timer.stop()
+        self._cancel_focus_loss()
             
         if event.button() == Qt.LeftButton:
             # Verificar se o clique ocorreu dentro da barra de título
@@ -2604,8 +3831,6 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         if file_path:
             if self.data_manager.import_data(file_path):
                 QMessageBox.information(self, "✅ Sucesso", "Dados importados com sucesso!")
-                self.update_sections_ui()
-                self.update_responses_ui()
             else:
                 QMessageBox.warning(self, "❌ Erro", "Erro ao importar dados.")
 
@@ -2622,16 +3847,12 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
                 QMessageBox.warning(self, "❌ Erro", "Erro ao exportar dados.")
 
     def setup_tray_icon(self):
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon(resource_path('fctbi.ico')))
-        self.tray_icon.setToolTip("FCTBI Respostas Rápidas")
-        self.tray_icon.activated.connect(self.tray_icon_activated)
+        """Cria o ícone da bandeja, a menos que o FloatingLauncher já o tenha criado"""
+        if self.tray_icon is None:
+            self.tray_icon = AppTrayIcon(self.quick_menu, self.open_quick_launcher,
+                                         self.show_window, self)
         self.tray_icon.show()
 
-    def tray_icon_activated(self, reason):
-        if reason == QSystemTrayIcon.DoubleClick:
-            self.show_window()
-
     def closeEvent(self, event):
         """Evento chamado quando a janela é fechada"""
         # Salvar configurações da janela
@@ -2639,6 +3860,7 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         self.config_manager.set("window_size", [self.width(), self.height()])
         
         # Esconder a bola flutuante se estiver visível
+        self.is_closing = True
         if self.floating_button.isVisible():
             self.floating_button.hide()
         
@@ -2646,21 +3868,243 @@ class RespostaRapidaApp(QMainWindow, FaderWidget):
         QApplication.quit()
 
 
-
+class FloatingLauncher(QObject):
+    """
+    Inicia o app apenas com a bola flutuante
+    
+    Só os gerenciadores e a bola são criados na inicialização; as respostas
+    são lidas em uma thread e a janela principal é montada no primeiro
+    clique, ou em tempo ocioso se "prewarm_main_window" estiver ativo.
+    """
+    
+    PREWARM_DELAY_MS = 3000
+    
+    def __init__(self, config_manager: ConfigManager, trace: Optional[StartupTrace] = None):
+        super().__init__()
+        self.trace = trace or StartupTrace()
+        self.config_manager = config_manager
+        self.stats_manager = StatsManager(CONFIG.STATS_FILE)
+        self.data_manager: Optional[DataManager] = None
+        self.window: Optional[RespostaRapidaApp] = None
+        self.show_requested = False
+        self.pending_instance_messages: List[Dict[str, Any]] = []
+        self.trace.mark("managers")
+        
+        theme_name = config_manager.get("theme", "light")
+        load_user_themes(CONFIG.THEMES_DIR)
+        self.floating_button = FloatingButton(self.show_window, theme_name)
+        self.floating_button.animations_enabled = config_manager.get("animations", True)
+        position_floating_button(self.floating_button, config_manager)
+        self.trace.watch_first_paint(self.floating_button)
+        self.toast: Optional[Toast] = None
+        
+        # Menu de cópia rápida: funciona antes (e sem) a janela principal
+        self.quick_menu = QuickCopyMenu(config_manager, self.stats_manager)
+        self.quick_menu.copy_requested.connect(self.quick_copy)
+        self.quick_menu.search_requested.connect(self.open_quick_launcher)
+        self.quick_menu.open_requested.connect(self.show_window)
+        self.quick_menu.quit_requested.connect(self.quit)
+        self.quick_launcher: Optional[QuickLauncher] = None
+        self.template_values: Dict[str, str] = {}
+        self.floating_button.menu_requested.connect(self.quick_menu.popup)
+        # Bandeja com o mesmo menu; criada logo após exibir a bola (ver show)
+        self.tray_icon: Optional[AppTrayIcon] = None
+        # Interativo: bola pintada e respostas prontas para o primeiro clique
+        self.trace.interactive_after = {"first_paint", "data"}
+        
+        self.data_loader = DataLoadThread(CONFIG.DATA_FILE, self)
+        self.data_loader.loaded.connect(self._on_data_loaded)
+        self.data_loader.finished.connect(self.data_loader.deleteLater)
+        self.data_loader.start()
+
+    def show(self) -> None:
+        """Exibe a bola flutuante"""
+        self.floating_button.show()
+        self.floating_button.raise_()
+        self.trace.mark("shown")
+        QTimer.singleShot(0, self.setup_tray_icon)
+
+    def setup_tray_icon(self) -> None:
+        """Ícone da bandeja desde a inicialização; a janela o reaproveita depois"""
+        if self.tray_icon is None:
+            self.tray_icon = AppTrayIcon(self.quick_menu, self.open_quick_launcher,
+                                         self.show_window, self)
+            self.tray_icon.show()
+
+    def _on_data_loaded(self, data_manager: DataManager) -> None:
+        self.trace.mark("data")
+        self.data_manager = data_manager
+        self.data_loader = None
+        self.quick_menu.set_data_manager(data_manager)
+        QTimer.singleShot(0, self.ensure_quick_launcher)
+        if self.show_requested:
+            self.show_window()
+        elif self.config_manager.get("prewarm_main_window", False):
+            QTimer.singleShot(self.PREWARM_DELAY_MS, self.ensure_window)
+
+    def ensure_window(self) -> Optional[RespostaRapidaApp]:
+        """Monta a janela principal (oculta) se ainda não existir"""
+        if self.window is None and self.data_manager is not None:
+            # Trace próprio (desativado): as fases da janela montada sob demanda
+            # não se misturam às da inicialização (ver bench_startup)
+            self.window = RespostaRapidaApp(
+                StartupTrace(), config_manager=self.config_manager,
+                stats_manager=self.stats_manager, data_manager=self.data_manager,
+                floating_button=self.floating_button, quick_menu=self.quick_menu,
+                quick_launcher=self.ensure_quick_launcher(), tray_icon=self.tray_icon)
+        return self.window
+
+    def show_window(self) -> None:
+        """Primeiro clique na bola: monta e mostra a janela principal"""
+        if self.ensure_window() is None:
+            # Respostas ainda carregando: mostrar assim que chegarem
+            self.show_requested = True
+            return
+        self.window.show_window()
+        for message in self.pending_instance_messages:
+            self.window.handle_instance_message(message)
+        self.pending_instance_messages.clear()
+
+    def quick_copy(self, section: str, text: str) -> None:
+        """Copia pelo menu rápido sem montar a janela principal"""
+        if self.window is not None:
+            self.window.copy_to_clipboard(text, section)
+            return
+        fmt = self.data_manager.response_format(section, text)
+        content = expand_response(text, section, self.data_manager, None, self.template_values, fmt)
+        if content is None:
+            return
+        set_clipboard_content(content, fmt)
+        self.stats_manager.record_copy(text, section)
+        if self.config_manager.get("show_copy_confirmation", True):
+            if self.toast is None:
+                self.toast = Toast()
+            self.toast.animations_enabled = self.floating_button.animations_enabled
+            self.toast.show_message("✅ Copiado!", self.floating_button,
+                                    self.floating_button.theme, above=True)
+
+    def ensure_quick_launcher(self) -> Optional[QuickLauncher]:
+        """Monta (oculta) a paleta de busca rápida assim que as respostas chegam"""
+        if self.quick_launcher is None and self.data_manager is not None:
+            self.quick_launcher = QuickLauncher(SearchIndex(self.data_manager),
+                                                self.floating_button.theme_name)
+            self.quick_launcher.copy_requested.connect(self.quick_copy)
+            self.quick_launcher.prebuild()
+        return self.quick_launcher
+
+    def open_quick_launcher(self) -> None:
+        if self.window is not None:
+            self.window.open_quick_launcher()
+        elif self.ensure_quick_launcher() is not None:
+            self.quick_launcher.popup(self.floating_button)
+
+    def quit(self) -> None:
+        if self.window is not None:
+            self.window.close_window()
+        else:
+            QApplication.quit()
+
+    def handle_command(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Comandos locais não precisam da janela principal"""
+        if self.data_manager is None:
+            return {"ok": False, "error": "respostas ainda carregando"}
+        return run_command(request, self.data_manager, self.stats_manager)
+
+    def handle_instance_message(self, message: Dict[str, Any]) -> None:
+        """Argumentos de outra execução: abre a janela e repassa a ela"""
+        if self.window is not None:
+            self.window.handle_instance_message(message)
+            return
+        self.pending_instance_messages.append(message)
+        self.show_window()
 
 # --- FUNÇÃO PRINCIPAL ---
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Interpreta os argumentos do app (opções do Qt são ignoradas)"""
+    parser = argparse.ArgumentParser(prog="fctbi", description="FCTBI - Respostas Rápidas")
+    parser.add_argument("--startup-trace", nargs="?", const="-", metavar="ARQUIVO",
+                        help="imprime o tempo de cada fase da inicialização em stderr "
+                             "(ou no ARQUIVO, com --startup-trace=ARQUIVO)")
+    parser.add_argument("--quit-after-startup", action="store_true",
+                        help="encerra assim que a inicialização fica interativa (benchmarks)")
+    parser.add_argument("--floating", action="store_true",
+                        help="inicia apenas com a bola flutuante")
+    parser.add_argument("--search", metavar="TEXTO",
+                        help="abre a janela com a busca preenchida")
+    parser.add_argument("--import", dest="import_file", metavar="ARQUIVO",
+                        help="importa respostas de um arquivo .json ou .txt")
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
+
+def instance_message(args: argparse.Namespace) -> Dict[str, Any]:
+    """Mensagem repassada à instância em execução"""
+    message: Dict[str, Any] = {"show": True}
+    if args.search is not None:
+        message["search"] = args.search
+    if args.import_file:
+        # A outra instância pode ter outro diretório de trabalho
+        message["import"] = os.path.abspath(args.import_file)
+    return message
+
 def main():
+    args = parse_arguments(sys.argv)
+    trace = StartupTrace(args.startup_trace is not None,
+                         path=None if args.startup_trace == "-" else args.startup_trace)
+    trace.mark("imports")
+    
+    # Já existe uma instância: entregar os argumentos e sair sem montar interface
+    message = instance_message(args)
+    if forward_to_running_instance(message):
+        trace.mark("forwarded")
+        return
+    
     app = QApplication(sys.argv)
+    trace.mark("qapplication")
+    if args.quit_after_startup:
+        trace.interactive.connect(lambda: QTimer.singleShot(0, app.quit))
+    
+    # Instância única antes de qualquer interface: quem perde a disputa sai sem mostrar nada
+    instance_server = SingleInstanceServer()
+    if not instance_server.listen():
+        if forward_to_running_instance(message, timeout_ms=1000):
+            # Outra execução venceu a disputa pela instância única
+            trace.mark("forwarded")
+            return
+        print(f"Instância única indisponível ({instance_server.server.errorString()}): "
+              "o app continua, mas novas execuções abrirão outra janela e "
+              "ipc_client.py não terá resposta")
+    # Mensagens que chegarem enquanto a interface é montada ficam guardadas
+    early_messages: List[Dict[str, Any]] = []
+    instance_server.message_received.connect(early_messages.append)
+    trace.mark("instance")
     
     # Configurar fonte personalizada
     font_id = QFontDatabase.addApplicationFont(resource_path(CONFIG.FONT_FILE))
     if font_id >= 0:
         font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
         app.setFont(QFont(font_family, 9))
+    trace.mark("fonts")
+    
+    CONFIG.APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    config_manager = ConfigManager(CONFIG.CONFIG_FILE)
+    if args.floating or config_manager.get("launch_mode") == "floating":
+        # Só a bola flutuante; a janela é montada no primeiro clique
+        target = FloatingLauncher(config_manager, trace)
+        target.show()
+    else:
+        # Mostrar a janela antes de carregar as respostas
+        target = RespostaRapidaApp(trace, load_in_background=True, config_manager=config_manager)
+        target.show()
+        trace.mark("shown")
     
-    # Criar e mostrar a aplicação
-    window = RespostaRapidaApp()
-    window.show()
+    instance_server.message_received.disconnect(early_messages.append)
+    instance_server.message_received.connect(target.handle_instance_message)
+    instance_server.command_handler = target.handle_command
+    if len(message) > 1:
+        # --search/--import na própria primeira execução
+        target.handle_instance_message(message)
+    for early_message in early_messages:
+        target.handle_instance_message(early_message)
     
     sys.exit(app.exec_())
 
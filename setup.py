@@ -39,9 +39,14 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=read_requirements(),
+    extras_require={
+        "effects": ["numpy>=1.20.0"],
+    },
     entry_points={
         "console_scripts": [
             "fctbi=main:main",
+            "fctbi-ipc=ipc_client:main",
+            "fctbi-cli=fctbi_core.cli:main",
         ],
     },
     include_package_data=True,
@@ -1,60 +1,159 @@
 import sys
 import random
+import time
 from PyQt5.QtWidgets import QWidget, QApplication, QLabel, QGraphicsDropShadowEffect
-from PyQt5.QtGui import QPainter, QColor, QFont, QPainterPath, QPen
+from PyQt5.QtGui import QPainter, QColor, QFont, QPainterPath, QPen, QPixmap
 from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QRectF, pyqtProperty
 
-class Particle:
+# NumPy é opcional (extra "effects"): sem ele as partículas usam listas Python
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+# Tons de rosa/roxo: vermelho 200-255 e alfa 100-200, quantizados em faixas
+# para que cada faixa tenha um sprite pré-renderizado
+RED_LEVELS = (200, 218, 236, 255)
+ALPHA_LEVELS = (100, 133, 166, 200)
+COLOR_BUCKETS = len(RED_LEVELS) * len(ALPHA_LEVELS)
+MIN_SIZE, MAX_SIZE = 10, 30
+
+_HEART_PATH = None
+_SPRITE_CACHE = {}
+
+
+def heart_path():
+    """ Caminho do coração em coordenadas unitárias (largura e altura 1), criado uma vez. """
+    global _HEART_PATH
+    if _HEART_PATH is None:
+        path = QPainterPath()
+        path.moveTo(0.5, 0.25)
+        path.cubicTo(0.5, 0.0, 0.0, 0.0, 0.0, 0.25)
+        path.cubicTo(0.0, 0.60, 0.5, 0.80, 0.5, 1.0)
+        path.cubicTo(0.5, 0.80, 1.0, 0.60, 1.0, 0.25)
+        path.cubicTo(1.0, 0.0, 0.5, 0.0, 0.5, 0.25)
+        _HEART_PATH = path
+    return _HEART_PATH
+
+
+def bucket_color(bucket):
+    """ Cor de uma faixa de cor das partículas. """
+    red = RED_LEVELS[bucket // len(ALPHA_LEVELS)]
+    alpha = ALPHA_LEVELS[bucket % len(ALPHA_LEVELS)]
+    return QColor(red, 105, 180, alpha)
+
+
+def heart_sprite(bucket, size, ratio=1.0):
     """
-    Classe para representar uma partícula animada.
+    Retorna o coração pré-renderizado para a faixa de cor e o tamanho.
+
+    Os sprites ficam em cache: cada quadro só copia pixmaps, sem montar
+    nem preencher caminhos com antialiasing.
     """
-    def __init__(self, screen_width, screen_height):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.reset()
-
-    def reset(self):
-        """ Reinicia a posição e as propriedades da partícula. """
-        self.x = random.randint(0, self.screen_width)
-        self.y = random.randint(-self.screen_height, 0)
-        self.size = random.randint(10, 30)
-        self.speed = random.uniform(1.0, 3.0)
-        self.color = QColor(random.randint(200, 255), 105, 180, random.randint(100, 200)) # Tons de rosa/roxo
-        self.drift = random.uniform(-0.5, 0.5) # Movimento lateral
-
-    def move(self):
-        """ Move a partícula para baixo. """
-        self.y += self.speed
-        self.x += self.drift
-        if self.y > self.screen_height or self.x < -self.size or self.x > self.screen_width:
-            self.reset()
-
-    def draw(self, painter):
-        """ Desenha a partícula na tela. """
-        path = QPainterPath()
-        path.moveTo(self.x, self.y + self.size * 0.25)
-        path.cubicTo(self.x, self.y,
-                      self.x - self.size * 0.5, self.y,
-                      self.x - self.size * 0.5, self.y + self.size * 0.25)
-        path.cubicTo(self.x - self.size * 0.5, self.y + self.size * 0.60,
-                      self.x, self.y + self.size * 0.80,
-                      self.x, self.y + self.size)
-        path.cubicTo(self.x, self.y + self.size * 0.80,
-                      self.x + self.size * 0.5, self.y + self.size * 0.60,
-                      self.x + self.size * 0.5, self.y + self.size * 0.25)
-        path.cubicTo(self.x + self.size * 0.5, self.y,
-                      self.x, self.y,
-                      self.x, self.y + self.size * 0.25)
-        
+    key = (bucket, size, ratio)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = QPixmap(int(size * ratio) + 1, int(size * ratio) + 1)
+        sprite.setDevicePixelRatio(ratio)
+        sprite.fill(Qt.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(self.color)
-        painter.drawPath(path)
+        painter.setBrush(bucket_color(bucket))
+        painter.scale(size, size)
+        painter.drawPath(heart_path())
+        painter.end()
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+class ParticleSystem:
+    """
+    Estado de todas as partículas, avançado em um único passo por quadro.
+
+    Com NumPy o estado fica em arrays e o passo é vetorizado; sem NumPy
+    (ex.: executável do PyInstaller, que o exclui) usa listas Python com a
+    mesma interface.
+    """
+    def __init__(self, count, width, height, use_numpy=None):
+        self.width = width
+        self.height = height
+        self.use_numpy = (np is not None) if use_numpy is None else (use_numpy and np is not None)
+        if self.use_numpy:
+            self.x = np.zeros(count)
+            self.y = np.zeros(count)
+            self.size = np.zeros(count, dtype=np.int32)
+            self.speed = np.zeros(count)
+            self.drift = np.zeros(count)
+            self.bucket = np.zeros(count, dtype=np.int32)
+            self._reset(np.ones(count, dtype=bool))
+        else:
+            self.x, self.y, self.size = [0.0] * count, [0.0] * count, [0] * count
+            self.speed, self.drift, self.bucket = [0.0] * count, [0.0] * count, [0] * count
+            for i in range(count):
+                self._reset_one(i)
+
+    def __len__(self):
+        return len(self.x)
+
+    def _reset(self, mask):
+        """ Reinicia (vetorizado) as partículas marcadas em `mask`. """
+        n = int(mask.sum())
+        self.x[mask] = np.random.randint(0, self.width + 1, n)
+        self.y[mask] = np.random.randint(-self.height, 1, n)
+        self.size[mask] = np.random.randint(MIN_SIZE, MAX_SIZE + 1, n)
+        self.speed[mask] = np.random.uniform(1.0, 3.0, n)
+        self.drift[mask] = np.random.uniform(-0.5, 0.5, n)  # Movimento lateral
+        self.bucket[mask] = np.random.randint(0, COLOR_BUCKETS, n)
+
+    def _reset_one(self, i):
+        """ Reinicia a posição e as propriedades de uma partícula. """
+        self.x[i] = random.randint(0, self.width)
+        self.y[i] = random.randint(-self.height, 0)
+        self.size[i] = random.randint(MIN_SIZE, MAX_SIZE)
+        self.speed[i] = random.uniform(1.0, 3.0)
+        self.drift[i] = random.uniform(-0.5, 0.5)
+        self.bucket[i] = random.randrange(COLOR_BUCKETS)
+
+    def step(self):
+        """ Move todas as partículas para baixo e recicla as que saíram da tela. """
+        if self.use_numpy:
+            self.y += self.speed
+            self.x += self.drift
+            out = (self.y > self.height) | (self.x < -self.size) | (self.x > self.width)
+            if out.any():
+                self._reset(out)
+            return
+        for i in range(len(self.x)):
+            self.y[i] += self.speed[i]
+            self.x[i] += self.drift[i]
+            if self.y[i] > self.height or self.x[i] < -self.size[i] or self.x[i] > self.width:
+                self._reset_one(i)
+
+    def draw(self, painter, count=None, ratio=1.0):
+        """ Desenha as `count` primeiras partículas copiando os sprites em cache. """
+        count = len(self.x) if count is None else count
+        if self.use_numpy:
+            left = (self.x[:count] - self.size[:count] * 0.5).astype(np.int32).tolist()
+            top = self.y[:count].astype(np.int32).tolist()
+            sizes = self.size[:count].tolist()
+            buckets = self.bucket[:count].tolist()
+        else:
+            left = [int(x - s * 0.5) for x, s in zip(self.x[:count], self.size[:count])]
+            top = [int(y) for y in self.y[:count]]
+            sizes, buckets = self.size[:count], self.bucket[:count]
+        for x, y, size, bucket in zip(left, top, sizes, buckets):
+            painter.drawPixmap(x, y, heart_sprite(bucket, size, ratio))
 
 
 class SpecialEffectWindow(QWidget):
     """
     Janela de efeito especial com animação de partículas e mensagem.
     """
+    PARTICLE_COUNT = 50
+    MIN_PARTICLES = 10
+    FRAME_BUDGET_MS = 12  # Acima disso por vários quadros, reduz as partículas
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -68,7 +167,9 @@ class SpecialEffectWindow(QWidget):
         else:
             self.resize(800, 600)
 
-        self.particles = [Particle(self.width(), self.height()) for _ in range(50)]
+        self.particles = ParticleSystem(self.PARTICLE_COUNT, self.width(), self.height())
+        self.active_particles = self.PARTICLE_COUNT
+        self.slow_frames = 0
         self.opacity = 0.0
 
         # Label para a mensagem principal
@@ -85,10 +186,10 @@ class SpecialEffectWindow(QWidget):
         self.message_label.setGraphicsEffect(self.create_shadow())
         self.message_label.setWindowOpacity(0.0)  # Começa invisível
 
-        # Timer para a animação das partículas
+        # Timer para a animação das partículas (só roda com a janela visível)
         self.timer = QTimer(self)
+        self.timer.setInterval(30)  # ~30 FPS
         self.timer.timeout.connect(self.update_animation)
-        self.timer.start(30) # ~30 FPS
 
         # Animação de fade-in da janela
         self.fade_in_animation = QPropertyAnimation(self, b"windowOpacity")
@@ -127,22 +228,35 @@ class SpecialEffectWindow(QWidget):
         self.opacity = value
         self.setWindowOpacity(value)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
     def paintEvent(self, event):
+        start = time.perf_counter()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Fundo semi-transparente com gradiente
-        gradient = QPainterPath()
-        gradient.addRect(QRectF(self.rect()))
         
         # Fundo escuro e romântico
-        painter.setBrush(QColor(22, 12, 41, int(220 * self.opacity)))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.rect())
+        painter.fillRect(self.rect(), QColor(22, 12, 41, int(220 * self.opacity)))
 
         # Desenha as partículas
-        for particle in self.particles:
-            particle.draw(painter)
+        self.particles.draw(painter, self.active_particles, self.devicePixelRatioF())
+        painter.end()
+        self.adapt_particle_count((time.perf_counter() - start) * 1000)
+
+    def adapt_particle_count(self, frame_ms):
+        """ Reduz as partículas se o quadro estourar o orçamento em máquinas lentas. """
+        if frame_ms <= self.FRAME_BUDGET_MS:
+            self.slow_frames = 0
+            return
+        self.slow_frames += 1
+        if self.slow_frames >= 5 and self.active_particles > self.MIN_PARTICLES:
+            self.active_particles = max(self.MIN_PARTICLES, self.active_particles * 3 // 4)
+            self.slow_frames = 0
 
     def start_typewriter_animation(self):
         """Inicia a animação de digitação"""
@@ -169,8 +283,7 @@ class SpecialEffectWindow(QWidget):
 
     def update_animation(self):
         """ Atualiza a posição de todas as partículas e redesenha. """
-        for particle in self.particles:
-            particle.move()
+        self.particles.step()
         self.update() # Agenda um repaint
 
     def mousePressEvent(self, event):
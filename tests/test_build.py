@@ -0,0 +1,44 @@
+"""
+Testes da geração do spec do PyInstaller (build_executable.py)
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.append('..')
+import build_executable
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestSpec(unittest.TestCase):
+    """Testes do spec gerado"""
+
+    def test_variants_are_valid_python(self):
+        """Todas as combinações geram um spec sintaticamente válido"""
+        for onefile in (False, True):
+            for upx in (False, True):
+                content = build_executable.spec_content(onefile=onefile, upx=upx, optimize=0)
+                compile(content, "spec", "exec")
+                self.assertEqual("COLLECT(" in content, not onefile)
+                self.assertIn(f"upx={upx}", content)
+
+    def test_excludes_not_imported_by_app(self):
+        """Nenhum módulo excluído do bundle é importado pelo app"""
+        code = ("import sys, main, special_effects; "
+                "print('\\n'.join(sys.modules))")
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT,
+                                         env=env, text=True)
+        imported = set(output.split())
+        imported |= {name.split(".")[0] for name in imported}
+        # numpy é opcional (efeitos) e fica fora do executável de propósito
+        excluded = set(build_executable.SPEC_EXCLUDES) - {"numpy"}
+        self.assertEqual(excluded & imported, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Testes do cache binário dos arquivos JSON (fctbi_core.cache)
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+
+sys.path.append('..')
+from fctbi_core import DataManager, StatsManager
+from fctbi_core.cache import (
+    cache_path, load_json_cached, read_cache, wait_for_cache_writes, write_cache,
+)
+
+
+class TestParseCache(unittest.TestCase):
+    """Validação do cache pela chave (tamanho, mtime, CRC-32) da origem"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = str(self.temp_dir / "respostas.json")
+        self.write_source({"Geral": [{"texto": "A"}]})
+
+    def tearDown(self):
+        wait_for_cache_writes()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_source(self, data, mtime_ns=None):
+        with open(self.source, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        if mtime_ns is not None:
+            os.utime(self.source, ns=(mtime_ns, mtime_ns))
+
+    def load(self):
+        data = load_json_cached(self.source)
+        wait_for_cache_writes()
+        return data
+
+    def test_cache_written_and_used(self):
+        """A primeira leitura grava o cache; a seguinte vem dele"""
+        self.assertEqual(self.load(), {"Geral": [{"texto": "A"}]})
+        # Trocar o conteúdo do cache mantendo a chave prova que ele é usado
+        with open(self.source, "rb") as f:
+            raw = f.read()
+        stat = os.stat(self.source)
+        key = (stat.st_size, stat.st_mtime_ns, zlib.crc32(raw))
+        self.assertEqual(read_cache(cache_path(self.source), key), (True, {"Geral": [{"texto": "A"}]}))
+        write_cache(cache_path(self.source), key, {"Geral": [{"texto": "Do cache"}]}, background=False)
+        self.assertEqual(self.load(), {"Geral": [{"texto": "Do cache"}]})
+
+    def test_changed_content_same_size_and_mtime(self):
+        """O CRC detecta alteração que mantém tamanho e mtime"""
+        mtime = os.stat(self.source).st_mtime_ns
+        self.load()
+        self.write_source({"Geral": [{"texto": "B"}]}, mtime_ns=mtime)
+        self.assertEqual(self.load(), {"Geral": [{"texto": "B"}]})
+
+    def test_corrupted_cache_ignored(self):
+        """Cache ilegível é descartado e regravado"""
+        self.load()
+        with open(cache_path(self.source), "wb") as f:
+            f.write(b"lixo")
+        self.assertEqual(self.load(), {"Geral": [{"texto": "A"}]})
+        self.assertEqual(self.load(), {"Geral": [{"texto": "A"}]})
+
+    def test_managers_use_cache(self):
+        """DataManager e StatsManager leem pelo cache"""
+        stats_file = str(self.temp_dir / "stats.json")
+        StatsManager(stats_file).record_copy("A", "Geral")
+        self.assertEqual(DataManager(self.source).data, {"Geral": [{"texto": "A"}]})
+        self.assertEqual(StatsManager(stats_file).stats["total_copies"], 1)
+        wait_for_cache_writes()
+        self.assertTrue(os.path.exists(cache_path(self.source)))
+        self.assertTrue(os.path.exists(cache_path(stats_file)))
+        self.assertEqual(StatsManager(stats_file).stats["total_copies"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Testes da linha de comando sem interface (fctbi_core.cli)
+"""
+
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+sys.path.append('..')
+from fctbi_core import AppConfig, DataManager
+from fctbi_core import cli
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestCli(unittest.TestCase):
+    """Testes dos subcomandos sobre um diretório de dados temporário"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config = AppConfig(APP_DATA_DIR=self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_cli(self, *argv):
+        """Executa o CLI e retorna (código de saída, stdout)"""
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+            code = cli.main(["--data-dir", str(self.temp_dir), *argv])
+        return code, stdout.getvalue()
+
+    def texts(self, section="Geral"):
+        return [r["texto"] for r in DataManager(self.config.DATA_FILE).data.get(section, [])]
+
+    def test_add_and_search(self):
+        self.assertEqual(self.run_cli("add", "Geral", "Bom dia")[0], 0)
+        self.assertEqual(self.run_cli("add", "Suporte", "Reinicie")[0], 1)
+        self.assertEqual(self.run_cli("add", "Suporte", "Reinicie", "--create-section")[0], 0)
+        code, output = self.run_cli("search", "bom", "--json")
+        self.assertEqual(code, 0)
+        self.assertEqual([r["texto"] for r in json.loads(output)], ["Bom dia"])
+
+    def test_import_export(self):
+        source = self.temp_dir / "entrada.json"
+        source.write_text(json.dumps({"Geral": ["A", "B"], "Vendas": ["C"]}), encoding="utf-8")
+        self.assertEqual(self.run_cli("import", str(source))[0], 0)
+        target = self.temp_dir / "saida.json"
+        self.assertEqual(self.run_cli("export", str(target), "--section", "Vendas")[0], 0)
+        exported = json.loads(target.read_text(encoding="utf-8"))
+        self.assertEqual([r["texto"] for r in exported["Vendas"]], ["C"])
+
+    def test_import_rejects_corrupt_file(self):
+        """JSON corrompido: erro, código 1 e o arquivo do usuário intacto"""
+        self.run_cli("add", "Geral", "Mantida")
+        source = self.temp_dir / "quebrado.json"
+        source.write_text('{"Geral": ["A"', encoding="utf-8")
+        self.assertEqual(self.run_cli("import", str(source))[0], 1)
+        self.assertEqual(source.read_text(encoding="utf-8"), '{"Geral": ["A"')
+        self.assertFalse(list(self.temp_dir.glob("quebrado*backup*")))
+        self.assertEqual(self.texts(), ["Mantida"])
+
+    def test_import_rejects_list(self):
+        """Uma lista no topo é recusada sem traceback"""
+        source = self.temp_dir / "lista.json"
+        source.write_text('["A", "B"]', encoding="utf-8")
+        stderr = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(stderr):
+            code = cli.main(["--data-dir", str(self.temp_dir), "import", str(source)])
+        self.assertEqual(code, 1)
+        self.assertIn("lista.json", stderr.getvalue())
+        self.assertEqual(self.texts(), [])
+
+    def test_dedupe(self):
+        data_manager = DataManager(self.config.DATA_FILE)
+        for text in ("A", "B", "A", "A"):
+            data_manager.add_response("Geral", text)
+        self.assertIn("2 repetição", self.run_cli("dedupe", "--dry-run")[1])
+        self.assertEqual(self.texts(), ["A", "B", "A", "A"])
+        self.run_cli("dedupe")
+        self.assertEqual(self.texts(), ["A", "B"])
+
+    def test_backup_and_restore(self):
+        self.run_cli("add", "Geral", "Original")
+        snapshot = self.temp_dir / "copia.json"
+        self.assertEqual(self.run_cli("backup", str(snapshot))[0], 0)
+        self.run_cli("add", "Geral", "Depois")
+        self.assertEqual(self.run_cli("restore", str(snapshot))[0], 0)
+        self.assertEqual(self.texts(), ["Original"])
+
+    def test_restore_rejects_invalid_file(self):
+        invalid = self.temp_dir / "invalido.json"
+        invalid.write_text("[1, 2]", encoding="utf-8")
+        self.run_cli("add", "Geral", "Mantida")
+        self.assertEqual(self.run_cli("restore", str(invalid))[0], 1)
+        self.assertEqual(self.texts(), ["Mantida"])
+
+    def test_stats(self):
+        self.run_cli("add", "Geral", "Nova")
+        code, output = self.run_cli("stats", "--json")
+        self.assertEqual((code, json.loads(output)["created_responses"]), (0, 1))
+
+    def test_does_not_import_qt(self):
+        """O CLI roda sem PyQt5 (e sem display)"""
+        code = ("import sys; from fctbi_core import cli; "
+                "sys.exit('PyQt5' in sys.modules)")
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=ROOT), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
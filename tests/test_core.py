@@ -0,0 +1,123 @@
+"""
+Testes do núcleo sem Qt (fctbi_core)
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append('..')
+from fctbi_core import AppConfig, ConfigManager, DataManager, SearchIndex, StatsManager, fold
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestCoreImport(unittest.TestCase):
+    """O núcleo pode ser usado sem importar o PyQt5"""
+
+    def test_does_not_import_qt(self):
+        code = "import sys, fctbi_core; sys.exit('PyQt5' in sys.modules)"
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=ROOT), 0)
+
+    def test_main_reexports_core(self):
+        """main.py usa os mesmos objetos (ex.: testes que alteram CONFIG)"""
+        code = ("import sys, main, fctbi_core; "
+                "sys.exit(main.CONFIG is not fctbi_core.CONFIG "
+                "or main.DataManager is not fctbi_core.DataManager)")
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=ROOT, env=env), 0)
+
+
+class TestManagers(unittest.TestCase):
+    """Gerenciadores de configuração e estatísticas"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config = AppConfig(APP_DATA_DIR=self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_paths_follow_data_dir(self):
+        self.assertEqual(self.config.DATA_FILE, str(self.temp_dir / "respostas.json"))
+        self.assertEqual(self.config.STATS_FILE, str(self.temp_dir / "stats.json"))
+
+    def test_config_defaults_and_set(self):
+        manager = ConfigManager(self.config.CONFIG_FILE)
+        self.assertEqual(manager.get("theme"), "light")
+        manager.set("theme", "dark")
+        self.assertEqual(ConfigManager(self.config.CONFIG_FILE).get("theme"), "dark")
+
+    def test_stats_record_copy(self):
+        manager = StatsManager(self.config.STATS_FILE)
+        manager.record_copy("Olá", "Geral")
+        manager.record_copy("Olá", "Geral")
+        self.assertEqual(StatsManager(self.config.STATS_FILE).get_most_used_responses(),
+                         [("Olá", 2)])
+
+    def test_top_responses_follow_copies(self):
+        """O ranking incremental bate com a ordenação completa do histórico"""
+        manager = StatsManager(self.config.STATS_FILE)
+        manager.TOP_SIZE = 3
+        for text, count in (("a", 5), ("b", 4), ("c", 3), ("d", 2)):
+            manager.stats["response_usage"][text] = count
+        self.assertEqual(manager.top_responses(), [("a", 5), ("b", 4), ("c", 3)])
+        
+        version = manager.top_version
+        manager.record_copy("a", "Geral")  # Já é o primeiro: ranking inalterado
+        self.assertEqual(manager.top_version, version)
+        for _ in range(2):
+            manager.record_copy("d", "Geral")  # Empata com "c" e depois o passa
+        self.assertEqual(manager.top_responses(), [("a", 6), ("b", 4), ("d", 4)])
+        self.assertGreater(manager.top_version, version)
+        manager.record_copy("d", "Geral")
+        self.assertEqual(manager.top_responses(), manager.get_most_used_responses(3))
+        self.assertEqual(manager.top_responses(1), [("a", 6)])
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Índice da paleta de busca rápida"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.data_manager = DataManager(str(self.temp_dir / "respostas.json"))
+        self.data_manager.add_response("Geral", "Bom dia, em que posso ajudar?")
+        self.data_manager.add_section("Vendas")
+        self.data_manager.add_response("Vendas", "Olá! Qual produto deseja?")
+        self.data_manager.add_response("Vendas", "Obrigado pela preferência, bom dia")
+        self.index = SearchIndex(self.data_manager)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_fold_ignores_case_and_accents(self):
+        self.assertEqual(fold("Olá PREFERÊNCIA"), "ola preferencia")
+
+    def test_all_terms_across_sections(self):
+        self.assertEqual(self.index.search("ola"), [("Vendas", "Olá! Qual produto deseja?")])
+        self.assertEqual([text for _, text in self.index.search("dia bom")],
+                         ["Bom dia, em que posso ajudar?", "Obrigado pela preferência, bom dia"])
+        self.assertEqual(len(self.index.search("")), 3)
+
+    def test_earlier_match_first(self):
+        """O primeiro termo no começo do texto vem antes"""
+        self.assertEqual(self.index.search("obrigado bom")[0][0], "Vendas")
+        self.assertEqual(self.index.search("bom")[0], ("Geral", "Bom dia, em que posso ajudar?"))
+
+    def test_follows_changes_while_typing(self):
+        """Refinar a consulta e alterar as respostas dão o mesmo que uma busca nova"""
+        self.assertEqual(len(self.index.search("o")), 3)
+        self.assertEqual(len(self.index.search("ob")), 1)
+        self.data_manager.add_response("Geral", "Obrigado!")
+        self.assertEqual(len(self.index.search("obr")), 2)
+        self.data_manager.remove_section("Vendas")
+        self.assertEqual(self.index.search("obr"), [("Geral", "Obrigado!")])
+        self.assertEqual(self.index.search("bom", limit=1), [("Geral", "Bom dia, em que posso ajudar?")])
+
+
+if __name__ == '__main__':
+    unittest.main()
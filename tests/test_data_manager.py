@@ -4,6 +4,7 @@ Testes unitários para o DataManager
 
 import unittest
 import tempfile
+import glob
 import os
 import json
 from datetime import datetime
@@ -12,7 +13,8 @@ from unittest.mock import patch, MagicMock
 # Importar o módulo a ser testado
 import sys
 sys.path.append('..')
-from main import DataManager
+from fctbi_core import DataManager, DataChange, response_id, wait_for_cache_writes
+from fctbi_core.cache import cache_path
 
 
 class TestDataManager(unittest.TestCase):
@@ -27,9 +29,13 @@ class TestDataManager(unittest.TestCase):
     
     def tearDown(self):
         """Limpeza após cada teste"""
-        # Remover arquivo temporário
+        # Remover arquivo temporário e backups criados ao salvar
         if os.path.exists(self.temp_file.name):
             os.unlink(self.temp_file.name)
+        wait_for_cache_writes()
+        for leftover in glob.glob(f"{self.data_manager.backup_file}_*") + [cache_path(self.temp_file.name)]:
+            if os.path.exists(leftover):
+                os.unlink(leftover)
     
     def test_load_data_new_file(self):
         """Testa carregamento de arquivo novo"""
@@ -104,6 +110,26 @@ class TestDataManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(self.data_manager.data["Geral"][0]["texto"], "Resposta editada")
     
+    def test_response_format(self):
+        """Testa o formato (texto, markdown, html) salvo na resposta"""
+        self.data_manager.add_response("Geral", "**Olá**")
+        self.assertEqual(self.data_manager.response_format("Geral", "**Olá**"), "texto")
+        self.assertTrue(self.data_manager.set_response_format("Geral", "**Olá**", "markdown"))
+        self.assertEqual(DataManager(self.temp_file.name).response_format("Geral", "**Olá**"), "markdown")
+        self.assertFalse(self.data_manager.set_response_format("Geral", "**Olá**", "rtf"))
+        # Voltar a texto simples remove a chave
+        self.data_manager.set_response_format("Geral", "**Olá**", "texto")
+        self.assertNotIn("formato", self.data_manager.data["Geral"][0])
+    
+    def test_template_flag(self):
+        """Testa a marca de modelo: opcional e ausente nas respostas antigas"""
+        self.data_manager.add_response("Geral", "Olá {nome}")
+        self.assertFalse(self.data_manager.is_template("Geral", "Olá {nome}"))
+        self.assertTrue(self.data_manager.set_template("Geral", "Olá {nome}", True))
+        self.assertTrue(DataManager(self.temp_file.name).is_template("Geral", "Olá {nome}"))
+        self.data_manager.set_template("Geral", "Olá {nome}", False)
+        self.assertNotIn("modelo", self.data_manager.data["Geral"][0])
+    
     def test_duplicate_response(self):
         """Testa duplicação de resposta"""
         self.data_manager.add_response("Geral", "Resposta")
@@ -111,7 +137,132 @@ class TestDataManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.data_manager.data["Geral"]), 2)
         self.assertEqual(self.data_manager.data["Geral"][1]["texto"], "Resposta (cópia)")
+        # A cópia mantém o formato (e as demais chaves) da original
+        self.data_manager.set_response_format("Geral", "Resposta", "markdown")
+        self.data_manager.duplicate_response("Geral", "Resposta")
+        self.assertEqual(self.data_manager.response_format("Geral", "Resposta (cópia 1)"), "markdown")
+        self.assertFalse(self.data_manager.duplicate_response("Geral", "Inexistente"))
+
 
+class TestDataManagerChanges(unittest.TestCase):
+    """Testes para as notificações de alteração do DataManager"""
+    
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        self.temp_file.close()
+        os.unlink(self.temp_file.name)
+        self.data_manager = DataManager(self.temp_file.name)
+        for text in ("a", "b", "c"):
+            self.data_manager.add_response("Geral", text)
+        self.changes = []
+        self.data_manager.add_listener(self.changes.append)
+    
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+        wait_for_cache_writes()
+        for leftover in glob.glob(f"{self.data_manager.backup_file}_*") + [cache_path(self.temp_file.name)]:
+            if os.path.exists(leftover):
+                os.unlink(leftover)
+    
+    def texts(self, section="Geral"):
+        return [item["texto"] for item in self.data_manager.data[section]]
+    
+    def test_add_response_emits_inserted(self):
+        """Testa notificação de inserção com índice"""
+        self.data_manager.add_response("Geral", "d")
+        self.assertEqual(self.changes, [DataChange("response_inserted", "Geral", 3)])
+    
+    def test_edit_response_emits_changed(self):
+        """Testa notificação de edição com índice"""
+        self.data_manager.edit_response("Geral", "b", "B")
+        self.assertEqual(self.changes, [DataChange("response_changed", "Geral", 1)])
+    
+    def test_remove_response_emits_removed(self):
+        """Testa notificação de remoção com índice"""
+        self.data_manager.remove_response("Geral", "a")
+        self.assertEqual(self.changes, [DataChange("response_removed", "Geral", 0)])
+        self.assertEqual(self.texts(), ["b", "c"])
+    
+    def test_move_response_emits_moved(self):
+        """Testa que mover uma resposta emite um único evento de movimento"""
+        self.data_manager.move_response("Geral", 0, 2)
+        self.assertEqual(self.texts(), ["b", "c", "a"])
+        self.assertEqual(self.changes, [DataChange("response_moved", "Geral", 0, 2)])
+    
+    def test_move_response_out_of_range(self):
+        """Testa movimento para posição inválida"""
+        self.assertFalse(self.data_manager.move_response("Geral", 0, 3))
+        self.assertEqual(self.changes, [])
+    
+    def test_move_response_to_section(self):
+        """Testa movimento entre seções preservando os dados da resposta"""
+        self.data_manager.add_section("Outra")
+        item = self.data_manager.data["Geral"][1]
+        self.data_manager.move_response_to_section("Geral", "b", "Outra")
+        self.assertIs(self.data_manager.data["Outra"][0], item)
+        self.assertEqual(self.changes[1:], [
+            DataChange("response_removed", "Geral", 1),
+            DataChange("response_inserted", "Outra", 0),
+        ])
+    
+    def test_rename_section_keeps_position(self):
+        """Testa que renomear mantém a ordem das seções"""
+        self.data_manager.add_section("Outra")
+        self.data_manager.rename_section("Geral", "Principal")
+        self.assertEqual(list(self.data_manager.data), ["Principal", "Outra"])
+        self.assertEqual(self.changes[-1],
+                         DataChange("section_renamed", "Principal", 0, old_name="Geral"))
+    
+    def test_move_section_emits_moved(self):
+        """Testa notificação de movimento de seção"""
+        self.data_manager.add_section("Outra")
+        self.data_manager.move_section(1, 0)
+        self.assertEqual(list(self.data_manager.data), ["Outra", "Geral"])
+        self.assertEqual(self.changes[-1], DataChange("section_moved", "Outra", 1, 0))
+    
+    def test_remove_listener(self):
+        """Testa remoção de ouvinte"""
+        self.data_manager.remove_listener(self.changes.append)
+        self.data_manager.add_response("Geral", "d")
+        self.assertEqual(self.changes, [])
+
+
+
+class TestDataManagerSearch(unittest.TestCase):
+    """Testes da busca usada pelos comandos locais"""
+    
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        json.dump({"Geral": [{"texto": "Bom dia"}, {"texto": "Boa tarde"}],
+                   "Suporte": [{"texto": "Reinicie o BOM roteador"}]}, self.temp_file)
+        self.temp_file.close()
+        self.data_manager = DataManager(self.temp_file.name)
+    
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        wait_for_cache_writes()
+        os.unlink(self.temp_file.name)
+        os.unlink(cache_path(self.temp_file.name))
+    
+    def test_search_ignores_case(self):
+        """Busca sem diferenciar maiúsculas, na ordem das seções"""
+        matches = self.data_manager.search("bom")
+        self.assertEqual([(section, r["texto"]) for section, r in matches],
+                         [("Geral", "Bom dia"), ("Suporte", "Reinicie o BOM roteador")])
+    
+    def test_search_limit(self):
+        """O limite interrompe a busca"""
+        self.assertEqual(len(self.data_manager.search("o", limit=2)), 2)
+    
+    def test_find_by_id(self):
+        """Resposta encontrada pelo id derivado do texto"""
+        section, response = self.data_manager.find_by_id(response_id("Boa tarde"))
+        self.assertEqual((section, response["texto"]), ("Geral", "Boa tarde"))
+        self.assertIsNone(self.data_manager.find_by_id("0000000000"))
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Testes do cliente de comandos locais (sem Qt)
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.append('..')
+import ipc_client
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@unittest.skipIf(sys.platform == "win32", "servidor de teste usa socket Unix")
+class TestIpcClient(unittest.TestCase):
+    """Testes do cliente contra um servidor falso"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir)
+
+    def tearDown(self):
+        path = ipc_client.socket_path(ipc_client.server_name(self.data_dir))
+        if os.path.exists(path):
+            os.unlink(path)
+        os.rmdir(self.temp_dir)
+
+    def test_server_name_per_data_dir(self):
+        """Cada diretório de dados tem o seu socket"""
+        self.assertEqual(ipc_client.server_name(self.data_dir),
+                         ipc_client.server_name(self.data_dir))
+        self.assertNotEqual(ipc_client.server_name(self.data_dir),
+                            ipc_client.server_name(self.data_dir / "outro"))
+
+    def test_not_running(self):
+        """Sem instância em execução"""
+        with self.assertRaises(ipc_client.InstanceNotRunning):
+            ipc_client.send_command({"command": "stats"}, self.data_dir)
+
+    def test_round_trip(self):
+        """Uma linha JSON de ida, uma de volta"""
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(ipc_client.socket_path(ipc_client.server_name(self.data_dir)))
+        server.listen(1)
+        received = []
+
+        def serve():
+            connection, _ = server.accept()
+            with connection, connection.makefile("rb") as stream:
+                received.append(json.loads(stream.readline()))
+                connection.sendall(b'{"ok": true}\n')
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        reply = ipc_client.send_command({"command": "search", "query": "olá"}, self.data_dir)
+        thread.join()
+        server.close()
+        self.assertEqual(reply, {"ok": True})
+        self.assertEqual(received, [{"command": "search", "query": "olá"}])
+
+    def test_copy_variables(self):
+        """--var vira o dicionário "values" do pedido de cópia"""
+        from unittest import mock
+        with mock.patch.object(ipc_client, "send_command", return_value={"ok": True}) as send, \
+                mock.patch("sys.stdout"):
+            ipc_client.main(["copy", "--id", "1a2b3c4d5e", "--var", "nome=Ana", "--var", "prazo=2 dias"])
+        self.assertEqual(send.call_args.args[0], {"command": "copy", "id": "1a2b3c4d5e",
+                                                  "values": {"nome": "Ana", "prazo": "2 dias"}})
+
+    def test_does_not_import_qt(self):
+        """O cliente não carrega PyQt5"""
+        code = "import sys, ipc_client; sys.exit('PyQt5' in sys.modules)"
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=ROOT), 0)
+
+    def test_does_not_import_core(self):
+        """O cliente não carrega fctbi_core, mas usa o mesmo diretório padrão"""
+        code = "import sys, ipc_client; sys.exit('fctbi_core' in sys.modules)"
+        self.assertEqual(subprocess.call([sys.executable, "-c", code], cwd=ROOT), 0)
+        from fctbi_core.config import DEFAULT_APP_DATA_DIR
+        self.assertEqual(ipc_client.DEFAULT_DATA_DIR, DEFAULT_APP_DATA_DIR)
+
+
+if __name__ == '__main__':
+    unittest.main()
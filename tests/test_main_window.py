@@ -0,0 +1,994 @@
+"""
+Testes da janela principal (executados com a plataforma Qt "offscreen")
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Importar o módulo a ser testado
+import sys
+sys.path.append('..')
+from PyQt5.QtCore import QEvent, QEventLoop, QObject, QPoint, Qt, QTimer
+from PyQt5.QtGui import QHelpEvent, QMouseEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+import main
+from main import CONFIG, RespostaRapidaApp
+
+app = QApplication.instance() or QApplication([])
+
+
+def wait_for_signal(signal, timeout_ms=5000):
+    """Roda o event loop até `signal` ser emitido (e tratado) ou o tempo acabar"""
+    loop = QEventLoop()
+    timeout = QTimer()
+    timeout.setSingleShot(True)
+    timeout.timeout.connect(loop.quit)
+    signal.connect(lambda *_: QTimer.singleShot(0, loop.quit))
+    timeout.start(timeout_ms)
+    loop.exec_()
+    # Timer parado: não acorda testes seguintes
+    timeout.stop()
+
+
+class MainWindowTestCase(unittest.TestCase):
+    """Cria a janela principal com os dados em um diretório temporário"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_config = dict(vars(CONFIG))
+        CONFIG.APP_DATA_DIR = Path(self.temp_dir)
+        CONFIG.__post_init__()
+        self.window = RespostaRapidaApp()
+        self.data_manager = self.window.data_manager
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        if self.window.tray_icon:
+            self.window.tray_icon.hide()
+        self.window.is_closing = True
+        self.window.hide()
+        if self.window.quick_launcher:
+            self.window.quick_launcher.hide()
+            self.window.quick_launcher.deleteLater()
+        self.window.floating_button.hide()
+        self.window.floating_button.deleteLater()
+        self.window.deleteLater()
+        app.processEvents()
+        vars(CONFIG).update(self.original_config)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def add_responses(self, section, count):
+        for i in range(count):
+            self.data_manager.add_response(section, f"{section}-{i}")
+
+
+class TestStagedStartup(MainWindowTestCase):
+    """Testes da inicialização em etapas"""
+
+    def test_background_load(self):
+        """A janela aparece antes das respostas, carregadas em uma thread"""
+        self.data_manager.add_response("Geral", "Salva")
+        window = RespostaRapidaApp(load_in_background=True)
+        self.assertIsNone(window.data_manager)
+        self.assertFalse(window.content_container.isEnabled())
+        wait_for_signal(window.data_loader.loaded)
+        self.assertIsNotNone(window.data_manager)
+        self.assertTrue(window.content_container.isEnabled())
+        self.assertEqual([r.response_data["texto"] for r in window.response_widgets], ["Salva"])
+        window.is_closing = True
+        window.deleteLater()
+
+    def test_tray_and_shortcuts_deferred(self):
+        """Bandeja e atalhos são criados depois da primeira volta do event loop"""
+        window = RespostaRapidaApp()
+        self.assertIsNone(window.tray_icon)
+        app.processEvents()
+        self.assertIsNotNone(window.tray_icon)
+        self.assertEqual([phase for phase, _ in window.trace.phases],
+                         ["managers", "shell", "data", "rows", "deferred"])
+        window.tray_icon.hide()
+        window.is_closing = True
+        window.deleteLater()
+
+
+class TestStartupTrace(unittest.TestCase):
+    """Testes da marcação das fases da inicialização"""
+
+    def test_interactive_after_paint_and_deferred(self):
+        """A fase "interactive" vem quando pintura e etapa adiada terminam"""
+        trace = main.StartupTrace()
+        emitted = []
+        trace.interactive.connect(lambda: emitted.append(True))
+        trace.mark("deferred")
+        self.assertEqual(emitted, [])
+        trace.mark("first_paint")
+        trace.mark("outra")
+        self.assertEqual(emitted, [True])
+        self.assertEqual([phase for phase, _ in trace.phases],
+                         ["deferred", "first_paint", "interactive", "outra"])
+
+    def test_trace_to_file(self):
+        """--startup-trace=ARQUIVO grava as fases no arquivo, não em stderr"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        path = os.path.join(temp_dir, "trace.txt")
+        args = main.parse_arguments(["fctbi", f"--startup-trace={path}"])
+        self.assertEqual(args.startup_trace, path)
+        self.assertEqual(main.parse_arguments(["fctbi", "--startup-trace"]).startup_trace, "-")
+        trace = main.StartupTrace(True, path=path)
+        with unittest.mock.patch("sys.stderr") as stderr:
+            trace.mark("imports")
+            trace.mark("first_paint")
+        stderr.write.assert_not_called()
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual([line.split()[1] for line in lines], ["imports", "first_paint"])
+
+
+class TestFloatingLaunch(MainWindowTestCase):
+    """Testes do modo de inicialização só com a bola flutuante"""
+
+    def wait_for_data(self, launcher):
+        wait_for_signal(launcher.data_loader.loaded)
+
+    def test_window_built_on_first_click(self):
+        """Nenhuma janela é montada até o primeiro clique na bola"""
+        self.data_manager.add_response("Geral", "Salva")
+        launcher = main.FloatingLauncher(self.window.config_manager)
+        launcher.show()
+        self.wait_for_data(launcher)
+        self.assertIsNone(launcher.window)
+        self.assertTrue(launcher.floating_button.isVisible())
+
+        launcher.floating_button.callback()
+        window = launcher.window
+        self.assertIsNotNone(window)
+        self.assertIs(window.floating_button, launcher.floating_button)
+        self.assertIs(window.data_manager, launcher.data_manager)
+        self.assertIs(window.config_manager, launcher.config_manager)
+        self.assertEqual(window.floating_button.callback, window.show_window)
+        self.assertEqual([r.response_data["texto"] for r in window.response_widgets], ["Salva"])
+        window.is_closing = True
+        window.hide()
+        launcher.floating_button.hide()
+        launcher.floating_button.deleteLater()
+        window.deleteLater()
+
+    def test_tray_before_window_and_separate_trace(self):
+        """A bandeja existe antes da janela; a janela a reaproveita e não marca fases"""
+        trace = main.StartupTrace()
+        launcher = main.FloatingLauncher(self.window.config_manager, trace)
+        launcher.show()
+        self.wait_for_data(launcher)
+        app.processEvents()
+        self.assertIsNone(launcher.window)
+        self.assertIs(launcher.tray_icon.contextMenu(), launcher.quick_menu)
+        phases = [phase for phase, _ in trace.phases]
+        launcher.show_window()
+        window = launcher.window
+        self.assertIs(window.tray_icon, launcher.tray_icon)
+        self.assertEqual([phase for phase, _ in trace.phases], phases)
+        self.assertIsNot(window.trace, trace)
+        window.is_closing = True
+        window.hide()
+        launcher.tray_icon.hide()
+        launcher.floating_button.hide()
+        launcher.floating_button.deleteLater()
+        window.deleteLater()
+
+    def test_click_before_data_waits(self):
+        """Clique antes do fim da leitura abre a janela quando os dados chegam"""
+        launcher = main.FloatingLauncher(self.window.config_manager)
+        launcher.show_window()
+        self.assertIsNone(launcher.window)
+        self.wait_for_data(launcher)
+        self.assertIsNotNone(launcher.window)
+        launcher.window.is_closing = True
+        launcher.window.hide()
+        launcher.floating_button.hide()
+        launcher.floating_button.deleteLater()
+        launcher.window.deleteLater()
+
+    def test_floating_flag(self):
+        """--floating é reconhecido na linha de comando"""
+        self.assertTrue(main.parse_arguments(["fctbi", "--floating"]).floating)
+        self.assertFalse(main.parse_arguments(["fctbi"]).floating)
+
+
+class TestSingleInstance(MainWindowTestCase):
+    """Testes da instância única e do repasse de argumentos"""
+
+    def test_forward_without_server(self):
+        """Sem instância em execução nada é repassado"""
+        self.assertFalse(main.forward_to_running_instance({"show": True}))
+
+    def test_forward_to_server(self):
+        """A segunda execução entrega a mensagem à instância em execução"""
+        server = main.SingleInstanceServer()
+        self.assertTrue(server.listen())
+        received = []
+        server.message_received.connect(received.append)
+        self.assertTrue(main.forward_to_running_instance({"show": True, "search": "olá"}))
+        wait_for_signal(server.message_received, 2000)
+        server.close()
+        self.assertEqual(received, [{"show": True, "search": "olá"}])
+
+    def test_second_server_keeps_first(self):
+        """Uma segunda instância não apaga o socket de uma que está atendendo"""
+        first = main.SingleInstanceServer()
+        self.assertTrue(first.listen())
+        second = main.SingleInstanceServer()
+        self.assertFalse(second.listen(timeout_ms=1000))
+        received = []
+        first.message_received.connect(received.append)
+        self.assertTrue(main.forward_to_running_instance({"show": True}))
+        wait_for_signal(first.message_received, 2000)
+        first.close()
+        second.close()
+        self.assertEqual(received, [{"show": True}])
+
+    def test_command_round_trip(self):
+        """O cliente sem Qt busca e copia pela instância em execução"""
+        import threading
+        import time
+        import ipc_client
+
+        self.add_responses("Geral", 3)
+        server = main.SingleInstanceServer()
+        server.command_handler = self.window.handle_command
+        self.assertTrue(server.listen())
+        replies = []
+
+        def client():
+            replies.append(ipc_client.send_command(
+                {"command": "search", "query": "geral-1"}, CONFIG.APP_DATA_DIR))
+            replies.append(ipc_client.send_command(
+                {"command": "copy", "id": replies[0]["results"][0]["id"]}, CONFIG.APP_DATA_DIR))
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while thread.is_alive() and time.monotonic() < deadline:
+            app.processEvents(QEventLoop.AllEvents, 10)
+        thread.join()
+        server.close()
+        self.assertEqual(replies[0]["results"],
+                         [{"id": main.response_id("Geral-1"), "section": "Geral", "texto": "Geral-1"}])
+        self.assertTrue(replies[1]["ok"])
+        self.assertEqual(QApplication.clipboard().text(), "Geral-1")
+        self.assertEqual(self.window.stats_manager.stats["response_usage"], {"Geral-1": 1})
+
+    def test_unknown_command(self):
+        """Comandos desconhecidos respondem com erro"""
+        reply = self.window.handle_command({"command": "formatar"})
+        self.assertFalse(reply["ok"])
+
+    def test_invalid_fields(self):
+        """Campos de tipo errado são recusados sem alterar a biblioteca"""
+        self.add_responses("Geral", 2)
+        before = self.data_manager.data["Geral"][:]
+        for request in ({"command": "add", "section": "Geral", "text": 5},
+                        {"command": "add", "section": ["Geral"], "text": "x"},
+                        {"command": "search", "query": None},
+                        {"command": "search", "query": "geral", "limit": 0},
+                        {"command": "search", "query": "geral", "limit": "3"},
+                        {"command": "copy", "id": 7},
+                        {"command": "copy", "query": "geral", "values": {"nome": 1}},
+                        {"command": "copy", "query": "geral", "values": ["nome"]}):
+            reply = self.window.handle_command(request)
+            self.assertFalse(reply["ok"], request)
+            self.assertIn("error", reply)
+        self.assertEqual(self.data_manager.data["Geral"], before)
+
+    def test_handler_exception_is_replied(self):
+        """Uma exceção no comando vira resposta de erro, não escapa do slot"""
+        server = main.SingleInstanceServer()
+        server.command_handler = unittest.mock.Mock(side_effect=AttributeError("quebrou"))
+        socket = unittest.mock.Mock()
+        server._reply(socket, {"command": "stats"})
+        reply = main.json.loads(socket.write.call_args[0][0])
+        self.assertEqual(reply, {"ok": False, "error": "AttributeError: quebrou"})
+
+    def test_message_from_arguments(self):
+        """--search e --import viram a mensagem repassada"""
+        args = main.parse_arguments(["fctbi", "--search", "prazo", "--import", "novas.txt"])
+        self.assertEqual(main.instance_message(args),
+                         {"show": True, "search": "prazo", "import": os.path.abspath("novas.txt")})
+
+    def test_handle_message(self):
+        """A janela importa, preenche a busca e aparece"""
+        path = os.path.join(self.temp_dir, "novas.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Importada\n")
+        self.window.handle_instance_message({"show": True, "search": "Import", "import": path})
+        self.assertTrue(self.window.isVisible())
+        self.assertEqual(self.window.search_input.text(), "Import")
+        self.assertEqual([r.response_data["texto"] for r in self.window.response_widgets],
+                         ["Importada"])
+
+    def test_message_before_data_is_queued(self):
+        """Mensagens recebidas durante a leitura são atendidas ao final"""
+        window = RespostaRapidaApp(load_in_background=True)
+        window.handle_instance_message({"search": "x"})
+        self.assertEqual(window.search_input.text(), "")
+        wait_for_signal(window.data_loader.loaded)
+        self.assertEqual(window.search_input.text(), "x")
+        window.is_closing = True
+        window.deleteLater()
+
+
+class TestIncrementalRows(MainWindowTestCase):
+    """Testes da atualização incremental das linhas de resposta"""
+
+    def test_arrow_move_reuses_rows(self):
+        """Mover com a seta reposiciona linhas existentes sem recriá-las"""
+        self.add_responses("Geral", 5)
+        rows = list(self.window.response_widgets)
+        self.window.move_response_down("Geral-1")
+        self.assertEqual(self.window.response_widgets,
+                         [rows[0], rows[2], rows[1], rows[3], rows[4]])
+
+    def test_edit_refreshes_row_in_place(self):
+        """Editar atualiza o texto da linha existente"""
+        self.add_responses("Geral", 2)
+        row = self.window.response_widgets[1]
+        self.data_manager.edit_response("Geral", "Geral-1", "Editada")
+        self.assertIs(self.window.response_widgets[1], row)
+        self.assertEqual(row.response_btn.text(), "Editada")
+
+    def test_filter_hides_rows(self):
+        """Busca esconde as linhas sem reconstruir a página"""
+        self.add_responses("Geral", 12)
+        rows = list(self.window.current_page.rows)
+        self.window.filter_responses("Geral-1")
+        self.assertEqual([r.response_data["texto"] for r in self.window.response_widgets],
+                         ["Geral-1", "Geral-10", "Geral-11"])
+        self.assertEqual(self.window.current_page.rows, rows)
+
+
+class TestSectionBar(MainWindowTestCase):
+    """Testes da barra de seções atualizada sem reconstrução"""
+
+    def button_texts(self):
+        return [button.text() for button in self.window.section_buttons]
+
+    def test_buttons_survive_changes(self):
+        """Inserir, renomear, mover e remover seções não recria os outros botões"""
+        self.data_manager.add_section("Vendas")
+        self.data_manager.add_section("Suporte")
+        geral, vendas, suporte = self.window.section_buttons
+        self.assertEqual(self.button_texts(), ["Geral", "Vendas", "Suporte"])
+
+        self.data_manager.rename_section("Vendas", "Comercial")
+        self.assertIs(self.window.section_buttons[1], vendas)
+        self.assertEqual(vendas.text(), "Comercial")
+
+        self.data_manager.move_section(2, 0)
+        self.assertEqual(self.window.section_buttons, [suporte, geral, vendas])
+        self.assertEqual(self.button_texts(), list(self.data_manager.data))
+
+        self.data_manager.remove_section("Geral")
+        self.assertEqual(self.window.section_buttons, [suporte, vendas])
+        self.assertEqual(self.window.current_section, "Suporte")
+        self.assertTrue(suporte.isChecked())
+        self.assertTrue(self.window.no_sections_label.isHidden())
+
+    def test_out_of_range_move_rebuilds(self):
+        """Índices fora da barra não quebram a janela: a barra é reconstruída"""
+        self.data_manager.add_section("Vendas")
+        self.window._move_section_button(0, 5)
+        self.assertEqual(self.button_texts(), ["Geral", "Vendas"])
+
+    def test_empty_state_label(self):
+        """Sem seções a barra mostra a mensagem de vazio"""
+        self.data_manager.data = {}
+        self.window.update_sections_ui()
+        self.assertEqual(self.window.section_buttons, [])
+        self.assertFalse(self.window.no_sections_label.isHidden())
+        self.data_manager.add_section("Nova")
+        self.assertTrue(self.window.no_sections_label.isHidden())
+
+
+class TestSelection(MainWindowTestCase):
+    """Testes do destaque de seleção"""
+
+    def test_selection_moves_highlight(self):
+        """Selecionar outra linha remove o destaque da anterior"""
+        self.add_responses("Geral", 3)
+        first, second = self.window.response_widgets[:2]
+        self.window.set_selected_response(first)
+        self.window.set_selected_response(second)
+        self.assertFalse(first.is_selected)
+        self.assertTrue(second.is_selected)
+        self.assertIsNone(second.property("selected"))
+
+
+class TestResponseMenuAndTooltip(MainWindowTestCase):
+    """Testes do menu de opções compartilhado e dos tooltips sob demanda"""
+
+    def test_menu_shared_between_rows(self):
+        """Um único QMenu atende todas as linhas e age sobre a linha clicada"""
+        self.add_responses("Geral", 3)
+        first, _, third = self.window.response_widgets
+        chosen = []
+        with unittest.mock.patch.object(main.QMenu, "exec_",
+                                        side_effect=lambda pos: chosen.pop(0)()):
+            chosen.append(lambda: self.window.response_pin_action)
+            self.window.show_response_menu(third, QPoint())
+            menu = self.window.response_menu
+            chosen.append(lambda: self.window.response_remove_action)
+            with unittest.mock.patch.object(main.QMessageBox, "question",
+                                            return_value=main.QMessageBox.Yes):
+                self.window.show_response_menu(first, QPoint())
+        self.assertIs(self.window.response_menu, menu)
+        self.assertTrue(self.window.is_pinned("Geral-2"))
+        self.assertFalse(self.window.is_pinned("Geral-0"))
+        self.assertEqual([r["texto"] for r in self.data_manager.data["Geral"]],
+                         ["Geral-1", "Geral-2"])
+
+    def test_tooltip_computed_on_demand(self):
+        """O tooltip só é montado quando o Qt pede (QEvent.ToolTip)"""
+        with unittest.mock.patch.object(main.EnhancedDraggableResponseWidget, "tooltip_text",
+                                        autospec=True, return_value="dica") as tooltip_text:
+            self.add_responses("Geral", 3)
+            app.processEvents()
+            self.assertEqual(tooltip_text.call_count, 0)
+            row = self.window.response_widgets[1]
+            event = QHelpEvent(QEvent.ToolTip, QPoint(1, 1), QPoint(1, 1))
+            with unittest.mock.patch.object(main.QToolTip, "showText") as show_text:
+                QApplication.sendEvent(row.response_btn, event)
+        tooltip_text.assert_called_once_with(row)
+        self.assertEqual(show_text.call_args[0][1], "dica")
+
+
+class TestDragDrop(MainWindowTestCase):
+    """Testes do cálculo de drop durante o drag"""
+
+    def test_drop_position_uses_midpoints(self):
+        """A posição de drop é a primeira linha cujo meio fica abaixo do cursor"""
+        self.add_responses("Geral", 5)
+        self.window.show()
+        app.processEvents()
+        rows = self.window.response_widgets
+        self.window.start_drag_operation()
+        self.assertEqual(self.window.calculate_drop_position(QPoint(5, rows[2].y())), 2)
+        self.assertEqual(self.window.calculate_drop_position(QPoint(5, rows[2].geometry().bottom())), 3)
+        self.assertEqual(self.window.calculate_drop_position(QPoint(5, 100000)), 5)
+        self.window.end_drag_operation()
+
+    def test_drag_move_processed_once_per_frame(self):
+        """Vários movimentos no mesmo quadro processam apenas a última posição"""
+        handled = []
+        self.window.start_drag_operation()
+        for y in range(10):
+            self.window._queue_drag_move(handled.append, QPoint(0, y))
+        self.window._flush_drag_move()
+        self.assertEqual(handled, [QPoint(0, 9)])
+        self.window.end_drag_operation()
+        self.assertFalse(self.window.drag_move_timer.isActive())
+
+
+class TimerEventCounter(QObject):
+    """Conta os eventos de timer entregues em toda a aplicação"""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Timer:
+            self.count += 1
+        return False
+
+
+class TestIdleWakeups(MainWindowTestCase):
+    """Testes de consumo ocioso como bola flutuante"""
+
+    def run_event_loop(self, msecs):
+        loop = QEventLoop()
+        QTimer.singleShot(msecs, loop.quit)
+        loop.exec_()
+
+    def test_no_periodic_wakeups_when_idle(self):
+        """Ociosa como bola flutuante, a aplicação não acorda por timers"""
+        self.window.show()
+        self.window.minimize_window()
+        self.run_event_loop(600)  # Animações de fade e exibição da bola
+        self.assertFalse(self.window.isVisible())
+        self.assertTrue(self.window.floating_button.isVisible())
+
+        counter = TimerEventCounter()
+        app.installEventFilter(counter)
+        self.run_event_loop(1000)
+        app.removeEventFilter(counter)
+        # O único evento esperado é o timer que encerra o próprio loop
+        wakeups_per_minute = max(0, counter.count - 1) * 60
+        self.assertEqual(wakeups_per_minute, 0)
+
+    def test_focus_lost_under_cursor_minimizes_on_leave(self):
+        """Foco perdido com o mouse sobre a janela minimiza quando o mouse sai"""
+        self.window.show()
+        inside = self.window.geometry().center()
+        with unittest.mock.patch.object(main.QCursor, "pos", return_value=inside), \
+                unittest.mock.patch.object(self.window, "isActiveWindow", return_value=False):
+            self.window._check_window_focus()
+            timer = self.window.focus_loss_timer
+            self.assertFalse(timer and timer.isActive())
+            self.assertTrue(self.window.focus_lost_under_cursor)
+        outside = self.window.geometry().bottomRight() + QPoint(50, 50)
+        with unittest.mock.patch.object(main.QCursor, "pos", return_value=outside), \
+                unittest.mock.patch.object(self.window, "isActiveWindow", return_value=False):
+            QApplication.sendEvent(self.window, QEvent(QEvent.Leave))
+        self.assertTrue(self.window.focus_loss_timer.isActive())
+        self.window.focus_loss_timer.stop()
+
+    def test_show_hides_floating_button(self):
+        """Mostrar a janela esconde a bola flutuante"""
+        self.window.floating_button.show()
+        self.window.show()
+        self.assertFalse(self.window.floating_button.isVisible())
+
+
+class TestFloatingButton(MainWindowTestCase):
+    """Testes do cache de imagens da bola flutuante"""
+
+    def test_pixmap_reused_between_paints(self):
+        """A imagem é desenhada uma vez por escala, tema e estado"""
+        button = self.window.floating_button
+        self.assertIs(button.current_pixmap(), button.current_pixmap())
+        button.hovered = True
+        self.assertIsNot(button.current_pixmap(), button._pixmap_cache[(button.devicePixelRatioF(), "light", False)])
+        self.assertEqual(len(button._pixmap_cache), 2)
+
+    def test_follows_theme(self):
+        """A bola acompanha o tema e mantém as imagens já desenhadas"""
+        button = self.window.floating_button
+        light = button.current_pixmap()
+        self.window.apply_theme("dark")
+        self.assertEqual(button.theme_name, "dark")
+        dark = button.current_pixmap()
+        self.assertEqual(dark.toImage().pixelColor(35, 20).name(), main.THEMES["dark"]["PRIMARY_COLOR"])
+        self.window.apply_theme("light")
+        self.assertIs(button.current_pixmap(), light)
+
+
+class TestCopyConfirmation(MainWindowTestCase):
+    """Testes do aviso de cópia (toast) e de minimizar após copiar"""
+
+    def setUp(self):
+        super().setUp()
+        self.window.animations_enabled = False
+        self.window.show()
+        app.processEvents()
+
+    def test_toast_is_not_modal(self):
+        """Copiar mostra um aviso sem abrir diálogo modal nem tirar o foco"""
+        self.window.copy_to_clipboard("Olá")
+        self.assertEqual(QApplication.clipboard().text(), "Olá")
+        self.assertIsNone(QApplication.activeModalWidget())
+        toast = self.window.toast
+        self.assertTrue(toast.isVisible())
+        self.assertTrue(toast.testAttribute(Qt.WA_ShowWithoutActivating))
+        self.assertTrue(self.window.geometry().contains(toast.geometry().center()))
+
+    def test_toast_hides_itself(self):
+        """O aviso some sozinho e é reaproveitado na próxima cópia"""
+        self.window.copy_to_clipboard("Olá")
+        toast = self.window.toast
+        wait_for_signal(toast.hide_timer.timeout, 3000)
+        self.assertFalse(toast.isVisible())
+        self.window.copy_to_clipboard("Olá de novo")
+        self.assertIs(self.window.toast, toast)
+        self.assertTrue(toast.isVisible())
+
+    def test_no_toast_when_disabled(self):
+        self.window.config_manager.set("show_copy_confirmation", False)
+        self.window.copy_to_clipboard("Olá")
+        self.assertIsNone(self.window.toast)
+
+    def test_minimize_after_copy(self):
+        """Com minimize_after_copy a janela volta para a bola e o aviso vai junto"""
+        self.window.config_manager.set("minimize_after_copy", True)
+        self.window.copy_to_clipboard("Olá")
+        self.assertFalse(self.window.isVisible())
+        toast = self.window.toast
+        self.assertTrue(toast.isVisible())
+        self.assertLessEqual(toast.geometry().bottom(), self.window.floating_button.geometry().top())
+        toast.hide()
+
+
+class TestQuickCopyMenu(MainWindowTestCase):
+    """Testes do menu de cópia rápida (bandeja e bola flutuante)"""
+
+    def setUp(self):
+        super().setUp()
+        self.data_manager.add_response("Geral", "Fixada")
+        self.data_manager.add_response("Geral", "Popular")
+        self.data_manager.add_response("Geral", "Rara")
+        self.window.stats_manager.stats["response_usage"].update(
+            {"Popular": 5, "Rara": 1, "Removida": 9})
+        self.window.toggle_pinned("Fixada")
+        self.menu = self.window.quick_menu
+
+    def entries(self):
+        return [action.data() for action in self.menu.actions()
+                if isinstance(action.data(), tuple)]
+
+    def test_pinned_then_most_used(self):
+        """Fixadas primeiro, depois as mais usadas que ainda existem"""
+        self.menu.refresh()
+        self.assertEqual(self.entries(), [("Geral", "Fixada"), ("Geral", "Popular"),
+                                          ("Geral", "Rara")])
+
+    def test_copy_without_showing_window(self):
+        self.window.hide()
+        self.menu.refresh()
+        popular = next(a for a in self.menu.actions() if a.data() == ("Geral", "Popular"))
+        popular.trigger()
+        self.assertEqual(QApplication.clipboard().text(), "Popular")
+        self.assertEqual(self.window.stats_manager.stats["response_usage"]["Popular"], 6)
+        self.assertFalse(self.window.isVisible())
+        self.window.toast.hide()
+
+    def test_rebuilt_only_when_changed(self):
+        """Cópias que não mudam o ranking reaproveitam as entradas do menu"""
+        self.menu.refresh()
+        actions = self.menu.actions()
+        self.window.stats_manager.record_copy("Popular", "Geral")
+        self.menu.refresh()
+        self.assertEqual(self.menu.actions(), actions)
+
+        for _ in range(6):  # Passa "Popular" (6 usos)
+            self.window.stats_manager.record_copy("Rara", "Geral")
+        self.menu.refresh()
+        self.assertNotEqual(self.menu.actions(), actions)
+        self.assertEqual(self.entries()[1], ("Geral", "Rara"))
+
+        self.data_manager.remove_response("Geral", "Rara")
+        self.menu.refresh()
+        self.assertNotIn(("Geral", "Rara"), self.entries())
+
+    def test_pin_follows_edit(self):
+        with unittest.mock.patch.object(main.QInputDialog, "getText", return_value=("Nova", True)):
+            self.window.edit_response("Fixada")
+        self.assertEqual(self.window.config_manager.get("pinned_responses"), ["Nova"])
+
+    def test_tray_and_button_use_menu(self):
+        self.window.setup_tray_icon()
+        self.assertIs(self.window.tray_icon.contextMenu(), self.menu)
+        button = self.window.floating_button
+        requested = []
+        button.menu_requested.connect(requested.append)
+        button.long_press_timer.setInterval(0)
+        button.mousePressEvent(QMouseEvent(QEvent.MouseButtonPress, QPoint(5, 5),
+                                           Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+        wait_for_signal(button.menu_requested, 1000)
+        self.assertEqual(len(requested), 1)
+        self.assertFalse(button._was_click)
+
+    def test_launcher_copies_before_window(self):
+        """No modo bola flutuante o menu copia sem montar a janela"""
+        launcher = main.FloatingLauncher(self.window.config_manager)
+        wait_for_signal(launcher.data_loader.loaded)
+        launcher.quick_menu.refresh()
+        self.assertIn(("Geral", "Fixada"), [a.data() for a in launcher.quick_menu.actions()])
+        launcher.quick_copy("Geral", "Fixada")
+        self.assertIsNone(launcher.window)
+        self.assertEqual(QApplication.clipboard().text(), "Fixada")
+        launcher.toast.hide()
+        launcher.floating_button.deleteLater()
+
+
+class TestQuickLauncher(MainWindowTestCase):
+    """Testes da paleta de busca rápida"""
+
+    def setUp(self):
+        super().setUp()
+        self.data_manager.add_response("Geral", "Bom dia!")
+        self.data_manager.add_section("Vendas")
+        self.data_manager.add_response("Vendas", "Olá, qual produto?")
+        self.data_manager.add_response("Vendas", "Obrigado pela compra")
+        self.launcher = self.window.ensure_quick_launcher()
+
+    def type_key(self, key):
+        QTest.keyClick(self.launcher.search_input, key)
+
+    def test_prebuilt_hidden(self):
+        """Montada (janela nativa e índice) sem aparecer"""
+        self.assertFalse(self.launcher.isVisible())
+        self.assertIsNotNone(self.launcher.windowHandle())
+        self.assertFalse(self.launcher.testAttribute(Qt.WA_DontShowOnScreen))
+        self.assertIs(self.window.ensure_quick_launcher(), self.launcher)
+
+    def test_search_navigate_and_copy(self):
+        """Busca em todas as seções, setas escolhem e Enter copia sem abrir a janela"""
+        self.window.open_quick_launcher()
+        self.assertTrue(self.launcher.isVisible())
+        self.assertEqual(self.launcher.results.count(), 3)
+        QTest.keyClicks(self.launcher.search_input, "o")
+        self.assertEqual(self.launcher.results.count(), 3)
+        self.type_key(Qt.Key_Down)
+        self.assertEqual(self.launcher.results.currentRow(), 1)
+        QTest.keyClicks(self.launcher.search_input, "bri")
+        self.assertEqual(self.launcher.results.count(), 1)
+        self.type_key(Qt.Key_Return)
+        self.assertFalse(self.launcher.isVisible())
+        self.assertFalse(self.window.isVisible())
+        self.assertEqual(QApplication.clipboard().text(), "Obrigado pela compra")
+        self.assertEqual(self.window.stats_manager.stats["section_usage"], {"Vendas": 1})
+        self.window.toast.hide()
+
+    def test_reopens_empty_with_current_data(self):
+        self.window.open_quick_launcher()
+        QTest.keyClicks(self.launcher.search_input, "bom")
+        self.type_key(Qt.Key_Escape)
+        self.assertFalse(self.launcher.isVisible())
+        self.data_manager.add_response("Geral", "Boa tarde!")
+        self.window.open_quick_launcher()
+        self.assertEqual(self.launcher.search_input.text(), "")
+        self.assertEqual(self.launcher.results.count(), 4)
+        self.launcher.hide()
+
+    def test_tray_double_click_skips_palette(self):
+        """Clique simples abre a paleta após o intervalo; o duplo só abre a janela"""
+        if self.window.tray_icon is None:
+            self.window.setup_tray_icon()
+        self.window.animations_enabled = False
+        tray_icon = self.window.tray_icon
+        tray_icon.on_activated(main.QSystemTrayIcon.Trigger)
+        tray_icon.on_activated(main.QSystemTrayIcon.DoubleClick)
+        self.assertFalse(tray_icon.click_timer.isActive())
+        self.assertFalse(self.launcher.isVisible())
+        self.assertTrue(self.window.isVisible())
+        self.window.hide()
+
+        tray_icon.on_activated(main.QSystemTrayIcon.Trigger)
+        self.assertFalse(self.launcher.isVisible())
+        wait_for_signal(tray_icon.click_timer.timeout, 2000)
+        self.assertTrue(self.launcher.isVisible())
+        self.launcher.hide()
+
+    def test_opened_from_menu(self):
+        self.window.quick_menu.search_requested.emit()
+        self.assertTrue(self.launcher.isVisible())
+        self.launcher.hide()
+
+
+class TestTemplateCopy(MainWindowTestCase):
+    """Testes da cópia de respostas com modelo"""
+
+    def add_template(self, text):
+        self.data_manager.add_response("Geral", text)
+        self.data_manager.set_template("Geral", text, True)
+
+    def test_prompts_for_variables(self):
+        """Variáveis sem valor são perguntadas; o último valor é sugerido"""
+        self.window.config_manager.set("show_copy_confirmation", False)
+        self.add_template("Olá {nome}!")
+        self.add_template("Tchau {nome}")
+        with unittest.mock.patch.object(main.QInputDialog, "getText",
+                                        return_value=("Ana", True)) as get_text:
+            self.window.copy_to_clipboard("Olá {nome}!")
+            self.window.copy_to_clipboard("Tchau {nome}")
+        self.assertEqual(QApplication.clipboard().text(), "Tchau Ana")
+        self.assertEqual(get_text.call_args.kwargs["text"], "Ana")
+        self.assertEqual(self.window.stats_manager.stats["response_usage"],
+                         {"Olá {nome}!": 1, "Tchau {nome}": 1})
+
+    def test_cancel_aborts_copy(self):
+        self.add_template("Olá {nome}!")
+        QApplication.clipboard().setText("antes")
+        with unittest.mock.patch.object(main.QInputDialog, "getText", return_value=("", False)):
+            self.window.copy_to_clipboard("Olá {nome}!")
+        self.assertEqual(QApplication.clipboard().text(), "antes")
+        self.assertEqual(self.window.stats_manager.stats["total_copies"], 0)
+
+    def test_command_copy_needs_values(self):
+        """Pelo servidor de comandos as variáveis vêm no pedido"""
+        self.add_template("Olá {nome}, {clipboard}")
+        QApplication.clipboard().setText("pedido 42")
+        item_id = main.response_id("Olá {nome}, {clipboard}")
+        reply = self.window.handle_command({"command": "copy", "id": item_id})
+        self.assertEqual(reply, {"ok": False, "error": "variáveis sem valor: nome"})
+        reply = self.window.handle_command({"command": "copy", "id": item_id,
+                                            "values": {"nome": "Ana"}})
+        self.assertTrue(reply["ok"])
+        self.assertEqual(QApplication.clipboard().text(), "Olá Ana, pedido 42")
+
+    def test_html_values_escaped(self):
+        """Valores digitados não quebram nem injetam marcação em respostas HTML"""
+        self.window.config_manager.set("show_copy_confirmation", False)
+        self.add_template("<p>Cliente: {nome}</p>")
+        self.data_manager.set_response_format("Geral", "<p>Cliente: {nome}</p>", main.FORMAT_HTML)
+        with unittest.mock.patch.object(main.QInputDialog, "getText",
+                                        return_value=("A&B <Ltda>", True)):
+            self.window.copy_to_clipboard("<p>Cliente: {nome}</p>", "Geral")
+        mime = QApplication.clipboard().mimeData()
+        self.assertEqual(mime.text(), "Cliente: A&B <Ltda>")
+        self.assertIn("A&amp;B &lt;Ltda&gt;", mime.html())
+
+    def test_existing_braces_copied_verbatim(self):
+        """Respostas anteriores aos modelos (sem a marca) não mudam nem perguntam nada"""
+        self.window.config_manager.set("show_copy_confirmation", False)
+        text = "Protocolo {protocolo}, item {0}, json {{a}}"
+        self.data_manager.add_response("Geral", text)
+        with unittest.mock.patch.object(main.QInputDialog, "getText") as get_text:
+            self.window.copy_to_clipboard(text)
+        get_text.assert_not_called()
+        self.assertEqual(QApplication.clipboard().text(), text)
+        QApplication.clipboard().setText("")
+        reply = self.window.handle_command({"command": "copy", "id": main.response_id(text)})
+        self.assertTrue(reply["ok"])
+        self.assertEqual(QApplication.clipboard().text(), text)
+
+
+class TestRichCopy(MainWindowTestCase):
+    """Testes da cópia de respostas em Markdown/HTML (LazyMimeData)"""
+
+    def setUp(self):
+        super().setUp()
+        self.window.config_manager.set("show_copy_confirmation", False)
+
+    def test_plain_stays_text(self):
+        self.data_manager.add_response("Geral", "**simples**")
+        self.window.copy_to_clipboard("**simples**")
+        mime = QApplication.clipboard().mimeData()
+        self.assertNotIsInstance(mime, main.LazyMimeData)
+        self.assertEqual(mime.text(), "**simples**")
+
+    def test_formats_rendered_on_demand(self):
+        """Nada é convertido ao copiar; cada formato só quando pedido"""
+        self.data_manager.add_response("Geral", "Olá **{nome}**")
+        self.data_manager.set_template("Geral", "Olá **{nome}**", True)
+        self.data_manager.set_response_format("Geral", "Olá **{nome}**", "markdown")
+        with unittest.mock.patch.object(main.QInputDialog, "getText", return_value=("Ana", True)):
+            self.window.copy_to_clipboard("Olá **{nome}**")
+        mime = QApplication.clipboard().mimeData()
+        self.assertIsInstance(mime, main.LazyMimeData)
+        self.assertEqual(set(mime.rendered), {"text/markdown"})
+        self.assertIsNone(mime._document)
+        self.assertEqual(mime.text(), "Olá Ana")
+        self.assertIn("<span style=\" font-weight:600;\">Ana</span>", mime.html())
+        self.assertEqual(bytes(mime.data("text/markdown")).decode("utf-8"), "Olá **Ana**")
+        self.assertEqual(set(mime.rendered), {"text/markdown", "text/plain", "text/html"})
+
+    def test_html_response(self):
+        self.data_manager.add_response("Geral", "<p>Prazo: <b>5 dias</b></p>")
+        self.data_manager.set_response_format("Geral", "<p>Prazo: <b>5 dias</b></p>", "html")
+        reply = self.window.handle_command(
+            {"command": "copy", "id": main.response_id("<p>Prazo: <b>5 dias</b></p>")})
+        self.assertTrue(reply["ok"])
+        mime = QApplication.clipboard().mimeData()
+        self.assertEqual(mime.html(), "<p>Prazo: <b>5 dias</b></p>")
+        self.assertEqual(mime.text(), "Prazo: 5 dias")
+
+
+class TestRenderingMode(MainWindowTestCase):
+    """Testes do modo de renderização opaco"""
+
+    def test_opaque_mode_uses_mask(self):
+        """O modo opaco desliga a translucidez e recorta os cantos"""
+        self.window.apply_rendering_mode("opaque")
+        self.assertFalse(self.window.testAttribute(Qt.WA_TranslucentBackground))
+        self.assertFalse(self.window.mask().isEmpty())
+        self.assertFalse(self.window.mask().contains(QPoint(0, 0)))
+        self.window.apply_rendering_mode("translucent")
+        self.assertTrue(self.window.testAttribute(Qt.WA_TranslucentBackground))
+        self.assertTrue(self.window.mask().isEmpty())
+
+    def test_fade_without_animations(self):
+        """Sem animações o fade esconde a janela imediatamente"""
+        self.window.animations_enabled = False
+        self.window.show()
+        self.window.fade_out()
+        self.assertFalse(self.window.isVisible())
+        self.assertFalse(self.window.fade_animation.state() == self.window.fade_animation.Running)
+
+
+class TestLongResponses(MainWindowTestCase):
+    """Testes da prévia de respostas longas"""
+
+    LONG_TEXT = "\n".join(f"Parágrafo {i} " + "texto " * 80 for i in range(6))
+
+    def test_preview_height_limited(self):
+        """A linha mostra no máximo RESPONSE_PREVIEW_LINES parágrafos elididos"""
+        self.data_manager.add_response("Geral", "curta")
+        self.data_manager.add_response("Geral", self.LONG_TEXT)
+        short, long = [row.response_btn for row in self.window.response_widgets]
+        self.assertEqual(long.text(), self.LONG_TEXT)
+        self.assertLess(long.sizeHint().height(), short.sizeHint().height() * 2)
+        self.assertLess(long.minimumSizeHint().width(), CONFIG.MIN_WINDOW_WIDTH)
+        lines, truncated = main.response_preview(long.text(), 200, long.font())
+        self.assertEqual(len(lines), CONFIG.RESPONSE_PREVIEW_LINES)
+        self.assertTrue(truncated)
+        self.assertIs(main.response_preview(long.text(), 200, long.font())[0], lines)
+
+    def test_expand_on_demand(self):
+        """Expandir mostra o texto completo, com altura pela largura"""
+        self.data_manager.add_response("Geral", self.LONG_TEXT)
+        button = self.window.response_widgets[0].response_btn
+        collapsed = button.heightForWidth(300)
+        button.set_expanded(True)
+        self.assertTrue(button.hasHeightForWidth())
+        self.assertGreater(button.heightForWidth(300), collapsed * 3)
+        self.assertGreater(button.heightForWidth(200), button.heightForWidth(400))
+
+
+class TestThemeSwitch(MainWindowTestCase):
+    """Testes da troca de tema"""
+
+    def test_switch_keeps_widgets(self):
+        """Trocar o tema não recria as linhas"""
+        self.add_responses("Geral", 3)
+        rows = list(self.window.response_widgets)
+        self.window.apply_theme("dark")
+        self.assertEqual(self.window.current_theme_name, "dark")
+        self.assertEqual(self.window.styleSheet(), main.get_theme_stylesheet("dark"))
+        self.assertEqual(self.window.response_widgets, rows)
+
+    def test_reloaded_user_theme_reapplied(self):
+        """O tema atual editado em disco é reaplicado com as novas cores"""
+        themes_dir = Path(CONFIG.THEMES_DIR)
+        themes_dir.mkdir(parents=True, exist_ok=True)
+        path = themes_dir / "oceano.json"
+        path.write_text('{"PRIMARY_COLOR": "#0077b6"}', encoding="utf-8")
+        os.utime(path, (1000, 1000))
+        main.load_user_themes(CONFIG.THEMES_DIR)
+        self.window.apply_theme("oceano")
+        path.write_text('{"PRIMARY_COLOR": "#023e8a"}', encoding="utf-8")
+        os.utime(path, (2000, 2000))
+        main.load_user_themes(CONFIG.THEMES_DIR)
+        try:
+            self.window.apply_theme("oceano")
+            self.assertIn("#023e8a", self.window.styleSheet())
+            self.assertIs(self.window.floating_button.theme, main.THEMES["oceano"])
+        finally:
+            del main.THEMES["oceano"]
+            main._USER_THEME_MTIMES.pop("oceano", None)
+
+
+class TestSectionPageCache(MainWindowTestCase):
+    """Testes do cache de páginas de seção"""
+
+    def test_switching_back_reuses_page(self):
+        """Voltar para uma seção recente reutiliza a página montada"""
+        self.data_manager.add_section("Outra")
+        page = self.window.current_page
+        self.window.select_section_by_index(1)
+        self.window.select_section_by_index(0)
+        self.assertIs(self.window.current_page, page)
+
+    def test_cached_page_follows_changes(self):
+        """Páginas em cache recebem as alterações de suas seções"""
+        self.data_manager.add_section("Outra")
+        page = self.window.current_page
+        self.window.select_section("Outra")
+        self.data_manager.add_response("Geral", "Nova")
+        self.window.select_section("Geral")
+        self.assertIs(self.window.current_page, page)
+        self.assertEqual([r.response_data["texto"] for r in page.rows], ["Nova"])
+
+    def test_cache_bounded_by_rows(self):
+        """Páginas menos usadas saem do cache ao exceder o limite de linhas"""
+        CONFIG.PAGE_CACHE_MAX_ROWS = 10
+        for section in ("A", "B", "C"):
+            self.data_manager.add_section(section)
+            self.add_responses(section, 4)
+        for section in ("A", "B", "C"):
+            self.window.select_section(section)
+        self.assertNotIn("A", self.window.page_cache)
+        self.assertEqual(list(self.window.page_cache)[-2:], ["B", "C"])
+        self.assertEqual(self.window.pages_stack.count(), len(self.window.page_cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Testes do motor de partículas do efeito especial
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Importar o módulo a ser testado
+import sys
+sys.path.append('..')
+from PyQt5.QtWidgets import QApplication
+
+import special_effects
+from special_effects import ParticleSystem, SpecialEffectWindow, heart_sprite
+
+app = QApplication.instance() or QApplication([])
+
+
+class TestParticleSystem(unittest.TestCase):
+    """Testes para o ParticleSystem"""
+
+    def check_step(self, use_numpy):
+        particles = ParticleSystem(50, 200, 100, use_numpy)
+        for _ in range(300):
+            particles.step()
+        self.assertEqual(len(particles), 50)
+        for x, y, size in zip(particles.x, particles.y, particles.size):
+            self.assertLessEqual(y, 100)
+            self.assertGreaterEqual(x, -size)
+            self.assertLessEqual(x, 200)
+
+    def test_step_python(self):
+        """Testa o passo em Python puro mantendo as partículas na tela"""
+        self.check_step(False)
+
+    @unittest.skipIf(special_effects.np is None, "NumPy não instalado")
+    def test_step_numpy(self):
+        """Testa o passo vetorizado mantendo as partículas na tela"""
+        self.check_step(True)
+
+    def test_sprite_cached(self):
+        """Testa que o sprite do coração é renderizado uma única vez"""
+        self.assertIs(heart_sprite(3, 20), heart_sprite(3, 20))
+
+
+class TestSpecialEffectWindow(unittest.TestCase):
+    """Testes para a janela do efeito"""
+
+    def test_timer_paused_when_hidden(self):
+        """Testa que a animação só roda com a janela visível"""
+        window = SpecialEffectWindow()
+        self.assertFalse(window.timer.isActive())
+        window.show()
+        self.assertTrue(window.timer.isActive())
+        window.hide()
+        self.assertFalse(window.timer.isActive())
+        window.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Testes dos modelos nas respostas (fctbi_core.templates)
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.append('..')
+from fctbi_core import DataManager, TemplateError, compile_template, escape_html, response_id
+
+NOW = datetime(2024, 3, 5, 14, 7)
+
+
+class TestCompile(unittest.TestCase):
+    """Compilação dos textos em partes"""
+
+    def test_plain_text_is_static(self):
+        template = compile_template("Bom dia!")
+        self.assertTrue(template.is_static)
+        self.assertEqual(template.parts, ("Bom dia!",))
+
+    def test_markers_and_escapes(self):
+        template = compile_template("Olá {nome}, {{ok}} {x:y} {incluir:abc}")
+        self.assertEqual(template.parts,
+                         ("Olá ", ("var", "nome"), ", {ok} {x:y} ", ("include", "abc")))
+        self.assertEqual(template.variables, {"nome"})
+        self.assertEqual(template.includes, ("abc",))
+        self.assertFalse(compile_template("chaves {{}}").is_static)
+
+    def test_unbalanced_braces_are_text(self):
+        self.assertTrue(compile_template('json {"a": 1}').is_static)
+
+
+class TestTemplateEngine(unittest.TestCase):
+    """Cache, expansão e inclusões"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.data_manager = DataManager(str(self.temp_dir / "respostas.json"))
+        self.data_manager.add_response("Geral", "Atenciosamente, {atendente}")
+        self.signature = "{incluir:%s}" % response_id("Atenciosamente, {atendente}")
+        self.data_manager.add_response("Geral", "Olá {nome}! Hoje é {data} às {hora}. " + self.signature)
+        for response in self.data_manager.data["Geral"]:
+            self.data_manager.set_template("Geral", response["texto"], True)
+        self.engine = self.data_manager.templates
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_compiled_once(self):
+        self.assertIs(self.engine.get("Olá {nome}"), self.engine.get("Olá {nome}"))
+        self.assertIs(self.data_manager.templates, self.engine)
+
+    def test_render_with_include(self):
+        text = self.data_manager.data["Geral"][1]["texto"]
+        self.assertEqual(self.engine.missing_variables(text, {"nome": "Ana"}), ["atendente"])
+        self.assertEqual(self.engine.render(text, {"nome": "Ana", "atendente": "Rui"}, NOW),
+                         "Olá Ana! Hoje é 05/03/2024 às 14:07. Atenciosamente, Rui")
+        # Sem valor: o marcador fica no texto
+        self.assertEqual(self.engine.render("Oi {nome}", now=NOW), "Oi {nome}")
+        self.assertEqual(self.engine.render("Colado: {clipboard}", {"clipboard": "X"}), "Colado: X")
+
+    def test_escape_values(self):
+        """Em HTML os valores são escapados; a marcação do modelo não"""
+        self.assertEqual(self.engine.render("<b>{nome}</b> {clipboard}",
+                                            {"nome": "A&B <Ltda>", "clipboard": '"x"'},
+                                            escape=escape_html),
+                         "<b>A&amp;B &lt;Ltda&gt;</b> &quot;x&quot;")
+
+    def test_missing_include(self):
+        with self.assertRaises(TemplateError):
+            self.engine.render("{incluir:0000000000}")
+
+    def test_cycle_detected(self):
+        """Inclusões circulares viram erro em vez de recursão infinita"""
+        with mock.patch("fctbi_core.templates.response_id", lambda text: text.split()[0]):
+            for text in ("a {incluir:b}", "b {incluir:a}"):
+                self.data_manager.add_response("Geral", text)
+                self.data_manager.set_template("Geral", text, True)
+            with self.assertRaisesRegex(TemplateError, "a → b → a"):
+                self.engine.render("a {incluir:b}")
+            with self.assertRaises(TemplateError):
+                self.engine.variables("b {incluir:a}")
+
+    def test_edit_invalidates(self):
+        """Textos editados saem do cache e as inclusões acompanham a edição"""
+        old_text = "Atenciosamente, {atendente}"
+        old_template = self.engine.get(old_text)
+        new_text = "Abraços, {atendente}"
+        self.data_manager.edit_response("Geral", old_text, new_text)
+        self.assertEqual(self.engine.retarget_includes(old_text, new_text), 1)
+        self.assertIsNot(self.engine.get(new_text), old_template)
+        self.assertNotIn(old_text, self.engine._templates)
+        including = self.data_manager.data["Geral"][1]["texto"]
+        self.assertTrue(including.endswith("{incluir:%s}" % response_id(new_text)))
+        self.assertTrue(self.engine.render(including, {"atendente": "Rui"}).endswith("Abraços, Rui"))
+
+
+    def test_plain_response_included_literally(self):
+        """Uma resposta sem a marca de modelo entra como está, chaves e tudo"""
+        legacy = "Código {0} e {{x}}"
+        self.data_manager.add_response("Geral", legacy)
+        self.assertFalse(self.data_manager.is_template("Geral", legacy))
+        including = "Veja: {incluir:%s}" % response_id(legacy)
+        self.assertEqual(self.engine.render(including), "Veja: " + legacy)
+        self.assertEqual(self.engine.variables(including), set())
+        # Só modelos são reescritos quando a resposta incluída é editada
+        self.data_manager.add_response("Geral", including)
+        self.data_manager.edit_response("Geral", legacy, "Código {1}")
+        self.assertEqual(self.engine.retarget_includes(legacy, "Código {1}"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
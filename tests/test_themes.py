@@ -0,0 +1,71 @@
+"""
+Testes do cache de temas e dos temas do usuário
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+# Importar o módulo a ser testado
+import sys
+sys.path.append('..')
+from main import THEMES, get_theme_palette, get_theme_stylesheet, load_user_themes
+
+
+class TestThemeCache(unittest.TestCase):
+    """Testes para a compilação e o cache das folhas de estilo"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.themes_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.themes_dir, ignore_errors=True)
+        for name in [name for name in THEMES if name not in ("light", "dark")]:
+            del THEMES[name]
+
+    def write_theme(self, name, colors, mtime=None):
+        path = os.path.join(self.themes_dir, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(colors, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_stylesheet_compiled_once(self):
+        """Testa que a QSS do tema é reutilizada"""
+        self.assertIs(get_theme_stylesheet("dark"), get_theme_stylesheet("dark"))
+        self.assertIn(THEMES["dark"]["PRIMARY_COLOR"], get_theme_stylesheet("dark"))
+
+    def test_palette_cached(self):
+        """Testa que a paleta do tema é reutilizada"""
+        self.assertIs(get_theme_palette("light"), get_theme_palette("light"))
+
+    def test_user_theme_merged_with_defaults(self):
+        """Testa tema do usuário sobre as cores do tema claro"""
+        self.write_theme("oceano", {"PRIMARY_COLOR": "#0077b6"})
+        self.assertEqual(load_user_themes(self.themes_dir), ["oceano"])
+        self.assertEqual(THEMES["oceano"]["PRIMARY_COLOR"], "#0077b6")
+        self.assertEqual(THEMES["oceano"]["BACKGROUND"], THEMES["light"]["BACKGROUND"])
+        self.assertIn("#0077b6", get_theme_stylesheet("oceano"))
+
+    def test_user_theme_change_invalidates_cache(self):
+        """Testa que alterar o arquivo do tema recompila a QSS"""
+        self.write_theme("oceano", {"PRIMARY_COLOR": "#0077b6"}, mtime=1000)
+        load_user_themes(self.themes_dir)
+        get_theme_stylesheet("oceano")
+        self.write_theme("oceano", {"PRIMARY_COLOR": "#023e8a"}, mtime=2000)
+        load_user_themes(self.themes_dir)
+        self.assertIn("#023e8a", get_theme_stylesheet("oceano"))
+
+    def test_builtin_theme_not_overridden(self):
+        """Testa que arquivos não substituem os temas embutidos"""
+        self.write_theme("dark", {"PRIMARY_COLOR": "#000000"})
+        self.assertEqual(load_user_themes(self.themes_dir), [])
+        self.assertNotEqual(THEMES["dark"]["PRIMARY_COLOR"], "#000000")
+
+
+if __name__ == '__main__':
+    unittest.main()